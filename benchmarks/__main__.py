@@ -0,0 +1,276 @@
+"""Benchmarks of the Genius Lyrics lookup pipeline.
+
+Run from the repository root, with Home Assistant and the integration's
+requirements installed:
+
+    python -m benchmarks --output results.json
+
+Results are written as JSON so runs of different releases can be compared,
+see `compare`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+import lyricsgenius
+from lyricsgenius.types import Song
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.genius_lyrics.cache import (
+    LyricsCache,
+    MissCache,
+    ResolutionIndex,
+)
+from custom_components.genius_lyrics.client import GeniusClient
+from custom_components.genius_lyrics.fetcher import LyricsFetcher
+from custom_components.genius_lyrics.genius import GeniusPatched
+from custom_components.genius_lyrics.helpers import (
+    clean_song_title,
+    cleanup_lyrics,
+    normalize_query,
+)
+from custom_components.genius_lyrics.metrics import LyricsMetrics
+
+from .fake_genius import (
+    FakeGenius,
+    load_songs,
+    load_titles,
+    lyrics_page,
+    search_response,
+    song_json,
+)
+
+FORMAT_VERSION = 1
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Return statistics of per-operation durations, in seconds."""
+    samples = sorted(samples)
+    total = sum(samples)
+    return {
+        "runs": len(samples),
+        "mean_us": total / len(samples) * 1e6,
+        "median_us": statistics.median(samples) * 1e6,
+        "p95_us": samples[min(int(len(samples) * 0.95), len(samples) - 1)] * 1e6,
+        "min_us": samples[0] * 1e6,
+        "ops_per_s": len(samples) / total if total else 0.0,
+    }
+
+
+def _bench(func: Callable[[], Any], rounds: int) -> dict[str, float]:
+    """Time a function, once per round."""
+    func()  # warm up
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return _summary(samples)
+
+
+def check_golden_titles() -> None:
+    """Fail fast when title cleaning drifts from the recorded corpus."""
+    for raw, expected in load_titles():
+        if (cleaned := clean_song_title.__wrapped__(raw)) != expected:
+            sys.exit(f"clean_song_title({raw!r}) = {cleaned!r}, expected {expected!r}")
+
+
+def bench_normalization(rounds: int) -> dict[str, dict[str, float]]:
+    """Benchmark title and lyrics normalization."""
+    titles = [raw for raw, _ in load_titles()]
+    genius = GeniusPatched("public", verbose=False, skip_non_songs=True)
+    songs = [
+        Song(genius, song_json(song, ""), genius.parse_lyrics(lyrics_page(song)))
+        for song in load_songs()
+    ]
+
+    def uncached_titles() -> None:
+        for title in titles:
+            clean_song_title.__wrapped__(title)
+
+    def cached_titles() -> None:
+        for title in titles:
+            clean_song_title(title)
+
+    def lyrics() -> None:
+        for song in songs:
+            cleanup_lyrics(song)
+
+    return {
+        # per corpus pass
+        "clean_song_title": _bench(uncached_titles, rounds),
+        "clean_song_title_cached": _bench(cached_titles, rounds),
+        "cleanup_lyrics": _bench(lyrics, rounds),
+    }
+
+
+def bench_matching(rounds: int) -> dict[str, dict[str, float]]:
+    """Benchmark picking the song out of search responses."""
+    genius = GeniusPatched("public", verbose=False, skip_non_songs=True)
+    songs = load_songs()
+    queries = [
+        (
+            clean_song_title(song["player_title"]),
+            song["artist"],
+            search_response(
+                songs, f"{clean_song_title(song['player_title'])} {song['artist']}", ""
+            ),
+        )
+        for song in songs
+    ]
+
+    def match() -> None:
+        for title, artist, response in queries:
+            genius._get_item_from_search_response(
+                response, title, type_="song", result_type="title", artist=artist
+            )
+
+    return {"get_item_from_search_response": _bench(match, rounds)}
+
+
+async def _async_timed(
+    calls: list[Callable[[], Awaitable[Any]]], concurrency: int
+) -> tuple[list[float], float]:
+    """Run calls with bounded concurrency, return latencies and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(call) for call in calls))
+    return samples, time.perf_counter() - start
+
+
+async def async_bench_fetch(
+    rounds: int, concurrency: int, latency: float
+) -> dict[str, dict[str, float]]:
+    """Benchmark full lookups against the fake Genius server, caches disabled."""
+    server = FakeGenius(latency)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            # pace nothing, this measures the pipeline, not the rate limit
+            metrics = LyricsMetrics()
+            client = GeniusClient(
+                hass,
+                rate=1e6,
+                burst=1_000_000,
+                api_root=server.api_root,
+                metrics=metrics,
+            )
+            fetcher = LyricsFetcher(
+                hass,
+                None,
+                client,
+                LyricsCache(hass, 0, 0),
+                MissCache(hass, 0),
+                ResolutionIndex(hass, 0),
+                metrics,
+            )
+            songs = load_songs()
+            calls = [
+                lambda song=song: fetcher._async_resolve(
+                    normalize_query(song["artist"], song["player_title"]),
+                    song["artist"],
+                    song["player_title"],
+                )
+                for _ in range(rounds)
+                for song in songs
+            ]
+
+            await _async_timed(calls[: len(songs)], 1)  # warm up
+            server.requests = 0
+            sequential, _ = await _async_timed(calls, 1)
+            requests = server.requests / len(calls)
+            concurrent, wall = await _async_timed(calls, concurrency)
+        finally:
+            await hass.async_stop(force=True)
+
+    await server.stop()
+
+    return {
+        "fetch_lyrics": dict(_summary(sequential), requests_per_lookup=requests),
+        "fetch_lyrics_concurrent": dict(
+            _summary(concurrent),
+            concurrency=concurrency,
+            ops_per_s=len(calls) / wall,
+        ),
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> None:
+    """Print the change of mean durations between two runs, to stderr."""
+    for name, result in current["benchmarks"].items():
+        if (base := baseline["benchmarks"].get(name)) is None:
+            continue
+        change = (result["mean_us"] - base["mean_us"]) / base["mean_us"] * 100
+        print(
+            f"{name:32} {base['mean_us']:12.1f}us {result['mean_us']:12.1f}us"
+            f" {change:+7.1f}%",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    """Run the benchmarks and print or write the results."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--fetch-rounds", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="fake server latency in seconds"
+    )
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare to")
+    args = parser.parse_args()
+
+    check_golden_titles()
+
+    benchmarks = bench_normalization(args.rounds)
+    benchmarks.update(bench_matching(args.rounds))
+    benchmarks.update(
+        asyncio.run(
+            async_bench_fetch(args.fetch_rounds, args.concurrency, args.latency)
+        )
+    )
+
+    results = {
+        "format": FORMAT_VERSION,
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "lyricsgenius": lyricsgenius.__version__,
+        "args": vars(args),
+        "benchmarks": benchmarks,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(json.load(file), results)
+
+
+if __name__ == "__main__":
+    main()
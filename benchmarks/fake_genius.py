@@ -0,0 +1,213 @@
+"""Local stand-in for the Genius endpoints used by the integration.
+
+Serves `search/multi` and `songs/<id>` API responses and lyrics pages shaped
+like the ones recorded from genius.com, built from `fixtures/songs.json`.
+Lyrics are synthetic, but carry the same noise as real pages (contributors
+header, description blurb, ticket ads, recommendations and embed trailer) so
+`cleanup_lyrics` has the same work to do.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import re
+from typing import Any
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_songs() -> list[dict[str, Any]]:
+    """Return the songs served by the fake server."""
+    return json.loads((FIXTURES / "songs.json").read_text())
+
+
+def load_titles() -> list[tuple[str, str]]:
+    """Return (media player title, expected cleaned title) pairs."""
+    return [tuple(pair) for pair in json.loads((FIXTURES / "titles.json").read_text())]
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def song_path(song: dict[str, Any]) -> str:
+    """Return the page path of a song."""
+    return f"/{_slug(song['artist'])}-{_slug(song['title'])}-lyrics"
+
+
+def song_json(song: dict[str, Any], base_url: str) -> dict[str, Any]:
+    """Return the API representation of a song."""
+    artist = {
+        "api_path": f"/artists/{song['id'] * 10}",
+        "header_image_url": f"{base_url}/images/artist-{song['id']}-header.jpg",
+        "id": song["id"] * 10,
+        "image_url": f"{base_url}/images/artist-{song['id']}.jpg",
+        "is_meme_verified": False,
+        "is_verified": False,
+        "name": song["artist"],
+        "url": f"{base_url}/artists/{_slug(song['artist'])}",
+    }
+    return {
+        "annotation_count": 3,
+        "api_path": f"/songs/{song['id']}",
+        "artist_names": song["artist"],
+        "full_title": f"{song['title']} by {song['artist']}",
+        "header_image_thumbnail_url": f"{base_url}/images/{song['id']}-300x300.jpg",
+        "header_image_url": f"{base_url}/images/{song['id']}-1000x1000.jpg",
+        "id": song["id"],
+        "instrumental": song["lines"] == 0,
+        "lyrics_owner_id": 1,
+        "lyrics_state": "complete",
+        "path": song_path(song),
+        "primary_artist": artist,
+        "pyongs_count": song["pyongs_count"],
+        "song_art_image_thumbnail_url": f"{base_url}/images/{song['id']}-300x300.jpg",
+        "song_art_image_url": f"{base_url}/images/{song['id']}-1000x1000.jpg",
+        "stats": {"unreviewed_annotations": 0, "hot": song["id"] % 2 == 0},
+        "title": song["title"],
+        "title_with_featured": song["title"],
+        "url": f"{base_url}{song_path(song)}",
+    }
+
+
+def _hit(index: str, result: dict[str, Any]) -> dict[str, Any]:
+    return {"highlights": [], "index": index, "type": index, "result": result}
+
+
+def search_response(
+    songs: list[dict[str, Any]], query: str, base_url: str
+) -> dict[str, Any]:
+    """Return a `search/multi` response for a query.
+
+    Like Genius, the top hit is not always the wanted song: decoys by other
+    artists and non-lyrics pages (track lists) are mixed into the sections.
+    """
+    query = query.casefold()
+    matches = [song for song in songs if song["title"].casefold() in query]
+    others = [song for song in songs if song not in matches][:4]
+
+    song_hits = [_hit("song", song_json(song, base_url)) for song in others[:2]]
+    song_hits += [_hit("song", song_json(song, base_url)) for song in matches]
+    song_hits += [_hit("song", song_json(song, base_url)) for song in others[2:]]
+
+    tracklist = dict(song_json(others[0], base_url), title="Album Tracklist", id=1)
+    top_hits = [_hit("song", tracklist)] + song_hits[:1]
+
+    return {
+        "sections": [
+            {"type": "top_hit", "hits": top_hits},
+            {"type": "song", "hits": song_hits},
+            {"type": "lyric", "hits": song_hits[::-1]},
+            {
+                "type": "artist",
+                "hits": [
+                    _hit("artist", song_json(song, base_url)["primary_artist"])
+                    for song in matches + others
+                ],
+            },
+            {"type": "album", "hits": []},
+            {"type": "video", "hits": []},
+            {"type": "article", "hits": []},
+            {"type": "user", "hits": []},
+        ]
+    }
+
+
+def lyrics_page(song: dict[str, Any]) -> str:
+    """Return the HTML page of a song."""
+    lines = [f"{song['id'] % 90 + 3} Contributors{song['title']} Lyrics"]
+    lines.append(
+        f"“{song['title']}” is the closing track of {song['artist']}'s record, "
+        "written over a single night in the studio… Read More "
+    )
+    for verse in range(song["lines"] // 8 or 1):
+        lines.append(f"[Verse {verse + 1}]")
+        for line in range(8):
+            lines.append(f"Line {line + 1} of verse {verse + 1} about {song['title']}")
+        if verse == 1:
+            lines[-1] += "You might also like"
+        if verse == 2:
+            lines[-1] += f"See {song['artist']} LiveGet tickets as low as $42"
+    lines[-1] += f"{song['pyongs_count'] or ''}Embed"
+
+    body = "<br/>".join(lines)
+    return (
+        "<html><head><title>"
+        f"{song['artist']} – {song['title']} Lyrics | Genius Lyrics"
+        "</title></head><body>"
+        '<div id="lyrics-root">'
+        '<div data-lyrics-container="true" class="Lyrics__Container-sc-1ynbvzw-1">'
+        f"{body}</div></div></body></html>"
+    )
+
+
+class FakeGenius:
+    """aiohttp server replaying Genius responses, with optional latency."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the server."""
+        self._latency = latency
+        self._songs = load_songs()
+        self._by_id = {song["id"]: song for song in self._songs}
+        self._by_path = {song_path(song): song for song in self._songs}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+        self.requests = 0
+
+    @property
+    def api_root(self) -> str:
+        """Return the URL to pass as `GeniusClient` api root."""
+        return f"{self.base_url}/api/"
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        app = web.Application()
+        app.router.add_get("/api/search/multi", self._search)
+        app.router.add_get("/api/songs/{song_id}", self._song)
+        app.router.add_get("/{path}", self._page)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _respond(self) -> None:
+        self.requests += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+    async def _search(self, request: web.Request) -> web.Response:
+        await self._respond()
+        response = search_response(
+            self._songs, request.query.get("q", ""), self.base_url
+        )
+        return web.json_response({"meta": {"status": 200}, "response": response})
+
+    async def _song(self, request: web.Request) -> web.Response:
+        await self._respond()
+        song = self._by_id.get(int(request.match_info["song_id"]))
+        if song is None:
+            raise web.HTTPNotFound
+        return web.json_response(
+            {
+                "meta": {"status": 200},
+                "response": {"song": song_json(song, self.base_url)},
+            }
+        )
+
+    async def _page(self, request: web.Request) -> web.Response:
+        await self._respond()
+        song = self._by_path.get(request.path)
+        if song is None:
+            raise web.HTTPNotFound
+        return web.Response(text=lyrics_page(song), content_type="text/html")
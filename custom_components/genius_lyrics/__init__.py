@@ -1,6 +1,7 @@
 """The Genius Lyrics integration."""
 
 import logging
+import time
 
 import voluptuous as vol
 
@@ -12,10 +13,11 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     Platform,
 )
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import split_entity_id
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 import homeassistant.helpers.entity_registry as er
 from homeassistant.helpers.entity_registry import (
     EVENT_ENTITY_REGISTRY_UPDATED,
@@ -23,14 +25,52 @@ from homeassistant.helpers.entity_registry import (
 )
 from homeassistant.helpers.network import get_url
 
+from .cache import LyricsCache, MissCache, ResolutionIndex
+from .client import GeniusClient
+from .fetcher import LyricsFetcher
 from .const import (
+    CONF_CACHE_SIZE,
+    CONF_CACHE_TTL,
+    CONF_FETCH_WORKERS,
+    CONF_LYRICS_DIR,
     CONF_MONITOR_ALL,
     CONF_NOTIFY_NEW_PLAYERS,
+    CONF_PREFETCH_COUNT,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    DATA_FETCHER,
+    DATA_APPLIED_OPTIONS,
+    DATA_GENIUS_CLIENT,
+    DATA_LINE_TRACKERS,
+    DATA_LOCAL_LYRICS,
+    DATA_LYRICS_CACHE,
+    DATA_LYRICS_SENSORS,
+    DATA_METRICS,
+    DATA_MISS_CACHE,
+    DATA_MONITORED_ENTITIES,
+    DATA_PREFETCHER,
+    DATA_RESOLUTION_INDEX,
+    DATA_SCHEDULER,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_FETCH_WORKERS,
+    DEFAULT_LYRICS_DIR,
+    DEFAULT_PREFETCH_COUNT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DOMAIN,
     INTEGRATION_NAME,
+    RESOLUTION_INDEX_SIZE,
+    SIGNAL_ADD_SENSOR,
+    SIGNAL_REMOVE_SENSOR,
 )
-from .helpers import get_media_player_entities
-from .services import async_setup_services
+from .helpers import get_lyrics_sensor_unique_id, get_media_player_entities
+from .local import LocalLyricsProvider
+from .metrics import SETUP, LyricsMetrics
+from .prefetch import LyricsPrefetcher
+from .scheduler import FetchScheduler
+from .services import async_setup_services, async_unload_services
+from .websocket import async_setup_websocket_api
 from .www_manager import (
     async_register_cards,
     async_register_resources_service,
@@ -55,6 +95,7 @@ async def async_notify_user(hass: HomeAssistant, message: str) -> None:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Genius Lyrics from a config entry."""
+    setup_start = time.perf_counter()
     domain_data = hass.data.setdefault(DOMAIN, {})
     if LOADED_ENTRIES not in domain_data:
         domain_data[LOADED_ENTRIES] = 0
@@ -73,6 +114,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 EVENT_HOMEASSISTANT_STARTED, _auto_register_resources
             )
 
+        async_setup_websocket_api(hass)
         domain_data[DATA_CARD_SETUP_DONE] = True
 
     # prefer options
@@ -87,6 +129,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         notify_new_players = entry.data.get(CONF_NOTIFY_NEW_PLAYERS, True)
 
+    # lyrics cache and Genius traffic tuning (options only)
+    cache_size = entry.options.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE)
+    cache_ttl = entry.options.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL)
+    rate_limit = entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+    rate_burst = entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST)
+    prefetch_count = entry.options.get(CONF_PREFETCH_COUNT, DEFAULT_PREFETCH_COUNT)
+    fetch_workers = entry.options.get(CONF_FETCH_WORKERS, DEFAULT_FETCH_WORKERS)
+    lyrics_dir = entry.options.get(CONF_LYRICS_DIR, DEFAULT_LYRICS_DIR)
+
     if monitor_all is True:
         monitored_entities = get_media_player_entities(hass)
         user_selected_entities = []
@@ -102,9 +153,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.config_entries.async_update_entry(
         entry,
         options={
+            **entry.options,
             CONF_MONITOR_ALL: monitor_all,
             CONF_ENTITIES: user_selected_entities,
             CONF_NOTIFY_NEW_PLAYERS: notify_new_players,
+            CONF_CACHE_SIZE: cache_size,
+            CONF_CACHE_TTL: cache_ttl,
+            CONF_RATE_LIMIT: rate_limit,
+            CONF_RATE_BURST: rate_burst,
+            CONF_PREFETCH_COUNT: prefetch_count,
+            CONF_FETCH_WORKERS: fetch_workers,
+            CONF_LYRICS_DIR: lyrics_dir,
         },
     )
 
@@ -114,36 +173,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error(_err)
         raise ConfigEntryNotReady(_err)
 
-    domain_data[entry.entry_id] = {}
+    # caches are shared by all sensors and services of this entry
+    cache = LyricsCache(hass, cache_size, cache_ttl * 86400)
+    await cache.async_load()
+    miss_cache = MissCache(hass, cache_size)
+    await miss_cache.async_load()
+    index = ResolutionIndex(hass, RESOLUTION_INDEX_SIZE if cache_size else 0)
+    await index.async_load()
+
+    # one client on HA's pooled aiohttp session is shared by all sensors
+    # and services of this entry
+    metrics = LyricsMetrics()
+    client = GeniusClient(hass, rate=rate_limit, burst=rate_burst, metrics=metrics)
+    entry.async_create_background_task(
+        hass, client.async_warm_up(), f"{DOMAIN} client warm-up"
+    )
+
+    # lyrics of a local music library are preferred over Genius
+    local = None
+    if lyrics_dir:
+        local = LocalLyricsProvider(hass, entry, lyrics_dir)
+        await local.async_setup()
+
+    # lookups of all sensors and services share its workers, by priority
+    scheduler = FetchScheduler(metrics, fetch_workers)
+
+    fetcher = LyricsFetcher(
+        hass, entry, client, cache, miss_cache, index, metrics, local, scheduler
+    )
+    domain_data[entry.entry_id] = {
+        DATA_METRICS: metrics,
+        DATA_GENIUS_CLIENT: client,
+        DATA_LYRICS_CACHE: cache,
+        DATA_MISS_CACHE: miss_cache,
+        DATA_RESOLUTION_INDEX: index,
+        DATA_LOCAL_LYRICS: local,
+        DATA_SCHEDULER: scheduler,
+        DATA_FETCHER: fetcher,
+        DATA_PREFETCHER: LyricsPrefetcher(hass, entry, fetcher, prefetch_count),
+        # filled by the lyrics sensors, keyed by their entity id
+        DATA_LINE_TRACKERS: {},
+        # filled by the sensor platform, keyed by media player entity id
+        DATA_LYRICS_SENSORS: {},
+        # options the entry is running with, see async_update_options
+        DATA_APPLIED_OPTIONS: {
+            **entry.options,
+            CONF_ENTITIES: list(user_selected_entities),
+        },
+        # user-selected media players, for registry updates
+        DATA_MONITORED_ENTITIES: set(user_selected_entities),
+    }
     domain_data[LOADED_ENTRIES] += 1
 
     # listen for options updates
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     # forward entry setup to platform(s)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # track entity registry to detect new/removed media_player entities
+    monitored = domain_data[entry.entry_id][DATA_MONITORED_ENTITIES]
+
     async def handle_entity_registry_update(event: Event) -> None:
         """Handle addition/removal of a media_player entities."""
 
         entity_id = event.data["entity_id"]
-        entity_domain, entity_name = split_entity_id(entity_id)
-        if entity_domain != Platform.MEDIA_PLAYER:
-            return
-
-        sensor_entity_id = f"{Platform.SENSOR}.{entity_name}_lyrics"
+        entity_name = split_entity_id(entity_id)[1]
         registry = er.async_get(hass)
+        sensor_entity_id = registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, get_lyrics_sensor_unique_id(entity_id)
+        ) or f"{Platform.SENSOR}.{DOMAIN}_{entity_name}_lyrics"
         action = event.data["action"]
 
         if action == "create":
-            # trigger reload if monitoring all media_player entities
+            # add a sensor if monitoring all media_player entities
             # otherwise, issue notification about event.
             if monitor_all is True:
                 _LOGGER.info(
-                    f"Creating sensor for new {Platform.MEDIA_PLAYER}: {entity_name}, reloading..."
+                    f"Creating sensor for new {Platform.MEDIA_PLAYER}: {entity_name}"
+                )
+                async_dispatcher_send(
+                    hass, SIGNAL_ADD_SENSOR.format(entry.entry_id), entity_id
                 )
-                await async_reload_entry(hass, entry)
                 sensor_url = (
                     f"{get_url(hass)}/config/entities?config_entry={entry.entry_id}"
                 )
@@ -165,14 +276,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         elif action == "remove":
             # remove sensor for a monitored media_player entity
-            if monitor_all is True or entity_id in monitored_entities:
+            # selected players change without a reload, see async_update_options
+            if monitor_all is True or entity_id in monitored:
                 _LOGGER.info(f"Removing sensor for {entity_id}")
 
-                registry = er.async_get(hass)
-                try:
-                    registry.async_remove(sensor_entity_id)
-                except KeyError:
-                    _LOGGER.warning("Sensor already removed")
+                # the sensor platform drops the entity and its registry entry
+                async_dispatcher_send(
+                    hass, SIGNAL_REMOVE_SENSOR.format(entry.entry_id), entity_id
+                )
 
                 # cleanup entity with restored state
                 state = hass.states.get(sensor_entity_id)
@@ -190,22 +301,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
                 # remove entity from options list if media_player was user-selected
                 if monitor_all is False:
-                    monitored_entities.remove(entity_id)
+                    entities = [
+                        selected
+                        for selected in entry.options[CONF_ENTITIES]
+                        if selected != entity_id
+                    ]
+                    # the sensor is already removed, nothing left to apply
+                    _async_apply_entities(hass, entry, entities)
                     hass.config_entries.async_update_entry(
                         entry,
                         options={
+                            **entry.options,
                             CONF_MONITOR_ALL: monitor_all,
-                            CONF_ENTITIES: monitored_entities,
+                            CONF_ENTITIES: entities,
                         },
                     )
 
-                # trigger reload
-                await async_reload_entry(hass, entry)
-
         elif action == "update":
             # adjust sensor enabled state per monitored media_player enabled state
             mp_entry = registry.async_get(entity_id)
-            if mp_entry and (monitor_all is True or entity_id in monitored_entities):
+            if mp_entry and (monitor_all is True or entity_id in monitored):
                 # only update entity when disabled statuses differs
                 sensor_entry = registry.async_get(sensor_entity_id)
                 if sensor_entry is not None and (
@@ -221,17 +336,76 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         else None,
                     )
 
-    hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, handle_entity_registry_update)
+    # one listener per entry, released on unload so reloads don't stack them
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            handle_entity_registry_update,
+            event_filter=_async_media_player_filter,
+        )
+    )
 
     # set up services
-    async_setup_services(hass)
+    async_setup_services(hass, entry)
+
+    setup_time = time.perf_counter() - setup_start
+    metrics.observe(SETUP, setup_time)
+    _LOGGER.debug(f"Set up {entry.title} in {setup_time * 1000:.1f}ms")
 
     return True
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle an options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+@callback
+def _async_media_player_filter(event: Event) -> bool:
+    """Pass registry updates of media_player entities only."""
+    return event.data["entity_id"].startswith(f"{Platform.MEDIA_PLAYER}.")
+
+
+@callback
+def _async_apply_entities(
+    hass: HomeAssistant, entry: ConfigEntry, entities: list[str]
+) -> None:
+    """Record the user-selected media players the entry is running with."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entry_data[DATA_APPLIED_OPTIONS] = {
+        **entry_data[DATA_APPLIED_OPTIONS],
+        CONF_ENTITIES: list(entities),
+    }
+    # updated in place, the registry listener holds on to it
+    monitored = entry_data[DATA_MONITORED_ENTITIES]
+    monitored.clear()
+    monitored.update(entities)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle an options update.
+
+    A change of the selected media players only adds or removes their sensors,
+    any other change reloads the entry.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    applied = entry_data[DATA_APPLIED_OPTIONS]
+    changed = {
+        key
+        for key in applied.keys() | entry.options.keys()
+        if applied.get(key) != entry.options.get(key)
+    }
+    if changed - {CONF_ENTITIES} or entry.options[CONF_MONITOR_ALL]:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    old_entities = set(applied[CONF_ENTITIES])
+    new_entities = set(entry.options[CONF_ENTITIES])
+    for entity_id in new_entities - old_entities:
+        async_dispatcher_send(
+            hass, SIGNAL_ADD_SENSOR.format(entry.entry_id), entity_id
+        )
+    for entity_id in old_entities - new_entities:
+        async_dispatcher_send(
+            hass, SIGNAL_REMOVE_SENSOR.format(entry.entry_id), entity_id
+        )
+    entry_data[DATA_APPLIED_OPTIONS] = dict(entry.options)
+    _async_apply_entities(hass, entry, entry.options[CONF_ENTITIES])
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -241,8 +415,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     if unload_ok:
         domain_data = hass.data[DOMAIN]
-        domain_data.pop(entry.entry_id)
+        entry_data = domain_data.pop(entry.entry_id)
+        await entry_data[DATA_LYRICS_CACHE].async_save()
+        await entry_data[DATA_MISS_CACHE].async_save()
+        await entry_data[DATA_RESOLUTION_INDEX].async_save()
         if domain_data.get(LOADED_ENTRIES, 0) > 0:
             domain_data[LOADED_ENTRIES] -= 1
+        if not domain_data.get(LOADED_ENTRIES):
+            async_unload_services(hass)
 
     return unload_ok
@@ -0,0 +1,249 @@
+"""Persistent lyrics caches for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import replace
+import logging
+import time
+from typing import Any, Generic, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, MISS_RECHECK_INTERVAL, MISS_RECHECK_MAX_INTERVAL
+from .models import LyricsResult
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds
+
+_T = TypeVar("_T")
+
+
+class _StoredLRU(Generic[_T]):
+    """Size-bounded LRU mapping persisted to HA storage.
+
+    Entries are keyed by the normalized (artist, title) query, see
+    `helpers.normalize_query`.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str, max_entries: int) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, key)
+        self._entries: OrderedDict[str, _T] = OrderedDict()
+        self._max_entries = max_entries
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    async def async_load(self) -> None:
+        """Load entries from storage, dropping expired ones."""
+        data = await self._store.async_load()
+        if not data:
+            return
+
+        now = time.time()
+        for key, item in data.get("entries", []):
+            try:
+                value = self._decode(item)
+            except (TypeError, ValueError):
+                _LOGGER.debug(f"Dropping malformed cache entry: {key}")
+                continue
+            if not self._expired(value, now):
+                self._entries[key] = value
+
+        self._evict()
+        _LOGGER.debug(f"Loaded {len(self._entries)} entries from {self._store.key}")
+
+    async def async_save(self) -> None:
+        """Write the cache to storage immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    def _encode(self, value: _T) -> Any:
+        """Return the stored representation of a value."""
+        return value
+
+    def _decode(self, item: Any) -> _T:
+        """Restore a value from its stored representation."""
+        return item
+
+    def _expired(self, value: _T, now: float) -> bool:
+        """Return True when a value should no longer be served."""
+        return False
+
+    @callback
+    def _async_get(self, key: str) -> _T | None:
+        """Return a live value and mark it as most recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            return None
+
+        if self._expired(value, time.time()):
+            del self._entries[key]
+            self._async_schedule_save()
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    @callback
+    def _async_set(self, key: str, value: _T) -> None:
+        """Store a value, evicting least recently used entries."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+        self._async_schedule_save()
+
+    @callback
+    def _async_remove(self, key: str) -> None:
+        """Drop a value if present."""
+        if self._entries.pop(key, None) is not None:
+            self._async_schedule_save()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries above the size bound."""
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a delayed write of the cache."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data of the cache to store in a file."""
+        return {
+            "entries": [
+                [key, self._encode(value)] for key, value in self._entries.items()
+            ]
+        }
+
+
+class LyricsCache(_StoredLRU[tuple[float, LyricsResult]]):
+    """Resolved lyrics, expiring `ttl` seconds after being stored."""
+
+    def __init__(self, hass: HomeAssistant, max_entries: int, ttl: float) -> None:
+        """Initialize the cache."""
+        super().__init__(hass, f"{DOMAIN}.lyrics_cache", max_entries)
+        self._ttl = ttl
+
+    def _encode(self, value: tuple[float, LyricsResult]) -> Any:
+        stored_at, result = value
+        return [stored_at, result.as_dict()]
+
+    def _decode(self, item: Any) -> tuple[float, LyricsResult]:
+        stored_at, data = item
+        return stored_at, LyricsResult.from_dict(data)
+
+    def _expired(self, value: tuple[float, LyricsResult], now: float) -> bool:
+        return now - value[0] > self._ttl
+
+    @callback
+    def async_get(self, key: str) -> LyricsResult | None:
+        """Return cached lyrics for a query key, or None on miss/expiry."""
+        value = self._async_get(key)
+        return value[1] if value is not None else None
+
+    @callback
+    def async_set(self, key: str, result: LyricsResult) -> None:
+        """Store lyrics for a query key."""
+        self._async_set(key, (time.time(), result))
+
+    @callback
+    def async_get_song(self, song_id: int) -> LyricsResult | None:
+        """Return cached lyrics of a song, whichever query resolved it."""
+        now = time.time()
+        # newest first, the song on display was most likely stored last
+        for value in reversed(self._entries.values()):
+            if value[1].song_id == song_id and not self._expired(value, now):
+                return value[1]
+        return None
+
+
+class MissCache(_StoredLRU[tuple[float, int]]):
+    """Queries that resolved to no song, with exponential re-check backoff.
+
+    After the n-th consecutive miss a query is not searched again for
+    `MISS_RECHECK_INTERVAL * 2 ** (n - 1)` seconds, capped at
+    `MISS_RECHECK_MAX_INTERVAL` so lyrics published later are still found.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_entries: int) -> None:
+        """Initialize the cache."""
+        super().__init__(hass, f"{DOMAIN}.miss_cache", max_entries)
+
+    def _decode(self, item: Any) -> tuple[float, int]:
+        checked_at, misses = item
+        return float(checked_at), int(misses)
+
+    @staticmethod
+    def _recheck_interval(misses: int) -> float:
+        """Return the back-off interval after a number of misses."""
+        return min(MISS_RECHECK_INTERVAL * 2 ** (misses - 1), MISS_RECHECK_MAX_INTERVAL)
+
+    @callback
+    def async_is_suppressed(self, key: str) -> bool:
+        """Return True if a query missed recently and should not be searched."""
+        value = self._async_get(key)
+        if value is None:
+            return False
+
+        checked_at, misses = value
+        return time.time() - checked_at < self._recheck_interval(misses)
+
+    @callback
+    def async_record_miss(self, key: str) -> None:
+        """Record that a query resolved to no song, growing its back-off."""
+        value = self._entries.get(key)
+        misses = value[1] + 1 if value is not None else 1
+        self._async_set(key, (time.time(), misses))
+
+    @callback
+    def async_clear(self, key: str) -> None:
+        """Forget a query after it resolved to a song."""
+        self._async_remove(key)
+
+
+class ResolutionIndex(_StoredLRU[LyricsResult]):
+    """Songs that queries resolved to, kept without their lyrics.
+
+    Outlives lyrics cache entries, so a recurring track goes straight to its
+    lyrics page instead of searching Genius again. Every variant of a query
+    that was searched (raw title, cleaned title, truncated title) is indexed.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_entries: int) -> None:
+        """Initialize the index."""
+        super().__init__(hass, f"{DOMAIN}.resolution_index", max_entries)
+
+    def _encode(self, value: LyricsResult) -> Any:
+        data = value.as_dict()
+        del data["lyrics"]
+        return data
+
+    def _decode(self, item: Any) -> LyricsResult:
+        return LyricsResult.from_dict({**item, "lyrics": ""})
+
+    @callback
+    def async_get(self, key: str) -> LyricsResult | None:
+        """Return the song a query key resolved to, with empty lyrics."""
+        return self._async_get(key)
+
+    @callback
+    def async_set(self, keys: list[str], result: LyricsResult) -> None:
+        """Index the song that query keys resolved to."""
+        song = replace(result, lyrics="")
+        for key in keys:
+            self._async_set(key, song)
+
+    @callback
+    def async_remove_song(self, song_id: int) -> None:
+        """Forget every query key resolving to a song."""
+        for key in [
+            key for key, song in self._entries.items() if song.song_id == song_id
+        ]:
+            self._async_remove(key)
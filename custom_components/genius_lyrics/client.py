@@ -0,0 +1,211 @@
+"""Asyncio client for the Genius public API and lyrics pages."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError, ClientResponseError, ClientTimeout
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    FETCH_RETRIES,
+    GENIUS_API_ROOT,
+    GENIUS_WEB_ROOT,
+    REQUEST_TIMEOUT,
+    RETRY_AFTER_DEFAULT,
+    RETRY_AFTER_MAX,
+)
+from .metrics import (
+    PAGE_FETCH,
+    RATE_LIMIT_WAIT,
+    RETRIES,
+    SCRAPER_LOAD,
+    SEARCH,
+    THROTTLED,
+    LyricsMetrics,
+)
+from .ratelimit import TokenBucket, parse_retry_after
+
+if TYPE_CHECKING:
+    from lyricsgenius.types import Song
+
+    from .genius import GeniusPatched
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _load_genius() -> GeniusPatched:
+    """Import lyricsgenius and its scraping stack, and build the matcher."""
+    from .genius import GeniusPatched
+
+    return GeniusPatched("public", verbose=False, skip_non_songs=True)
+
+
+class GeniusClient:
+    """Search Genius and scrape lyrics on Home Assistant's shared aiohttp session.
+
+    Performs the same search and lyrics page fetch as
+    `GeniusPatched.search_song`, which is only used here for matching search
+    hits and parsing pages; it never touches the network.
+
+    All requests pass through a token bucket so bursts of lookups stay below
+    Genius' throttling, and 429 responses hold back every request for the
+    duration given by their Retry-After header.
+
+    lyricsgenius pulls in requests and BeautifulSoup, so it is imported in the
+    executor by the first lookup rather than at integration setup.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        retries: int = FETCH_RETRIES,
+        timeout: float = REQUEST_TIMEOUT,
+        rate: float = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_RATE_BURST,
+        api_root: str = GENIUS_API_ROOT,
+        metrics: LyricsMetrics | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        `api_root` can point at a stand-in server, e.g. for benchmarks.
+        """
+        self._hass = hass
+        self._api_root = api_root
+        self._metrics = metrics or LyricsMetrics()
+        self._session = async_get_clientsession(hass)
+        self._genius: GeniusPatched | None = None
+        self._genius_lock = asyncio.Lock()
+        self._limiter = TokenBucket(rate, burst)
+        self.retries = retries
+        self._timeout = ClientTimeout(total=timeout)
+
+    async def _async_get_genius(self) -> GeniusPatched:
+        """Return the lyricsgenius matcher and parser, loading it on first use."""
+        if self._genius is None:
+            async with self._genius_lock:
+                if self._genius is None:
+                    with self._metrics.timer(SCRAPER_LOAD):
+                        self._genius = await self._hass.async_add_executor_job(
+                            _load_genius
+                        )
+        return self._genius
+
+    async def _async_request(
+        self, url: str, params: dict[str, Any] | None = None, web: bool = False
+    ) -> Any:
+        """Make a request, retrying timeouts, throttling and server errors."""
+        tries = 0
+        while True:
+            tries += 1
+            with self._metrics.timer(RATE_LIMIT_WAIT):
+                await self._limiter.async_acquire()
+            try:
+                async with self._session.get(
+                    url, params=params, timeout=self._timeout
+                ) as response:
+                    if response.status == 429:
+                        self._async_throttled(response.headers.get("Retry-After"))
+                    response.raise_for_status()
+                    if web:
+                        return await response.text()
+                    data = await response.json()
+                    return data.get("response", data)
+            except asyncio.TimeoutError:
+                if tries > self.retries:
+                    raise
+            except ClientResponseError as e:
+                if (e.status < 500 and e.status != 429) or tries > self.retries:
+                    raise
+            _LOGGER.debug(f"Retrying request to {url} ({tries}/{self.retries})")
+            self._metrics.increment(RETRIES)
+
+    def _async_throttled(self, retry_after: str | None) -> None:
+        """Hold back all requests after Genius throttled us."""
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = RETRY_AFTER_DEFAULT
+        delay = min(delay, RETRY_AFTER_MAX)
+        self._metrics.increment(THROTTLED)
+        _LOGGER.warning(f"Throttled by Genius, pausing requests for {delay:.0f}s")
+        self._limiter.block(delay)
+
+    async def async_warm_up(self) -> None:
+        """Open a keep-alive connection to Genius ahead of the first lookup."""
+        try:
+            async with self._session.head(GENIUS_WEB_ROOT, timeout=self._timeout):
+                pass
+        except (asyncio.TimeoutError, ClientError) as e:
+            _LOGGER.debug(f"Unable to warm up Genius connection: {e}")
+
+    async def async_search_all(self, search_term: str) -> dict[str, Any]:
+        """Search all result types on the Genius public API."""
+        with self._metrics.timer(SEARCH):
+            return await self._async_request(
+                f"{self._api_root}search/multi", {"q": search_term}
+            )
+
+    async def async_lyrics(self, song_url: str) -> str | None:
+        """Download a song page and scrape its lyrics."""
+        with self._metrics.timer(PAGE_FETCH):
+            html = await self._async_request(song_url, web=True)
+        genius = await self._async_get_genius()
+        # HTML parsing is CPU bound, keep it off the event loop
+        return await self._hass.async_add_executor_job(genius.parse_lyrics, html)
+
+    async def async_search_song_info(
+        self, title: str, artist: str = ""
+    ) -> dict[str, Any] | None:
+        """Search for a song, without fetching its lyrics page."""
+        genius = await self._async_get_genius()
+
+        search_term = f"{title} {artist}".strip()
+        response = await self.async_search_all(search_term)
+        song_info = genius._get_item_from_search_response(
+            response, title, type_="song", result_type="title", artist=artist
+        )
+        if song_info is None:
+            _LOGGER.debug(f"No results found for: '{search_term}'")
+            return None
+
+        # reject non-songs (liner notes, track lists, etc.)
+        # or songs with incomplete lyrics (e.g. unreleased songs, instrumentals)
+        if genius.skip_non_songs and not genius._result_is_lyrics(song_info):
+            _LOGGER.debug("Specified song does not contain lyrics, rejecting")
+            return None
+
+        return song_info
+
+    async def async_song(self, song_id: int) -> Song | None:
+        """Get a song and its lyrics by Genius song id."""
+        response = await self._async_request(f"{self._api_root}songs/{song_id}")
+        return await self._async_song_with_lyrics(response["song"])
+
+    async def _async_song_with_lyrics(self, song_info: dict[str, Any]) -> Song | None:
+        """Scrape the lyrics of a song found on the API."""
+        lyrics = await self.async_song_lyrics(song_info)
+        genius = await self._async_get_genius()
+
+        # skip results when URL is a 404 or lyrics are missing
+        if genius.skip_non_songs and not lyrics:
+            _LOGGER.debug("Specified song does not have valid lyrics, rejecting")
+            return None
+
+        # already imported along with the matcher
+        from lyricsgenius.types import Song
+
+        return Song(genius, song_info, lyrics)
+
+    async def async_song_lyrics(self, song_info: dict[str, Any]) -> str | None:
+        """Scrape the lyrics of a song found on the API, if it has any."""
+        if song_info["lyrics_state"] == "complete" and not song_info.get(
+            "instrumental"
+        ):
+            return await self.async_lyrics(song_info["url"])
+        return ""
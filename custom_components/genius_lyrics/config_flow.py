@@ -1,6 +1,7 @@
 """Config flow for Genius Lyrics integration."""
 
 import logging
+import os
 from typing import Any, Union
 
 import voluptuous as vol
@@ -8,28 +9,81 @@ import voluptuous as vol
 from homeassistant.components.media_player import DOMAIN as MP_DOMAIN
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_ENTITIES
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
-from .const import CONF_MONITOR_ALL, CONF_NOTIFY_NEW_PLAYERS, DOMAIN, INTEGRATION_NAME
+from .const import (
+    CONF_CACHE_SIZE,
+    CONF_CACHE_TTL,
+    CONF_FETCH_WORKERS,
+    CONF_LYRICS_DIR,
+    CONF_MONITOR_ALL,
+    CONF_NOTIFY_NEW_PLAYERS,
+    CONF_PREFETCH_COUNT,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_FETCH_WORKERS,
+    DEFAULT_LYRICS_DIR,
+    DEFAULT_PREFETCH_COUNT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    INTEGRATION_NAME,
+)
 from .helpers import get_media_player_entities
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _initial_form(flow: Union[ConfigFlow, OptionsFlow]):
+def _initial_form(
+    flow: Union[ConfigFlow, OptionsFlow], errors: dict[str, str] | None = None
+):
     """Return flow form for init/user step id."""
+    tuning_schema = {}
     if isinstance(flow, ConfigFlow):
         step_id = "user"
         monitor_all = True
         notify_new_players = True
     elif isinstance(flow, OptionsFlow):
         step_id = "init"
-        monitor_all = flow.config_entry.options.get(CONF_MONITOR_ALL, True)
-        notify_new_players = flow.config_entry.options.get(
-            CONF_NOTIFY_NEW_PLAYERS, True
-        )
+        options = flow.config_entry.options
+        monitor_all = options.get(CONF_MONITOR_ALL, True)
+        notify_new_players = options.get(CONF_NOTIFY_NEW_PLAYERS, True)
+
+        # tuning is only offered once the integration is set up
+        tuning_schema = {
+            vol.Optional(
+                CONF_CACHE_SIZE,
+                default=options.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_CACHE_TTL,
+                default=options.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_RATE_LIMIT,
+                default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Optional(
+                CONF_RATE_BURST,
+                default=options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_PREFETCH_COUNT,
+                default=options.get(CONF_PREFETCH_COUNT, DEFAULT_PREFETCH_COUNT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+            vol.Optional(
+                CONF_FETCH_WORKERS,
+                default=options.get(CONF_FETCH_WORKERS, DEFAULT_FETCH_WORKERS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+            vol.Optional(
+                CONF_LYRICS_DIR,
+                default=options.get(CONF_LYRICS_DIR, DEFAULT_LYRICS_DIR),
+            ): cv.string,
+        }
     else:
         raise TypeError("Invalid flow type")
 
@@ -41,13 +95,20 @@ def _initial_form(flow: Union[ConfigFlow, OptionsFlow]):
                 vol.Optional(
                     CONF_NOTIFY_NEW_PLAYERS, default=notify_new_players
                 ): cv.boolean,
+                **tuning_schema,
             }
         ),
+        errors=errors,
         # TODO: would be nice to dynamically adjust per checkbox value on form
         last_step=False,
     )
 
 
+def _is_allowed_dir(hass: HomeAssistant, path: str) -> bool:
+    """Return True if a path is a directory allowed by `allowlist_external_dirs`."""
+    return os.path.isdir(path) and hass.config.is_allowed_path(path)
+
+
 def _select_entities_form(flow: Union[ConfigFlow, OptionsFlow]):
     """Return flow form for select_entities step id."""
     if isinstance(flow, ConfigFlow):
@@ -86,6 +147,14 @@ class GeniusLyricsOptionsFlowHandler(OptionsFlow):
     ) -> FlowResult:
         """Manage Genius Lyrics options."""
         if user_input is not None:
+            # local lyrics must be in a directory Home Assistant may read
+            lyrics_dir = user_input.get(CONF_LYRICS_DIR, DEFAULT_LYRICS_DIR).strip()
+            user_input[CONF_LYRICS_DIR] = lyrics_dir
+            if lyrics_dir and not await self.hass.async_add_executor_job(
+                _is_allowed_dir, self.hass, lyrics_dir
+            ):
+                return _initial_form(self, {CONF_LYRICS_DIR: "invalid_lyrics_dir"})
+
             # user select to monitor all media players?
             if user_input[CONF_MONITOR_ALL] is True:
                 _LOGGER.info("User selected to monitor ALL %s entities", MP_DOMAIN)
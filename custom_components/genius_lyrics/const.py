@@ -1,5 +1,7 @@
 """Constants for the Genius Lyrics integration."""
 
+from datetime import timedelta
+
 INTEGRATION_NAME = "Genius Lyrics"
 DOMAIN = "genius_lyrics"
 CARD_RESOURCE_DIR = DOMAIN
@@ -12,12 +14,75 @@ ATTR_MEDIA_LYRICS = "media_lyrics"
 ATTR_MEDIA_IMAGE = "media_image"
 ATTR_MEDIA_STATS_HOT = "media_stats_hot"
 ATTR_MEDIA_PYONG_COUNT = "media_pyong_count"
+ATTR_SONG_ID = "song_id"
+ATTR_LYRICS_HASH = "lyrics_hash"
+ATTR_LYRICS_STATUS = "lyrics_status"
+ATTR_LINE_OFFSETS = "line_offsets"
 
 SERVICE_SEARCH_LYRICS = "search_lyrics"
+SERVICE_SEARCH_LYRICS_BATCH = "search_lyrics_batch"
+
+WS_TYPE_LYRICS = f"{DOMAIN}/lyrics"
+WS_TYPE_SUBSCRIBE_LINE = f"{DOMAIN}/subscribe_line"
+
+CONF_TRACKS = "tracks"
+CONF_MAX_PARALLEL = "max_parallel"
 
 CONF_MONITOR_ALL = "monitor_all"
 CONF_NOTIFY_NEW_PLAYERS = "notify_new_players"
+CONF_CACHE_SIZE = "cache_size"
+CONF_CACHE_TTL = "cache_ttl"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+CONF_PREFETCH_COUNT = "prefetch_count"
+CONF_FETCH_WORKERS = "fetch_workers"
+CONF_LYRICS_DIR = "lyrics_dir"
+
+DEFAULT_CACHE_SIZE = 500  # entries
+DEFAULT_CACHE_TTL = 30  # days
+DEFAULT_RATE_LIMIT = 2.0  # sustained requests per second
+DEFAULT_RATE_BURST = 5  # requests
+DEFAULT_PREFETCH_COUNT = 2  # upcoming tracks
+DEFAULT_FETCH_WORKERS = 4  # lookups running at once
+DEFAULT_MAX_PARALLEL = 4  # concurrent lookups of a batch search
+DEFAULT_LYRICS_DIR = ""  # no local lyrics
+
+MISS_RECHECK_INTERVAL = 3600  # seconds, doubled on every repeated miss
+MISS_RECHECK_MAX_INTERVAL = 7 * 86400  # seconds
+RESOLUTION_INDEX_SIZE = 5000  # entries
+LOCAL_RESCAN_INTERVAL = timedelta(minutes=15)
 
 DATA_GENIUS_CLIENT = "genius_client"
+DATA_LYRICS_CACHE = "lyrics_cache"
+DATA_MISS_CACHE = "miss_cache"
+DATA_RESOLUTION_INDEX = "resolution_index"
+DATA_LOCAL_LYRICS = "local_lyrics"
+DATA_FETCHER = "fetcher"
+DATA_PREFETCHER = "prefetcher"
+DATA_SCHEDULER = "scheduler"
+DATA_METRICS = "metrics"
+DATA_LINE_TRACKERS = "line_trackers"
+DATA_LYRICS_SENSORS = "lyrics_sensors"
+DATA_APPLIED_OPTIONS = "applied_options"
+DATA_MONITORED_ENTITIES = "monitored_entities"
+
+# dispatcher signals adding/removing the lyrics sensor of a media player,
+# formatted with the config entry id
+SIGNAL_ADD_SENSOR = f"{DOMAIN}_add_sensor_{{}}"
+SIGNAL_REMOVE_SENSOR = f"{DOMAIN}_remove_sensor_{{}}"
 
+GENIUS_API_ROOT = "https://genius.com/api/"
+GENIUS_WEB_ROOT = "https://genius.com/"
 FETCH_RETRIES = 2  # total = n+1
+REQUEST_TIMEOUT = 5  # seconds
+RETRY_AFTER_DEFAULT = 10  # seconds, when a 429 has no Retry-After
+RETRY_AFTER_MAX = 60  # seconds
+
+TRACK_SETTLE_DELAY = 1  # seconds a new track must stay before it is looked up
+PREFETCH_DELAY = 3  # seconds, lets the current track's lookup go first
+WARM_UP_INTERVAL = 0.5  # seconds between the initial lookups of sensors
+QUEUE_ATTRIBUTES = ("queue", "playlist")  # media_player attributes listing tracks
+
+LYRICS_NOT_FOUND = "Lyrics not found"
+LYRICS_STATUS_LOADING = "loading"
+LYRICS_STATUS_LOADED = "loaded"
@@ -0,0 +1,36 @@
+"""Diagnostics support for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_LOCAL_LYRICS,
+    DATA_LYRICS_CACHE,
+    DATA_METRICS,
+    DATA_MISS_CACHE,
+    DATA_RESOLUTION_INDEX,
+    DOMAIN,
+)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics of a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    local = entry_data[DATA_LOCAL_LYRICS]
+
+    return {
+        "options": dict(entry.options),
+        "cache": {
+            "lyrics_entries": len(entry_data[DATA_LYRICS_CACHE]),
+            "miss_entries": len(entry_data[DATA_MISS_CACHE]),
+            "index_entries": len(entry_data[DATA_RESOLUTION_INDEX]),
+            "local_songs": len(local) if local is not None else None,
+        },
+        "metrics": entry_data[DATA_METRICS].as_dict(),
+    }
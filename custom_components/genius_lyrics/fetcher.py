@@ -0,0 +1,362 @@
+"""Lyrics lookup pipeline shared by sensors and services."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from functools import partial
+import logging
+
+from aiohttp import ClientError, ClientResponseError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .cache import LyricsCache, MissCache, ResolutionIndex
+from .client import GeniusClient
+from .const import DOMAIN
+from .helpers import clean_song_title, normalize_query
+from .local import LocalLyricsProvider
+from .metrics import (
+    CACHE_HITS,
+    CACHE_MISSES,
+    CLEANUP,
+    COALESCED,
+    INDEX_HITS,
+    LOCAL_HITS,
+    LOOKUP,
+    MISS_CACHE_HITS,
+    NOT_FOUND,
+    LyricsMetrics,
+)
+from .models import LyricsResult
+from .scheduler import PRIORITY_INTERACTIVE, FetchScheduler, FetchTicket
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _InFlightLookup:
+    """A lookup in progress and the number of callers awaiting it."""
+
+    __slots__ = ("task", "ticket", "waiters", "song", "listeners")
+
+    def __init__(self, ticket: FetchTicket) -> None:
+        self.task: asyncio.Task[LyricsResult | None]
+        self.ticket = ticket
+        self.waiters = 0
+        # song found by the search, before its lyrics are fetched
+        self.song: LyricsResult | None = None
+        self.listeners: list[Callable[[LyricsResult], None]] = []
+
+    @callback
+    def async_set_song(self, song: LyricsResult) -> None:
+        """Hand the found song to the callers, ahead of its lyrics."""
+        self.song = song
+        for listener in list(self.listeners):
+            listener(song)
+
+
+class LyricsFetcher:
+    """Resolve lyrics for artist/title queries.
+
+    Reads through the lyrics cache and coalesces concurrent lookups of the
+    same normalized query, so every caller awaits one shared fetch and gets
+    the same result object. Queries that recently found nothing are answered
+    from the miss cache until their re-check interval has passed, and
+    queries resolved before skip the search through the resolution index.
+
+    Lyrics of the local library, when configured, take precedence over
+    Genius and its caches. Lookups that go to Genius run on the workers of
+    the scheduler, by the priority of their most urgent caller.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: GeniusClient,
+        cache: LyricsCache,
+        miss_cache: MissCache,
+        index: ResolutionIndex,
+        metrics: LyricsMetrics,
+        local: LocalLyricsProvider | None = None,
+        scheduler: FetchScheduler | None = None,
+    ) -> None:
+        """Initialize the fetcher."""
+        self._hass = hass
+        self._entry = entry
+        self._client = client
+        self._cache = cache
+        self._miss_cache = miss_cache
+        self._index = index
+        self._metrics = metrics
+        self._local = local
+        self._scheduler = scheduler or FetchScheduler(metrics)
+        self._inflight: dict[str, _InFlightLookup] = {}
+        # fetches of uncached songs by id, shared by concurrent callers
+        self._song_fetches: dict[int, asyncio.Task[LyricsResult | None]] = {}
+
+    @property
+    def retries(self) -> int:
+        """Return the number of retries of the underlying client."""
+        return self._client.retries
+
+    @callback
+    def async_get_cached(self, artist: str, title: str) -> LyricsResult | None:
+        """Return cached lyrics for a query without any network I/O."""
+        if self._local is not None and self._local.async_has(artist, title):
+            # the library file is read by `async_fetch`
+            return None
+        return self._async_get_cached(artist, title)
+
+    @callback
+    def _async_get_cached(self, artist: str, title: str) -> LyricsResult | None:
+        """Return lyrics for a query from the Genius lyrics cache."""
+        result = self._cache.async_get(normalize_query(artist, title))
+        if result is not None:
+            _LOGGER.debug(f"Lyrics cache hit for '{artist} - {title}'")
+            self._metrics.increment(CACHE_HITS)
+        return result
+
+    async def async_fetch(
+        self,
+        artist: str,
+        title: str,
+        on_song: Callable[[LyricsResult], None] | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> LyricsResult | None:
+        """Return lyrics for a query, or None when no song was found.
+
+        `on_song` is called with the song, without lyrics, as soon as the
+        search found it and while its lyrics page is still being fetched.
+        `priority` is the scheduler class of the lookup, see `scheduler`.
+        """
+        if self._local is not None:
+            result = await self._local.async_fetch(artist, title)
+            if result is not None:
+                self._metrics.increment(LOCAL_HITS)
+                return result
+
+        result = self._async_get_cached(artist, title)
+        if result is not None:
+            return result
+
+        self._metrics.increment(CACHE_MISSES)
+        key = normalize_query(artist, title)
+        if self._miss_cache.async_is_suppressed(key):
+            _LOGGER.debug(f"Skipping search for recent miss '{artist} - {title}'")
+            self._metrics.increment(MISS_CACHE_HITS)
+            return None
+
+        lookup = self._inflight.get(key)
+        if lookup is None or lookup.task.done():
+            lookup = _InFlightLookup(self._scheduler.async_ticket(priority))
+            lookup.task = self._entry.async_create_background_task(
+                self._hass,
+                self._scheduler.async_run(
+                    lookup.ticket,
+                    partial(self._async_timed_resolve, key, artist, title, lookup),
+                ),
+                f"{DOMAIN} lookup {key}",
+            )
+            self._inflight[key] = lookup
+            lookup.task.add_done_callback(
+                lambda _: self._async_lookup_done(key, lookup)
+            )
+        else:
+            _LOGGER.debug(f"Joining in-flight lookup for '{artist} - {title}'")
+            self._metrics.increment(COALESCED)
+            self._scheduler.async_promote(lookup.ticket, priority)
+
+        if on_song is not None:
+            if lookup.song is not None:
+                on_song(lookup.song)
+            lookup.listeners.append(on_song)
+
+        lookup.waiters += 1
+        try:
+            # shielded so one cancelled caller does not abort the others
+            return await asyncio.shield(lookup.task)
+        except asyncio.CancelledError:
+            # nobody is left to use the result
+            if lookup.waiters == 1:
+                lookup.task.cancel()
+            raise
+        finally:
+            lookup.waiters -= 1
+            if on_song is not None:
+                lookup.listeners.remove(on_song)
+
+    async def async_get_song(self, song_id: int) -> LyricsResult | None:
+        """Return lyrics of a song by id, from the cache or else from Genius."""
+        if song_id < 0:
+            # songs of the local library, see `local.local_song_id`
+            if self._local is None:
+                return None
+            return await self._local.async_get_song(song_id)
+
+        result = self._cache.async_get_song(song_id)
+        if result is not None:
+            return result
+
+        task = self._song_fetches.get(song_id)
+        if task is None:
+            _LOGGER.debug(f"Fetching lyrics of uncached song {song_id}")
+            task = self._entry.async_create_background_task(
+                self._hass, self._async_fetch_song(song_id), f"{DOMAIN} song {song_id}"
+            )
+            self._song_fetches[song_id] = task
+            task.add_done_callback(lambda _: self._song_fetches.pop(song_id, None))
+        else:
+            self._metrics.increment(COALESCED)
+
+        # shielded so one closed card does not abort the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch_song(self, song_id: int) -> LyricsResult | None:
+        """Fetch lyrics of a song by id from Genius and cache them."""
+        song = await self._scheduler.async_run(
+            self._scheduler.async_ticket(PRIORITY_INTERACTIVE),
+            partial(self._client.async_song, song_id),
+        )
+        if not song:
+            return None
+
+        result = LyricsResult.from_song(song)
+        # keyed by the song's own artist and title, found by id from now on
+        self._cache.async_set(normalize_query(result.artist, result.title), result)
+        return result
+
+    @callback
+    def _async_lookup_done(self, key: str, lookup: _InFlightLookup) -> None:
+        """Forget a finished lookup unless it was already replaced."""
+        if self._inflight.get(key) is lookup:
+            del self._inflight[key]
+
+    async def _async_timed_resolve(
+        self, key: str, artist: str, title: str, lookup: _InFlightLookup
+    ) -> LyricsResult | None:
+        """Resolve a query, recording its latency and failures."""
+        try:
+            with self._metrics.timer(LOOKUP):
+                return await self._async_resolve(key, artist, title, lookup)
+        except asyncio.TimeoutError:
+            self._metrics.error("timeout")
+            raise
+        except ClientResponseError as e:
+            self._metrics.error(f"http_{e.status}")
+            raise
+        except ClientError as e:
+            self._metrics.error(type(e).__name__)
+            raise
+
+    async def _async_resolve(
+        self,
+        key: str,
+        artist: str,
+        title: str,
+        lookup: _InFlightLookup | None = None,
+    ) -> LyricsResult | None:
+        """Search Genius for a query and cache the result."""
+        # keys of the query variants, indexed to the song they resolve to
+        keys = [key]
+
+        # clean song title to increase chance and accuracy of a result
+        cleaned_title = clean_song_title(title)
+        if cleaned_title != title:
+            _LOGGER.info(f'Media title was cleaned: "{title}"  ->  "{cleaned_title}"')
+            title = cleaned_title
+            keys.append(normalize_query(artist, title))
+
+        # the title truncated from the first hyphen, only searched when the
+        # others miss but checked in the index before any search
+        indexed_keys = keys
+        if " - " in title:
+            truncated_title = title.split(" - ", 1)[0]
+            indexed_keys = [*keys, normalize_query(artist, truncated_title)]
+
+        result = await self._async_resolve_indexed(indexed_keys, lookup)
+        if result is None:
+            result = await self._async_resolve_search(keys, artist, title, lookup)
+
+        if result is None:
+            self._miss_cache.async_record_miss(key)
+            self._metrics.increment(NOT_FOUND)
+            return None
+
+        self._cache.async_set(key, result)
+        self._miss_cache.async_clear(key)
+        self._index.async_set(keys, result)
+        return result
+
+    async def _async_resolve_indexed(
+        self, keys: list[str], lookup: _InFlightLookup | None
+    ) -> LyricsResult | None:
+        """Fetch the lyrics of a song indexed for a query, skipping the search."""
+        for key in keys:
+            if (song := self._index.async_get(key)) is not None:
+                break
+        else:
+            return None
+
+        _LOGGER.debug(f"Resolution index hit for '{key}', song {song.song_id}")
+        self._metrics.increment(INDEX_HITS)
+        if lookup is not None:
+            lookup.async_set_song(song)
+
+        try:
+            lyrics = await self._client.async_lyrics(song.url)
+        except ClientResponseError as e:
+            if e.status != 404:
+                raise
+            lyrics = None
+
+        if not lyrics:
+            # page is gone or lost its lyrics, search again
+            _LOGGER.debug(f"Dropping song {song.song_id} from the resolution index")
+            self._index.async_remove_song(song.song_id)
+            return None
+
+        with self._metrics.timer(CLEANUP):
+            return song.with_lyrics(lyrics)
+
+    async def _async_resolve_search(
+        self,
+        keys: list[str],
+        artist: str,
+        title: str,
+        lookup: _InFlightLookup | None,
+    ) -> LyricsResult | None:
+        """Search Genius for a song and fetch its lyrics."""
+        _LOGGER.info(f"Searching lyrics for artist='{artist}' and title='{title}'")
+
+        # perform search
+        song_info = await self._client.async_search_song_info(title, artist)
+
+        # second search needed?
+        if not song_info and " - " in title:
+            # aggressively truncate title from the first hyphen
+            title = title.split(" - ", 1)[0]
+            _LOGGER.info(f"Second attempt, aggressively cleaned title='{title}'")
+            keys.append(normalize_query(artist, title))
+
+            # perform search
+            song_info = await self._client.async_search_song_info(title, artist)
+
+        if not song_info:
+            return None
+
+        song = LyricsResult.from_song_info(song_info)
+        _LOGGER.debug("Found song: artist = %s, title = %s", song.artist, song.title)
+        if lookup is not None:
+            lookup.async_set_song(song)
+
+        lyrics = await self._client.async_song_lyrics(song_info)
+        # skip results when URL is a 404 or lyrics are missing
+        if not lyrics:
+            _LOGGER.debug("Specified song does not have valid lyrics, rejecting")
+            return None
+
+        # includes hack cleanup of lyrics to remove erroneous text
+        with self._metrics.timer(CLEANUP):
+            return song.with_lyrics(lyrics)
@@ -1,16 +1,69 @@
+from difflib import SequenceMatcher
+from functools import lru_cache
+import logging
+import re
+import unicodedata
+
+from bs4 import BeautifulSoup
 from lyricsgenius import Genius
-from lyricsgenius.utils import clean_str
+
+_LOGGER = logging.getLogger(__name__)
+
+# minimum score of a search hit to be taken as the searched song
+MATCH_THRESHOLD = 0.7
+# shares of the title and the artist in the score of a song
+TITLE_WEIGHT = 0.6
+ARTIST_WEIGHT = 1 - TITLE_WEIGHT
+
+# featured artists, "Title (feat. Artist)" or "Artist ft. Artist"
+_FEATURING_RE = re.compile(
+    r"(?:\s+|\s*[\(\[])(?:feat|ft|featuring)\b\.?\s.*$", re.IGNORECASE
+)
+_APOSTROPHES_RE = re.compile(r"['’`´]")
+_NON_WORD_RE = re.compile(r"[\W_]+")
 
 
 class GeniusPatched(Genius):
+    def parse_lyrics(self, html):
+        """Scrapes song lyrics from the HTML of a Genius song page.
+
+        Mirrors the parsing half of :meth:`Genius.lyrics` so that the page
+        can be downloaded elsewhere (e.g. asynchronously).
+
+        Args:
+            html (:obj:`str`): HTML of a Genius song page.
+
+        Returns:
+            :obj:`str` \\|‌ :obj:`None`:
+                :obj:`str` If it can find the lyrics, otherwise `None`
+
+        """
+        html = BeautifulSoup(html.replace("<br/>", "\n"), "html.parser")
+
+        # Determine the class of the div
+        divs = html.find_all(
+            "div", class_=re.compile(r"^Lyrics-\w{2}.\w+.[1]|Lyrics__Container")
+        )
+        if not divs:
+            return None
+
+        lyrics = "\n".join([div.get_text() for div in divs])
+
+        # Remove [Verse], [Bridge], etc.
+        if self.remove_section_headers:
+            lyrics = re.sub(r"(\[.*?\])*", "", lyrics)
+            lyrics = re.sub("\n{2}", "\n", lyrics)  # Gaps between verses
+        return lyrics.strip("\n")
+
     def _get_item_from_search_response(
         self, response, search_term, type_, result_type, artist=""
     ):
         """Gets the desired item from the search results.
 
-        This method tries to match the `hits` of the :obj:`response` to
-        the :obj:`response_term`, and if it finds no match, returns the first
-        appropriate hit if there are any.
+        Every `hits` of the :obj:`response`, across all sections, is scored
+        on its similarity to the :obj:`search_term` and, for songs, to the
+        :obj:`artist`. The best scoring hit is returned if its score reaches
+        `MATCH_THRESHOLD`.
 
         Args:
             response (:obj:`dict`): A response from
@@ -22,63 +75,130 @@ class GeniusPatched(Genius):
             artist (:obj:`str`): The name of the artist.
 
         Returns:
-            :obj:‍‍`str` \\|‌ :obj:`None`:
-            - `None` if there is no hit in the :obj:`response`.
-            - The matched result if matching succeeds.
-            - The first hit if the matching fails.
+            :obj:‍‍`dict` \\|‌ :obj:`None`:
+            - `None` if no hit scores above the threshold.
+            - The best matching hit otherwise.
 
         """
+        # normalize the query once, hits are compared to it
+        term = _MatchText(search_term, split_head=True)
+        artist_term = _MatchText(artist) if artist else None
+        skip_non_lyrics = type_ == "song" and self.skip_non_songs
+
+        best, best_score = None, MATCH_THRESHOLD
+        for item in _search_results(response, type_):
+            if skip_non_lyrics and not self._result_is_lyrics(item):
+                continue
+
+            # floors skip the costly comparisons of hits that cannot win
+            value = item.get(result_type) or ""
+            if artist_term is None:
+                score = term.score(value, best_score)
+            else:
+                title_score = term.score(
+                    value, (best_score - ARTIST_WEIGHT) / TITLE_WEIGHT
+                )
+                floor = (best_score - TITLE_WEIGHT * title_score) / ARTIST_WEIGHT
+                if floor >= 1:
+                    continue
+                score = TITLE_WEIGHT * title_score + ARTIST_WEIGHT * max(
+                    artist_term.score(name, floor) for name in _item_artists(item)
+                )
+            if score > best_score:
+                best, best_score = item, score
+                if score == 1:
+                    break
 
-        # Convert list to dictionary
-        top_hits = response["sections"][0]["hits"]
-
-        # Check rest of results if top hit wasn't the search type
-        sections = sorted(response["sections"], key=lambda sect: sect["type"] == type_)
-
-        hits = [
-            hit for hit in top_hits if hit["type"] == type_ and hit["index"] == type_
-        ]
-        hits.extend(
-            [
-                hit
-                for section in sections
-                for hit in section["hits"]
-                if hit["type"] == type_ and hit["index"] == type_
-            ]
+        if best is None:
+            return None
+
+        _LOGGER.debug(
+            f"Matched '{search_term}' to '{best.get(result_type)}', "
+            f"score {best_score:.2f}"
         )
+        return best
+
+
+class _MatchText:
+    """Normalized search term, scored against many candidates."""
+
+    __slots__ = ("text", "words", "head", "_matcher")
+
+    def __init__(self, value, split_head=False):
+        self.text = normalize_match_text(value)
+        self.words = set(self.text.split())
+        # SequenceMatcher caches details about its second sequence
+        self._matcher = SequenceMatcher(None, "", self.text)
+        # the part before " - ", metadata the title cleanup did not catch
+        self.head = None
+        if split_head:
+            head, sep, _ = value.partition(" - ")
+            if sep:
+                self.head = _MatchText(head)
+
+    def score(self, candidate, floor=0.0):
+        """Return the similarity of a candidate, from 0 to 1.
+
+        Scores at or below `floor` are not computed exactly.
+        """
+        candidate = normalize_match_text(candidate)
+        score = self._similarity(candidate, floor)
+        if self.head is not None and score < 1:
+            score = max(score, self.head._similarity(candidate, floor / 0.95) * 0.95)
+        return score
+
+    def _similarity(self, candidate, floor):
+        if candidate == self.text:
+            return 1.0
+        if not candidate or not self.text:
+            return 0.0
+
+        score = 0.0
+        # all words of one are in the other, e.g. "artist" in "artist and guest"
+        words = set(candidate.split())
+        if self.words <= words or words <= self.words:
+            score = 0.5 + 0.5 * len(self.words & words) / len(self.words | words)
+
+        # cheap upper bounds first, the full ratio is only needed if it can win
+        floor = max(score, floor)
+        matcher = self._matcher
+        matcher.set_seq1(candidate)
+        if matcher.real_quick_ratio() > floor and matcher.quick_ratio() > floor:
+            score = max(score, matcher.ratio())
+        return score
+
+
+def _search_results(response, type_):
+    """Yield the results of a type from all sections, without repeats."""
+    seen = set()
+    for section in response["sections"]:
+        for hit in section["hits"]:
+            result = hit["result"]
+            if hit["type"] != type_ or hit["index"] != type_:
+                continue
+            # the top hit is repeated in its own section
+            if result.get("id") not in seen:
+                seen.add(result.get("id"))
+                yield result
+
+
+def _item_artists(item):
+    """Return the artist names of a song hit."""
+    names = [item.get("artist_names") or ""]
+    if primary_artist := item.get("primary_artist"):
+        names.append(primary_artist.get("name") or "")
+    return names
+
+
+@lru_cache(maxsize=1024)
+def normalize_match_text(value):
+    """Normalize a title or artist for fuzzy comparison.
 
-        for hit in hits:
-            item = hit["result"]
-            if clean_str(item[result_type]) == clean_str(search_term):
-                return item
-
-        # If the desired type is song lyrics and none of the results matched,
-        # return the first result that has lyrics
-        if type_ == "song" and self.skip_non_songs:
-            for hit in hits:
-                song = hit["result"]
-                if self._result_is_lyrics(song):
-                    # if artist was supplied, compare with song artist.
-                    if len(artist):
-                        print(
-                            clean_str(song["artist_names"]), " vs ", clean_str(artist)
-                        )
-                        if clean_str(song["artist_names"]) == clean_str(
-                            artist
-                        ) or clean_str(song["artist_names"]).startswith(
-                            clean_str(artist)
-                        ):
-                            print(
-                                "match: ",
-                                clean_str(song["artist_names"]),
-                                " == ",
-                                clean_str(artist),
-                            )
-                            return song
-                        else:
-                            continue
-                    return song
-
-        # return hits[0]['result'] if hits else None
-        # No attempts above worked to find a song match
-        return None
+    Drops featured artists, accents, apostrophes and other punctuation, so
+    "Beyoncé (feat. JAY-Z)" and "beyonce" compare equal.
+    """
+    value = _FEATURING_RE.sub("", value)
+    value = unicodedata.normalize("NFKD", value)
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    value = _APOSTROPHES_RE.sub("", value.casefold().replace("&", " and "))
+    return " ".join(_NON_WORD_RE.sub(" ", value).split())
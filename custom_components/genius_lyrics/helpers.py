@@ -1,66 +1,105 @@
 """Helpers for the Genius Lyrics integration."""
 
+from __future__ import annotations
+
+from functools import lru_cache
 import logging
 import re
-
-from lyricsgenius.types import Song
+from typing import TYPE_CHECKING
 
 from homeassistant.components.media_player import DOMAIN as MP_DOMAIN
 from homeassistant.const import ATTR_RESTORED
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, split_entity_id
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from lyricsgenius.types import Song
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def clean_song_title(song_title):
-    """Clean song title string by removing metadata that may appear."""
+def normalize_query(artist: str, title: str) -> str:
+    """Return a normalized lookup key for an artist/title query."""
+    return "::".join(" ".join(value.split()).casefold() for value in (artist, title))
 
-    # Keywords to look for in parentheses, brackets, or after a hyphen
-    keywords = r"(remaster(?:ed)?|anniversary|instrumental|live|edit(?:ion)?|single(s)?|stereo|album|radio|version|feat(?:uring)?|mix|bonus)"
 
-    # Regex pattern to match metadata within parentheses or brackets
-    paren_bracket_pattern = rf"[\(\[][^\)\]]*\b({keywords})\b[^\)\]]*[\)\]]"
-    cleaned_title = re.sub(paren_bracket_pattern, "", song_title, flags=re.IGNORECASE)
+# Keywords to look for in parentheses, brackets, or after a hyphen
+_TITLE_KEYWORDS = r"(remaster(?:ed)?|anniversary|instrumental|live|edit(?:ion)?|single(s)?|stereo|album|radio|version|feat(?:uring)?|mix|bonus)"
 
-    # Regex pattern to match a hyphen followed by metadata (keywords or a year)
-    hyphen_pattern = rf"(\s*-\s*(\d{{4}}|{keywords}).*)$"
-    cleaned_title = re.sub(hyphen_pattern, "", cleaned_title, flags=re.IGNORECASE)
+# metadata within parentheses or brackets
+_TITLE_PAREN_BRACKET_RE = re.compile(
+    rf"[\(\[][^\)\]]*\b({_TITLE_KEYWORDS})\b[^\)\]]*[\)\]]", re.IGNORECASE
+)
+# a hyphen followed by metadata (keywords or a year)
+_TITLE_HYPHEN_RE = re.compile(
+    rf"(\s*-\s*(\d{{4}}|{_TITLE_KEYWORDS}).*)$", re.IGNORECASE
+)
+# dangling hyphens
+_TITLE_DANGLING_HYPHEN_RE = re.compile(r"\s*-\s*$")
+# leftover unmatched parentheses or brackets
+_TITLE_DANGLING_BRACKETS_RE = re.compile(r"\s[\(\[\{\]\)\}\s]+$")
 
-    # Remove any dangling hyphens or extra spaces
-    cleaned_title = re.sub(r"\s*-\s*$", "", cleaned_title).strip()
+# digits at beginning followed by "Contributors" and text followed by "Lyrics"
+_LYRICS_HEADER_RE = re.compile(r"^(\d+) Contributor(.*?) Lyrics", re.DOTALL)
+# end of the description blurb, "… Read More"
+_LYRICS_READ_MORE_RE = re.compile(r"…\sRead More\s")
 
-    # Remove any leftover unmatched parentheses or brackets
-    cleaned_title = re.sub(r"\s[\(\[\{\]\)\}\s]+$", "", cleaned_title).strip()
 
+@lru_cache(maxsize=512)
+def clean_song_title(song_title):
+    """Clean song title string by removing metadata that may appear."""
+    cleaned_title = _TITLE_PAREN_BRACKET_RE.sub("", song_title)
+    cleaned_title = _TITLE_HYPHEN_RE.sub("", cleaned_title)
+    cleaned_title = _TITLE_DANGLING_HYPHEN_RE.sub("", cleaned_title).strip()
+    cleaned_title = _TITLE_DANGLING_BRACKETS_RE.sub("", cleaned_title).strip()
     return cleaned_title
 
 
+@lru_cache(maxsize=128)
+def _lyrics_inline_noise_re(artist: str) -> re.Pattern[str]:
+    """Return the pattern of inline noise, which names the artist."""
+    return re.compile(
+        # "See [artist] LiveGet tickets as low as $[price]"
+        rf"See {re.escape(artist)} LiveGet tickets as low as \$\d+"
+        # "You might also like" not followed by whitespace
+        r"|You might also like(?!\s)"
+    )
+
+
 def cleanup_lyrics(song: Song) -> str:
     """Clean lyrics string hackishly remove erroneous text that may appear."""
+    return cleanup_lyrics_text(song.lyrics, song.artist, song.pyongs_count)
 
-    # Pattern1: match digits at beginning followed by "Contributors" and text followed by "Lyrics"
-    pattern1 = r"^(\d+) Contributor(.*?) Lyrics"
-    lyrics = re.sub(pattern1, "", song.lyrics, flags=re.DOTALL)
 
-    # Pattern2: match ending with "Embed"
-    lyrics = lyrics.rstrip("Embed")
+def cleanup_lyrics_text(lyrics: str, artist: str, pyongs_count: int | None) -> str:
+    """Clean scraped lyrics of a song, see `cleanup_lyrics`."""
+    # header: "[n] Contributors[...] Lyrics"
+    if match := _LYRICS_HEADER_RE.match(lyrics):
+        lyrics = lyrics[match.end() :]
 
-    # Pattern3: match ending with Pyong Count
-    lyrics = lyrics.rstrip(str(song.pyongs_count))
+    # trailer: "[pyong count]Embed"
+    if lyrics.endswith("Embed"):
+        lyrics = lyrics[: -len("Embed")]
+        if pyongs_count:
+            lyrics = lyrics.removesuffix(str(pyongs_count))
 
-    # Pattern4: match "See [artist] LiveGet tickets as low as $[price]"
-    pattern4 = rf"See {song.artist} LiveGet tickets as low as \$\d+"
-    lyrics = re.sub(pattern4, "", lyrics)
+    # description blurb ending in "… Read More", along with everything before
+    # it; scanned for the last marker rather than backtracking over the text
+    if "Read More" in lyrics:
+        match = None
+        for match in _LYRICS_READ_MORE_RE.finditer(lyrics):
+            pass
+        if match is not None:
+            lyrics = lyrics[match.end() :]
 
-    # Pattern5: match "You might also like" not followed by whitespace
-    pattern5 = r"You might also like(?!\s)"
-    lyrics = re.sub(pattern5, "", lyrics)
+    # ticket ads and recommendations, in a single pass
+    return _lyrics_inline_noise_re(artist).sub("", lyrics)
 
-    # Pattern6: match "… Read More" section
-    pattern6 = r"(^.*\n*)?(.*…\sRead More\s)"
-    lyrics = re.sub(pattern6, "", lyrics, flags=re.DOTALL)
 
-    return lyrics
+def get_lyrics_sensor_unique_id(media_entity_id: str) -> str:
+    """Return the unique id of the lyrics sensor of a media player."""
+    return "_".join([DOMAIN, split_entity_id(media_entity_id)[1], "sensor", "lyrics"])
 
 
 def get_media_player_entities(hass: HomeAssistant, ignore_restored: bool = True):
@@ -0,0 +1,372 @@
+"""Lyrics from a local music library for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime
+import hashlib
+import logging
+import os
+import re
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOCAL_RESCAN_INTERVAL
+from .helpers import clean_song_title, normalize_query
+from .models import LyricsResult
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# kinds of lyrics, by order of preference when a song has several
+LRC = "lrc"
+TXT = "txt"
+TAG = "tag"
+_KIND_PRIORITY = {LRC: 0, TXT: 1, TAG: 2}
+
+_AUDIO_SUFFIXES = (".flac", ".m4a", ".mp3", ".ogg", ".opus")
+_LYRICS_SUFFIXES = (".lrc", ".txt")
+
+# "[mm:ss.xx]" line timestamps and "[ar:Artist]" id tags of LRC files
+_LRC_TIMESTAMP_RE = re.compile(r"\[(\d+):(\d+(?:[.:]\d+)?)\]")
+_LRC_TAG_RE = re.compile(r"^\[([a-z]+):(.*)\]$", re.IGNORECASE)
+# "Artist - Title" file names
+_ARTIST_TITLE_RE = re.compile(r"^(?P<artist>.+?) - (?P<title>.+)$")
+# leading track number, "01 Title", "01. Title" or "01 - Title"
+_TRACK_NUMBER_RE = re.compile(r"^\d{1,3}(?:\s*[.-]\s*|\s+)")
+
+
+def local_song_id(path: str) -> int:
+    """Return the song id of a library file.
+
+    Negative, so it never collides with Genius song ids, and below 2**53 so
+    it survives the trip through JavaScript.
+    """
+    return -int(hashlib.sha1(path.encode()).hexdigest()[:13], 16)
+
+
+def parse_lrc(text: str) -> tuple[dict[str, str], list[tuple[float, str]]]:
+    """Return the id tags and the timed lines of LRC lyrics, sorted by time."""
+    tags: dict[str, str] = {}
+    lines: list[tuple[float, str]] = []
+    for line in text.splitlines():
+        line = line.strip()
+        timestamps = []
+        pos = 0
+        # a repeated line can carry several timestamps
+        while match := _LRC_TIMESTAMP_RE.match(line, pos):
+            minutes, seconds = match.groups()
+            timestamps.append(int(minutes) * 60 + float(seconds.replace(":", ".")))
+            pos = match.end()
+        if timestamps:
+            lines.extend((timestamp, line[pos:].strip()) for timestamp in timestamps)
+        elif match := _LRC_TAG_RE.match(line):
+            tags[match[1].lower()] = match[2].strip()
+
+    lines.sort(key=lambda timed_line: timed_line[0])
+    return tags, lines
+
+
+def _first(values: Any) -> str | None:
+    """Return the first non-empty value of a tag."""
+    for value in values or ():
+        if value := str(value).strip():
+            return value
+    return None
+
+
+def _read_audio_tags(path: str) -> tuple[str | None, str | None, str | None]:
+    """Return the artist, title and embedded lyrics of an audio file."""
+    try:
+        # optional, installed along with Home Assistant's tts integration
+        import mutagen
+    except ImportError:
+        return None, None, None
+
+    try:
+        audio = mutagen.File(path)
+    except (mutagen.MutagenError, OSError) as e:
+        _LOGGER.debug(f"Unable to read tags of {path}, err: {e}")
+        return None, None, None
+    if audio is None or audio.tags is None:
+        return None, None, None
+
+    tags = audio.tags
+    # ID3 frames are keyed with their description, e.g. "USLT::eng"
+    if hasattr(tags, "getall"):
+        return tuple(_first(tags.getall(key)) for key in ("TPE1", "TIT2", "USLT"))
+
+    def get(*keys: str) -> str | None:
+        return _first(next((tags[key] for key in keys if key in tags), None))
+
+    return (
+        get("©ART", "artist"),
+        get("©nam", "title"),
+        get("©lyr", "lyrics", "unsyncedlyrics"),
+    )
+
+
+def _sidecar_names(path: str) -> tuple[str | None, str | None]:
+    """Return the artist and title of a lyrics file from its audio file."""
+    stem = os.path.splitext(path)[0]
+    audio_path = next(
+        (stem + suffix for suffix in _AUDIO_SUFFIXES if os.path.isfile(stem + suffix)),
+        None,
+    )
+    if audio_path is None:
+        return None, None
+
+    artist, title, _ = _read_audio_tags(audio_path)
+    if artist and title:
+        return artist, title
+
+    # "<artist>/<album>/<nn title>.<ext>" library layout
+    parts = os.path.normpath(stem).split(os.sep)
+    if len(parts) < 3:
+        return None, None
+    return parts[-3], _TRACK_NUMBER_RE.sub("", parts[-1])
+
+
+def _index_file(path: str, suffix: str) -> tuple[str | None, str | None, str | None]:
+    """Return the kind of lyrics, artist and title of a library file."""
+    if suffix in _AUDIO_SUFFIXES:
+        artist, title, lyrics = _read_audio_tags(path)
+        return (TAG if lyrics else None), artist, title
+
+    artist = title = None
+    kind = LRC if suffix == ".lrc" else TXT
+    if kind == LRC:
+        with open(path, encoding="utf-8", errors="replace") as file:
+            tags, _ = parse_lrc(file.read())
+        artist, title = tags.get("ar"), tags.get("ti")
+
+    if not artist or not title:
+        artist, title = _sidecar_names(path)
+    if not artist or not title:
+        name = os.path.splitext(os.path.basename(path))[0]
+        if match := _ARTIST_TITLE_RE.match(name):
+            artist, title = match["artist"], match["title"]
+    if not artist or not title:
+        return None, None, None
+    return kind, artist, title
+
+
+def _walk(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield the lyrics and audio files below a directory."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError as e:
+        _LOGGER.debug(f"Unable to list {root}, err: {e}")
+        return
+
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk(entry.path)
+        elif entry.name.lower().endswith(_LYRICS_SUFFIXES + _AUDIO_SUFFIXES):
+            yield entry
+
+
+def _scan(
+    root: str, files: dict[str, list[Any]], skipped: dict[str, list[int]]
+) -> tuple[dict[str, list[Any]], dict[str, list[int]], int]:
+    """Index a library, re-reading only files that are new or modified.
+
+    `files` maps paths relative to `root` of files with lyrics to their
+    modification time, size, kind of lyrics, artist and title. `skipped` maps
+    the other files to their modification time and size, so they are not read
+    again either. Returns both updated mappings and the number of files read.
+    """
+    scanned: dict[str, list[Any]] = {}
+    scanned_skipped: dict[str, list[int]] = {}
+    read = 0
+    for entry in _walk(root):
+        path = os.path.relpath(entry.path, root)
+        try:
+            stat = entry.stat()
+            version = [stat.st_mtime_ns, stat.st_size]
+            known = files.get(path)
+            if known is not None and known[:2] == version:
+                scanned[path] = known
+                continue
+            if skipped.get(path) == version:
+                scanned_skipped[path] = version
+                continue
+
+            suffix = os.path.splitext(entry.name)[1].lower()
+            kind, artist, title = _index_file(entry.path, suffix)
+        except OSError as e:
+            _LOGGER.debug(f"Unable to index {entry.path}, err: {e}")
+            continue
+        read += 1
+        if kind is None:
+            scanned_skipped[path] = version
+        else:
+            scanned[path] = [*version, kind, artist, title]
+
+    return scanned, scanned_skipped, read
+
+
+def _read_lyrics(path: str, kind: str) -> tuple[str | None, list[float] | None]:
+    """Return the lyrics text of a library file and its line offsets, if timed."""
+    if kind == TAG:
+        return _read_audio_tags(path)[2], None
+
+    with open(path, encoding="utf-8", errors="replace") as file:
+        text = file.read()
+    if kind == LRC:
+        _, lines = parse_lrc(text)
+        if lines:
+            # one text line per offset, blank lines included
+            return "\n".join(line for _, line in lines), [offset for offset, _ in lines]
+        # no timestamps, plain lyrics with id tags
+        text = "\n".join(
+            line for line in text.splitlines() if not _LRC_TAG_RE.match(line.strip())
+        )
+    return text.strip(), None
+
+
+class LocalLyricsProvider:
+    """Lyrics files and embedded lyrics tags of a local music library.
+
+    The files with lyrics are indexed into storage. Home Assistant offers no
+    file watching, so the library is polled every `LOCAL_RESCAN_INTERVAL`:
+    rescans stat its files and re-read only the new or modified ones. Lookups
+    match the normalized query in memory and read a single file, without any
+    network I/O.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, root: str) -> None:
+        """Initialize the provider."""
+        self._hass = hass
+        self._entry = entry
+        self._root = root
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.local_lyrics"
+        )
+        self._scan_lock = asyncio.Lock()
+        self._files: dict[str, list[Any]] = {}
+        # files without lyrics, not stored, read again after a restart
+        self._skipped: dict[str, list[int]] = {}
+        self._by_key: dict[str, str] = {}
+        self._by_id: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed songs."""
+        return len(self._by_id)
+
+    async def async_setup(self) -> None:
+        """Load the stored index and keep it up to date in the background."""
+        data = await self._store.async_load()
+        if data and data.get("root") == self._root:
+            self._files = data["files"]
+            self._async_update_keys()
+            _LOGGER.debug(f"Loaded {len(self)} local songs from {self._root}")
+
+        self._async_start_scan()
+        self._entry.async_on_unload(
+            async_track_time_interval(
+                self._hass, self._async_scheduled_scan, LOCAL_RESCAN_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_scheduled_scan(self, _now: datetime) -> None:
+        self._async_start_scan()
+
+    @callback
+    def _async_start_scan(self) -> None:
+        """Update the index in the background, unless already updating."""
+        if not self._scan_lock.locked():
+            self._entry.async_create_background_task(
+                self._hass, self.async_scan(), f"{DOMAIN} local lyrics scan"
+            )
+
+    async def async_scan(self) -> None:
+        """Update the index with the files changed since the last scan."""
+        async with self._scan_lock:
+            files, self._skipped, read = await self._hass.async_add_executor_job(
+                _scan, self._root, self._files, self._skipped
+            )
+            if files == self._files:
+                return
+
+            self._files = files
+            self._async_update_keys()
+            _LOGGER.debug(
+                f"Indexed {read} new or modified files, {len(self)} local songs"
+            )
+            await self._store.async_save({"root": self._root, "files": files})
+
+    @callback
+    def _async_update_keys(self) -> None:
+        """Map query keys to the preferred file of every indexed song."""
+        by_key: dict[str, str] = {}
+        for path, (_, _, kind, artist, title) in self._files.items():
+            for key in {
+                normalize_query(artist, title),
+                normalize_query(artist, clean_song_title(title)),
+            }:
+                known = by_key.get(key)
+                if known is None or (
+                    _KIND_PRIORITY[kind] < _KIND_PRIORITY[self._files[known][2]]
+                ):
+                    by_key[key] = path
+
+        self._by_key = by_key
+        self._by_id = {local_song_id(path): path for path in set(by_key.values())}
+
+    @callback
+    def async_has(self, artist: str, title: str) -> bool:
+        """Return True if the library has lyrics for a query."""
+        return self._async_find(artist, title) is not None
+
+    @callback
+    def _async_find(self, artist: str, title: str) -> str | None:
+        """Return the library file with lyrics for a query."""
+        return self._by_key.get(normalize_query(artist, title)) or self._by_key.get(
+            normalize_query(artist, clean_song_title(title))
+        )
+
+    async def async_fetch(self, artist: str, title: str) -> LyricsResult | None:
+        """Return lyrics for a query from the library, or None."""
+        if (path := self._async_find(artist, title)) is None:
+            return None
+        return await self._async_read(path)
+
+    async def async_get_song(self, song_id: int) -> LyricsResult | None:
+        """Return lyrics of a library song by id, or None."""
+        if (path := self._by_id.get(song_id)) is None:
+            return None
+        return await self._async_read(path)
+
+    async def _async_read(self, path: str) -> LyricsResult | None:
+        """Read the lyrics of a library file."""
+        _, _, kind, artist, title = self._files[path]
+        try:
+            lyrics, line_offsets = await self._hass.async_add_executor_job(
+                _read_lyrics, os.path.join(self._root, path), kind
+            )
+        except OSError as e:
+            # removed since the last scan
+            _LOGGER.debug(f"Unable to read local lyrics {path}, err: {e}")
+            return None
+        if not lyrics:
+            return None
+
+        _LOGGER.debug(f"Local lyrics found for '{artist} - {title}': {path}")
+        return LyricsResult(
+            song_id=local_song_id(path),
+            url="",
+            artist=artist,
+            title=title,
+            lyrics=lyrics,
+            line_offsets=line_offsets,
+        )
@@ -0,0 +1,165 @@
+"""Runtime metrics of the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+from typing import Any
+
+# upper bounds of the latency buckets, in milliseconds
+LATENCY_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# histograms
+SEARCH = "search"
+PAGE_FETCH = "page_fetch"
+RATE_LIMIT_WAIT = "rate_limit_wait"
+CLEANUP = "cleanup"
+LOOKUP = "lookup"
+STATE_WRITE = "state_write"
+SETUP = "setup"
+SCRAPER_LOAD = "scraper_load"
+QUEUE_WAIT = "queue_wait"
+
+# counters
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+MISS_CACHE_HITS = "miss_cache_hits"
+INDEX_HITS = "index_hits"
+LOCAL_HITS = "local_hits"
+COALESCED = "coalesced"
+CANCELLED = "cancelled"
+NOT_FOUND = "not_found"
+RETRIES = "retries"
+THROTTLED = "throttled"
+SERVICE_CALLS = "service_calls"
+ERRORS = "errors"
+
+# gauges
+QUEUE_DEPTH = "queue_depth"
+FETCH_RUNNING = "fetch_running"
+
+
+class LatencyHistogram:
+    """Latency distribution in fixed millisecond buckets."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # one extra bucket for everything above the last bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration."""
+        ms = seconds * 1000
+        self.buckets[bisect_left(LATENCY_BUCKETS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration in milliseconds."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the bucket bound below which `percent` of durations fall."""
+        if not self.count:
+            return None
+
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable summary."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": self.max,
+            "buckets": {
+                **{f"le_{bound}": n for bound, n in zip(LATENCY_BUCKETS, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+        }
+
+
+class LyricsMetrics:
+    """Counters and latency histograms of an entry's lookup path.
+
+    Recording is kept to a dict update so it can sit on the hot path;
+    diagnostic sensors read the figures on their own polling interval.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.started = time.time()
+        self.counters: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.gauges: dict[str, float] = {}
+
+    def increment(self, name: str, count: int = 1) -> None:
+        """Increase a counter."""
+        self.counters[name] += count
+
+    def error(self, kind: str) -> None:
+        """Count a failed lookup by type of error."""
+        self.errors[kind] += 1
+        self.counters[ERRORS] += 1
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of a gauge."""
+        self.gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration in a histogram."""
+        if (histogram := self.histograms.get(name)) is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of a block, whether or not it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Return a histogram, empty if nothing was recorded yet."""
+        return self.histograms.get(name) or LatencyHistogram()
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of lookups answered by the lyrics cache, in percent."""
+        hits = self.counters[CACHE_HITS]
+        total = hits + self.counters[CACHE_MISSES]
+        return round(hits / total * 100, 1) if total else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable snapshot."""
+        return {
+            "since": self.started,
+            "counters": dict(self.counters),
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "errors": dict(self.errors),
+            "gauges": dict(self.gauges),
+            "latency": {
+                name: histogram.as_dict()
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
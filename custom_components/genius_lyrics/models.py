@@ -0,0 +1,126 @@
+"""Data models for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, replace
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.media_player import ATTR_MEDIA_ARTIST, ATTR_MEDIA_TITLE
+from homeassistant.helpers.restore_state import ExtraStoredData
+
+from .const import (
+    ATTR_MEDIA_IMAGE,
+    ATTR_MEDIA_LYRICS,
+    ATTR_MEDIA_PYONG_COUNT,
+    ATTR_MEDIA_STATS_HOT,
+    ATTR_LYRICS_HASH,
+    ATTR_SONG_ID,
+)
+from .helpers import cleanup_lyrics, cleanup_lyrics_text
+
+if TYPE_CHECKING:
+    from lyricsgenius.types import Song
+
+
+@dataclass(slots=True)
+class LyricsResult:
+    """A resolved Genius song with its cleaned lyrics."""
+
+    song_id: int
+    url: str
+    artist: str
+    title: str
+    lyrics: str
+    image: str | None = None
+    pyongs_count: int | None = None
+    stats_hot: bool | None = None
+    # start of every lyrics line in seconds, sorted, for time-synced lyrics
+    line_offsets: list[float] | None = None
+
+    @classmethod
+    def from_song(cls, song: Song) -> LyricsResult:
+        """Build a result from a lyricsgenius song, cleaning its lyrics."""
+        return cls(
+            song_id=song.id,
+            url=song.url,
+            artist=song.artist,
+            title=song.title,
+            lyrics=cleanup_lyrics(song),
+            image=song.song_art_image_thumbnail_url,
+            pyongs_count=song.pyongs_count,
+            stats_hot=getattr(song.stats, "hot", None),
+        )
+
+    @classmethod
+    def from_song_info(cls, song_info: dict[str, Any]) -> LyricsResult:
+        """Build a result without lyrics from a song found on the API."""
+        return cls(
+            song_id=song_info["id"],
+            url=song_info["url"],
+            artist=song_info["primary_artist"]["name"],
+            title=song_info["title"],
+            lyrics="",
+            image=song_info.get("song_art_image_thumbnail_url"),
+            pyongs_count=song_info.get("pyongs_count"),
+            stats_hot=(song_info.get("stats") or {}).get("hot"),
+        )
+
+    def with_lyrics(self, lyrics: str) -> LyricsResult:
+        """Return a copy of the result with freshly scraped lyrics, cleaned."""
+        return replace(
+            self,
+            lyrics=cleanup_lyrics_text(lyrics, self.artist, self.pyongs_count),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LyricsResult:
+        """Restore a result from its stored representation."""
+        return cls(**data)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        return asdict(self)
+
+    @property
+    def lyrics_hash(self) -> str:
+        """Return a short digest identifying the lyrics text."""
+        return hashlib.sha1(self.lyrics.encode()).hexdigest()[:16]
+
+    def as_attributes(self) -> dict[str, Any]:
+        """Return the media attributes exposed on entities.
+
+        Lyrics are left out, they are served by song id over the websocket API.
+        """
+        return {
+            ATTR_MEDIA_ARTIST: self.artist,
+            ATTR_MEDIA_TITLE: self.title,
+            ATTR_MEDIA_LYRICS: None,
+            ATTR_MEDIA_IMAGE: self.image,
+            ATTR_MEDIA_PYONG_COUNT: self.pyongs_count,
+            ATTR_MEDIA_STATS_HOT: self.stats_hot,
+            ATTR_SONG_ID: self.song_id,
+            ATTR_LYRICS_HASH: self.lyrics_hash,
+        }
+
+
+@dataclass(slots=True)
+class RestoredSong(ExtraStoredData):
+    """The song a lyrics sensor resolved, kept across restarts."""
+
+    # normalized query of the track, see `helpers.normalize_query`
+    query: str
+    # None when no lyrics were found
+    song_id: int | None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RestoredSong | None:
+        """Restore the song from its stored representation."""
+        try:
+            return cls(query=data["query"], song_id=data["song_id"])
+        except KeyError:
+            return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        return asdict(self)
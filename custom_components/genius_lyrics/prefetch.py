@@ -0,0 +1,188 @@
+"""Speculative prefetch of upcoming tracks for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from aiohttp import ClientError
+
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_ARTIST,
+    ATTR_MEDIA_CONTENT_TYPE,
+    ATTR_MEDIA_TITLE,
+    MediaType,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.entity_registry as er
+from homeassistant.helpers.event import EventStateChangedData
+
+from .const import DOMAIN, PREFETCH_DELAY, QUEUE_ATTRIBUTES
+from .fetcher import LyricsFetcher
+from .scheduler import PRIORITY_BACKGROUND
+
+_LOGGER = logging.getLogger(__name__)
+
+MUSIC_ASSISTANT_DOMAIN = "music_assistant"
+SERVICE_GET_QUEUE = "get_queue"
+
+
+def _track_from_item(item: Any) -> tuple[str, str] | None:
+    """Return (artist, title) of a queue item, if it names both."""
+    if not isinstance(item, dict):
+        return None
+
+    # Music Assistant queue items nest the track under "media_item"
+    media_item = item.get("media_item")
+    if isinstance(media_item, dict):
+        artists = media_item.get("artists") or []
+        if artists and isinstance(artists[0], dict):
+            artist = artists[0].get("name")
+        else:
+            artist = None
+        title = media_item.get("name")
+    else:
+        artist = item.get(ATTR_MEDIA_ARTIST) or item.get("artist")
+        title = item.get(ATTR_MEDIA_TITLE) or item.get("title")
+
+    if not artist or not title:
+        return None
+    return artist, title
+
+
+def get_queue_tracks(state: State, count: int) -> list[tuple[str, str]]:
+    """Return up to `count` tracks following the current one in a queue attribute."""
+    for attribute in QUEUE_ATTRIBUTES:
+        queue = state.attributes.get(attribute)
+        if isinstance(queue, list) and queue:
+            break
+    else:
+        return []
+
+    tracks = [track for item in queue if (track := _track_from_item(item))]
+
+    # continue after the current track, if it is listed
+    current_title = state.attributes.get(ATTR_MEDIA_TITLE)
+    for index, (_, title) in enumerate(tracks):
+        if title == current_title:
+            tracks = tracks[index + 1 :]
+            break
+
+    return tracks[:count]
+
+
+class LyricsPrefetcher:
+    """Warm the lyrics cache with the upcoming tracks of monitored players.
+
+    Lookups run in the background one at a time, after a short delay so the
+    lookup of the track that just started playing goes first.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        fetcher: LyricsFetcher,
+        count: int,
+    ) -> None:
+        """Initialize the prefetcher."""
+        self._hass = hass
+        self._entry = entry
+        self._fetcher = fetcher
+        self._count = count
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._current: dict[str, tuple[Any, Any]] = {}
+
+    @callback
+    def async_handle_state_change(self, event: EventStateChangedData) -> None:
+        """Schedule a prefetch when a monitored player changes track."""
+        if self._count <= 0:
+            return
+
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        if new_state is None or new_state.attributes.get(
+            ATTR_MEDIA_CONTENT_TYPE
+        ) not in (MediaType.MUSIC, MediaType.PLAYLIST):
+            return
+
+        track = (
+            new_state.attributes.get(ATTR_MEDIA_ARTIST),
+            new_state.attributes.get(ATTR_MEDIA_TITLE),
+        )
+        if track == self._current.get(entity_id):
+            return
+        self._current[entity_id] = track
+
+        # the previous track's upcoming list is stale now
+        if (task := self._tasks.pop(entity_id, None)) is not None:
+            task.cancel()
+
+        task = self._entry.async_create_background_task(
+            self._hass,
+            self._async_prefetch(entity_id, new_state),
+            f"{DOMAIN} prefetch for {entity_id}",
+        )
+        self._tasks[entity_id] = task
+        task.add_done_callback(lambda _: self._async_task_done(entity_id, task))
+
+    @callback
+    def async_forget(self, entity_id: str) -> None:
+        """Stop prefetching for a player that is no longer monitored."""
+        self._current.pop(entity_id, None)
+        if (task := self._tasks.pop(entity_id, None)) is not None:
+            task.cancel()
+
+    @callback
+    def _async_task_done(self, entity_id: str, task: asyncio.Task) -> None:
+        """Forget a finished prefetch unless it was already replaced."""
+        if self._tasks.get(entity_id) is task:
+            del self._tasks[entity_id]
+
+    async def _async_get_upcoming(self, state: State) -> list[tuple[str, str]]:
+        """Return the upcoming tracks of a player."""
+        if tracks := get_queue_tracks(state, self._count):
+            return tracks
+
+        entity_entry = er.async_get(self._hass).async_get(state.entity_id)
+        if (
+            entity_entry is None
+            or entity_entry.platform != MUSIC_ASSISTANT_DOMAIN
+            or not self._hass.services.has_service(
+                MUSIC_ASSISTANT_DOMAIN, SERVICE_GET_QUEUE
+            )
+        ):
+            return []
+
+        try:
+            response = await self._hass.services.async_call(
+                MUSIC_ASSISTANT_DOMAIN,
+                SERVICE_GET_QUEUE,
+                {"entity_id": state.entity_id},
+                blocking=True,
+                return_response=True,
+            )
+        except HomeAssistantError as e:
+            _LOGGER.debug(f"Unable to get queue of {state.entity_id}: {e}")
+            return []
+
+        queue = (response or {}).get(state.entity_id) or {}
+        track = _track_from_item(queue.get("next_item"))
+        return [track] if track else []
+
+    async def _async_prefetch(self, entity_id: str, state: State) -> None:
+        """Resolve the upcoming tracks of a player into the lyrics cache."""
+        await asyncio.sleep(PREFETCH_DELAY)
+
+        for artist, title in await self._async_get_upcoming(state):
+            _LOGGER.debug(f"Prefetching lyrics for '{artist} - {title}'")
+            try:
+                await self._fetcher.async_fetch(
+                    artist, title, priority=PRIORITY_BACKGROUND
+                )
+            except (asyncio.TimeoutError, ClientError) as e:
+                _LOGGER.debug(f"Prefetch for {entity_id} stopped, err: {e}")
+                return
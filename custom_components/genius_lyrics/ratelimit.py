@@ -0,0 +1,69 @@
+"""Rate limiting of Genius traffic."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import time
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds requested by a Retry-After header."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """Token bucket allowing `burst` requests at once and `rate` per second after.
+
+    Waiters are served in arrival order. The bucket can be blocked for a
+    period of time, e.g. to honor a Retry-After response header.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket, full."""
+        self._rate = rate
+        self._burst = max(burst, 1)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def block(self, seconds: float) -> None:
+        """Hold back all requests for a number of seconds."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        # resume with a single request, then refill at the sustained rate
+        self._tokens = 1.0
+        self._updated = self._blocked_until
@@ -0,0 +1,156 @@
+"""Prioritized scheduling of lookups for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import heapq
+from itertools import count
+import logging
+import time
+from typing import TypeVar
+
+from homeassistant.components.media_player import MediaPlayerState
+from homeassistant.core import State, callback
+
+from .const import DEFAULT_FETCH_WORKERS
+from .metrics import FETCH_RUNNING, QUEUE_DEPTH, QUEUE_WAIT, LyricsMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# priority classes, lowest first
+PRIORITY_INTERACTIVE = 0  # service calls and the card
+PRIORITY_PLAYING = 1  # sensors of playing players
+PRIORITY_IDLE = 2  # sensors of paused or idle players
+PRIORITY_BACKGROUND = 3  # prefetching and batch searches
+
+
+def sensor_priority(state: State | None) -> int:
+    """Return the priority of a sensor's lookup by the state of its player."""
+    if state is not None and state.state in (
+        MediaPlayerState.PLAYING,
+        MediaPlayerState.BUFFERING,
+    ):
+        return PRIORITY_PLAYING
+    return PRIORITY_IDLE
+
+
+class FetchTicket:
+    """A lookup waiting for a worker of the scheduler."""
+
+    __slots__ = ("priority", "order", "queued_at", "future")
+
+    def __init__(self, priority: int, order: int) -> None:
+        self.priority = priority
+        self.order = order
+        self.queued_at = time.perf_counter()
+        # resolved once a worker is handed over
+        self.future: asyncio.Future[None] | None = None
+
+
+class FetchScheduler:
+    """Run the lookups of an entry on a bounded number of workers.
+
+    Lookups beyond `workers` wait in a queue ordered by priority class, then
+    by arrival, so a service call or the player someone listens to is not
+    held up by prefetching. The parsing each lookup hands to the executor is
+    bounded by the same workers. Queue depth, running lookups and the time
+    spent waiting are recorded in the entry's metrics.
+    """
+
+    def __init__(
+        self, metrics: LyricsMetrics, workers: int = DEFAULT_FETCH_WORKERS
+    ) -> None:
+        """Initialize the scheduler."""
+        self._metrics = metrics
+        self._workers = workers
+        self._running = 0
+        # [priority, order, ticket], stale once the ticket was promoted
+        self._queue: list[list] = []
+        self._waiting: set[FetchTicket] = set()
+        self._order = count()
+        self._async_update_gauges()
+
+    def __len__(self) -> int:
+        """Return the number of waiting lookups."""
+        return len(self._waiting)
+
+    @property
+    def running(self) -> int:
+        """Return the number of running lookups."""
+        return self._running
+
+    @callback
+    def async_ticket(self, priority: int) -> FetchTicket:
+        """Return a ticket to run a lookup with."""
+        return FetchTicket(priority, next(self._order))
+
+    @callback
+    def async_promote(self, ticket: FetchTicket, priority: int) -> None:
+        """Raise the priority of a lookup, e.g. when a player joined it."""
+        if priority >= ticket.priority:
+            return
+        ticket.priority = priority
+        if ticket in self._waiting:
+            heapq.heappush(self._queue, [priority, ticket.order, ticket])
+
+    async def async_run(
+        self, ticket: FetchTicket, job: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a lookup once a worker is free and its turn has come."""
+        await self._async_acquire(ticket)
+        try:
+            return await job()
+        finally:
+            self._async_release()
+
+    async def _async_acquire(self, ticket: FetchTicket) -> None:
+        """Wait for a worker."""
+        if self._running < self._workers and not self._waiting:
+            self._async_start(ticket)
+            return
+
+        ticket.future = asyncio.get_running_loop().create_future()
+        self._waiting.add(ticket)
+        heapq.heappush(self._queue, [ticket.priority, ticket.order, ticket])
+        self._async_update_gauges()
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            if ticket.future.done() and not ticket.future.cancelled():
+                # handed a worker it will not use
+                self._async_release()
+            else:
+                self._waiting.discard(ticket)
+                self._async_update_gauges()
+            raise
+
+    @callback
+    def _async_start(self, ticket: FetchTicket) -> None:
+        """Hand a worker to a lookup."""
+        self._running += 1
+        self._metrics.observe(QUEUE_WAIT, time.perf_counter() - ticket.queued_at)
+        self._async_update_gauges()
+
+    @callback
+    def _async_release(self) -> None:
+        """Hand the worker of a finished lookup to the next one in line."""
+        self._running -= 1
+        while self._queue and self._running < self._workers:
+            priority, _, ticket = heapq.heappop(self._queue)
+            if ticket not in self._waiting or priority != ticket.priority:
+                # cancelled, or queued again with a higher priority
+                continue
+            self._waiting.remove(ticket)
+            self._async_start(ticket)
+            ticket.future.set_result(None)
+        if not self._waiting:
+            self._queue.clear()
+        self._async_update_gauges()
+
+    @callback
+    def _async_update_gauges(self) -> None:
+        self._metrics.set_gauge(QUEUE_DEPTH, len(self._waiting))
+        self._metrics.set_gauge(FETCH_RUNNING, self._running)
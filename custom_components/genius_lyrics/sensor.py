@@ -1,14 +1,14 @@
 """Support for Genius Lyrics sensors."""
 
 import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
 import logging
-import threading
+from typing import Any
 
-from requests.exceptions import (
-    ConnectionError as RequestsConnectionError,
-    HTTPError,
-    Timeout,
-)
+from aiohttp import ClientError
 
 from homeassistant.components.media_player import (
     ATTR_MEDIA_ARTIST,
@@ -18,60 +18,159 @@ from homeassistant.components.media_player import (
     MediaType,
     MediaPlayerState,
 )
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_ENTITIES,
     EVENT_HOMEASSISTANT_STARTED,
+    PERCENTAGE,
     STATE_OFF,
     STATE_ON,
+    EntityCategory,
+    Platform,
+    UnitOfTime,
 )
-from homeassistant.core import CoreState, HomeAssistant, State
+from homeassistant.core import CoreState, HomeAssistant, State, callback
 from homeassistant.helpers.config_validation import split_entity_id
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+import homeassistant.helpers.entity_registry as er
 from homeassistant.helpers.event import (
     EventStateChangedData,
+    async_call_later,
     async_track_state_change_event,
 )
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 
 from .const import (
     ATTR_MEDIA_IMAGE,
     ATTR_MEDIA_LYRICS,
     ATTR_MEDIA_PYONG_COUNT,
     ATTR_MEDIA_STATS_HOT,
+    ATTR_LYRICS_HASH,
+    ATTR_LYRICS_STATUS,
+    ATTR_SONG_ID,
     ATTRIBUTION,
     CONF_MONITOR_ALL,
+    DATA_FETCHER,
+    DATA_LINE_TRACKERS,
+    DATA_LYRICS_SENSORS,
+    DATA_METRICS,
+    DATA_PREFETCHER,
     DOMAIN,
-    FETCH_RETRIES,
     INTEGRATION_NAME,
+    LYRICS_NOT_FOUND,
+    LYRICS_STATUS_LOADED,
+    LYRICS_STATUS_LOADING,
+    SIGNAL_ADD_SENSOR,
+    SIGNAL_REMOVE_SENSOR,
+    TRACK_SETTLE_DELAY,
+)
+from .fetcher import LyricsFetcher
+from .helpers import (
+    get_lyrics_sensor_unique_id,
+    get_media_player_entities,
+    normalize_query,
+)
+from .metrics import (
+    CANCELLED,
+    CLEANUP,
+    ERRORS,
+    FETCH_RUNNING,
+    LOOKUP,
+    PAGE_FETCH,
+    QUEUE_DEPTH,
+    QUEUE_WAIT,
+    RETRIES,
+    SEARCH,
+    STATE_WRITE,
+    THROTTLED,
+    LyricsMetrics,
 )
-from .genius import GeniusPatched
-from .helpers import clean_song_title, cleanup_lyrics, get_media_player_entities
+from .models import LyricsResult, RestoredSong
+from .prefetch import LyricsPrefetcher
+from .scheduler import sensor_priority
+from .synced import LineTracker
+from .warmup import WarmUpQueue
 
 _LOGGER = logging.getLogger(__name__)
 
+# refresh interval of the metric sensors, lyrics sensors are push based
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+def _relevant_state(state: State | None) -> tuple | None:
+    """Return the parts of a media player state that affect the lyrics."""
+    if state is None:
+        return None
+    return (
+        state.state,
+        state.attributes.get(ATTR_MEDIA_CONTENT_TYPE),
+        state.attributes.get(ATTR_MEDIA_ARTIST),
+        state.attributes.get(ATTR_MEDIA_TITLE),
+    )
+
+
+class GeniusLyricsSensor(SensorEntity, RestoreEntity):
+    """Representation of a Genius Lyrics Sensor.
 
-class GeniusLyricsSensor(SensorEntity):
-    """Representation of a Genius Lyrics Sensor."""
+    The resolved song is restored after a restart, so a player still on the
+    same track gets its lyrics back from the cache without any lookup.
+    """
 
     _attr_attribution = ATTRIBUTION
     _attr_icon = "mdi:script-text"
-    _attr_extra_state_attributes = {}
     _attr_should_poll = False
     _attr_has_entity_name = True
     _attr_translation_key = "lyrics"
-
-    def __init__(self, entry: ConfigEntry, media_entity_id) -> None:
-        """Initialize the sensor."""
+    # lyrics themselves are served by song id, see websocket.py
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_MEDIA_LYRICS,
+            ATTR_MEDIA_IMAGE,
+            ATTR_MEDIA_PYONG_COUNT,
+            ATTR_MEDIA_STATS_HOT,
+            ATTR_LYRICS_HASH,
+            ATTR_LYRICS_STATUS,
+        }
+    )
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        media_entity_id,
+        fetcher: LyricsFetcher,
+        metrics: LyricsMetrics,
+        line_tracker: LineTracker,
+        warm_up: WarmUpQueue | None = None,
+    ) -> None:
+        """Initialize the sensor.
+
+        The initial lookup of sensors created at startup waits in `warm_up`.
+        """
         self._entry = entry
-        self._genius = GeniusPatched(
-            "public", skip_non_songs=True, retries=FETCH_RETRIES
-        )
+        self._fetcher = fetcher
+        self._metrics = metrics
+        # active line of time-synced lyrics, served over the websocket API
+        self._line_tracker = line_tracker
+        self._warm_up = warm_up
+        self._attr_extra_state_attributes = {}
         self._media_player_id = media_entity_id
 
-        # guard against concurrent fetches
-        self._lock = threading.Lock()
+        # in-flight fetch, replaced by the fetch of a newer track
+        self._fetch_task: asyncio.Task | None = None
+        # bumped on every track change, outdated fetches drop their result
+        self._generation = 0
+
+        # pending lookup, started once the track settles
+        self._cancel_settle: Callable[[], None] | None = None
+        self._pending_track: tuple[str, str] | None = None
 
         # remember the last artist/title we searched for (normalized)
         self._last_query: tuple[str, str] | None = None
@@ -80,14 +179,7 @@ class GeniusLyricsSensor(SensorEntity):
         cleaned_name = media_player_name.replace("_", " ").capitalize()
         self._attr_name = f"{cleaned_name} lyrics"
 
-        self._attr_unique_id = "_".join(
-            [
-                DOMAIN,
-                media_player_name,
-                "sensor",
-                "lyrics",
-            ]
-        )
+        self._attr_unique_id = get_lyrics_sensor_unique_id(media_entity_id)
         self._attr_device_info = DeviceInfo(
             configuration_url="https://www.genius.com/",
             entry_type=DeviceEntryType.SERVICE,
@@ -111,144 +203,258 @@ class GeniusLyricsSensor(SensorEntity):
         self._attr_extra_state_attributes[ATTR_MEDIA_IMAGE] = None
         self._attr_extra_state_attributes[ATTR_MEDIA_PYONG_COUNT] = None
         self._attr_extra_state_attributes[ATTR_MEDIA_STATS_HOT] = None
+        self._attr_extra_state_attributes[ATTR_SONG_ID] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_HASH] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_STATUS] = None
         self._last_query = None
+        self._line_tracker.async_set_lyrics(None, None)
+        self._async_cancel_settle()
+        self._async_cancel_fetch()
         _LOGGER.debug("Sensor data is now reset")
         if update:
-            self.async_schedule_update_ha_state(True)
+            self.async_write_ha_state()
 
     @property
     def state(self):
         """Return the state of the sensor."""
         return self._state
 
-    def _fetch_lyrics(self) -> bool:
-        if self._media_artist is None or self._media_title is None:
-            _LOGGER.error("Cannot fetch lyrics without artist and title")
-            return
-
-        # store normalized query to avoid repeating the same search
-        self._last_query = (
-            self._media_artist.lower(),
-            self._media_title.lower(),
-        )
-
-        # clean song title to increase chance and accuracy of a result
-        cleaned_title = clean_song_title(self._media_title)
-        if cleaned_title != self._media_title:
-            _LOGGER.info(
-                f'Media title was cleaned: "{self._media_title}"  ->  "{cleaned_title}"'
-            )
-            self._media_title = cleaned_title
-
-        _LOGGER.info(
-            f"Searching lyrics for artist='{self._media_artist}' and title='{self._media_title}'"
-        )
-
-        # perform search
-        song = self._genius.search_song(
-            self._media_title, self._media_artist, get_full_info=False
+    @property
+    def extra_restore_state_data(self) -> ExtraStoredData | None:
+        """Return the resolved song, once its lookup has finished."""
+        if self._last_query is None or (
+            self._fetch_task is not None and not self._fetch_task.done()
+        ):
+            return None
+        return RestoredSong(
+            query=normalize_query(*self._last_query),
+            song_id=self._attr_extra_state_attributes[ATTR_SONG_ID],
         )
 
-        # second search needed?
-        if not song and " - " in self._media_title:
-            # aggressively truncate title from the first hyphen
-            self._media_title = self._media_title.split(" - ", 1)[0]
-            _LOGGER.info(
-                f"Second attempt, aggressively cleaned title='{self._media_title}'"
-            )
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine, recording its latency."""
+        with self._metrics.timer(STATE_WRITE):
+            super().async_write_ha_state()
+
+    def _apply_result(self, result: LyricsResult) -> None:
+        """Publish a resolved song on the sensor."""
+        self._media_title = result.title
+        self._attr_extra_state_attributes.update(result.as_attributes())
+        self._attr_entity_picture = result.image
+        self._attr_extra_state_attributes[ATTR_LYRICS_STATUS] = LYRICS_STATUS_LOADED
+        self._state = STATE_ON
+        self._line_tracker.async_set_lyrics(result.song_id, result.line_offsets)
 
-            # perform search
-            song = self._genius.search_song(
-                self._media_title, self._media_artist, get_full_info=False
-            )
+    @callback
+    def _async_show_song(self, generation: int, song: LyricsResult) -> None:
+        """Publish a found song's details while its lyrics are fetched."""
+        if generation != self._generation:
+            return
+        self._apply_result(song)
+        # no lyrics to serve yet
+        self._attr_extra_state_attributes[ATTR_LYRICS_HASH] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_STATUS] = LYRICS_STATUS_LOADING
+        self.async_write_ha_state()
+
+    async def _async_fetch_lyrics(self, generation: int) -> bool:
+        artist, title = self._media_artist, self._media_title
+        if artist is None or title is None:
+            _LOGGER.error("Cannot fetch lyrics without artist and title")
+            return False
 
-        self._attr_extra_state_attributes[ATTR_MEDIA_ARTIST] = self._media_artist
-        self._attr_extra_state_attributes[ATTR_MEDIA_TITLE] = self._media_title
+        # store normalized query to avoid repeating the same search
+        self._last_query = (artist.lower(), title.lower())
 
-        if song:
-            _LOGGER.debug(
-                "Found song: artist = %s, title = %s", song.artist, song.title
-            )
+        result = await self._fetcher.async_fetch(
+            artist,
+            title,
+            partial(self._async_show_song, generation),
+            priority=sensor_priority(self.hass.states.get(self._media_player_id)),
+        )
 
-            self._media_title = song.title
+        # the player moved on while the lyrics were fetched
+        if generation != self._generation:
+            _LOGGER.debug(f"Dropping outdated lyrics of '{artist} - {title}'")
+            return False
 
-            # hack cleanup of lyrics to remove erroneous text
-            lyrics = cleanup_lyrics(song)
+        self._attr_extra_state_attributes[ATTR_MEDIA_ARTIST] = artist
+        self._attr_extra_state_attributes[ATTR_MEDIA_TITLE] = title
 
-            self._attr_extra_state_attributes[ATTR_MEDIA_LYRICS] = lyrics
-            self._attr_extra_state_attributes[ATTR_MEDIA_STATS_HOT] = song.stats.hot
-            self._attr_extra_state_attributes[ATTR_MEDIA_PYONG_COUNT] = (
-                song.pyongs_count
-            )
-            self._attr_extra_state_attributes[ATTR_MEDIA_IMAGE] = (
-                song.song_art_image_thumbnail_url
-            )
-            self._attr_entity_picture = song.song_art_image_thumbnail_url
-            self._state = STATE_ON
+        if result:
+            self._apply_result(result)
             return True
 
-        self._attr_extra_state_attributes[ATTR_MEDIA_LYRICS] = "Lyrics not found"
+        self._apply_not_found()
+        return False
+
+    def _apply_not_found(self) -> None:
+        """Publish that the track has no lyrics."""
+        self._attr_extra_state_attributes[ATTR_MEDIA_LYRICS] = LYRICS_NOT_FOUND
         self._attr_extra_state_attributes[ATTR_MEDIA_IMAGE] = None
         self._attr_extra_state_attributes[ATTR_MEDIA_STATS_HOT] = None
         self._attr_extra_state_attributes[ATTR_MEDIA_PYONG_COUNT] = None
+        self._attr_extra_state_attributes[ATTR_SONG_ID] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_HASH] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_STATUS] = None
         self._attr_entity_picture = None
         self._state = STATE_OFF
-        return False
-
-    def update(self):
-        """Fetch new state data for the sensor.
+        self._line_tracker.async_set_lyrics(None, None)
 
-        Guard against concurrent updates and avoid re-fetching when lyrics are
-        already available for the current track.
-        """
-        # skip when no work to do
-        if self.state != STATE_ON:
+    async def _async_update_lyrics(self, generation: int) -> None:
+        """Fetch lyrics for the current track and publish them."""
+        try:
+            await self._async_fetch_lyrics(generation)
+        except asyncio.TimeoutError:
+            _LOGGER.error(f"Timeout fetching lyrics ({self._fetcher.retries} retries)")
+        except ClientError as e:
+            _LOGGER.error(
+                f"Error fetching lyrics ({self._fetcher.retries} retries), err: {e}"
+            )
+        else:
+            if generation == self._generation:
+                self.async_write_ha_state()
             return
 
-        # don't spam the API if we've already fetched valid lyrics
-        existing_lyrics = self._attr_extra_state_attributes.get(ATTR_MEDIA_LYRICS)
-        if existing_lyrics not in (None, "Lyrics not found"):
-            _LOGGER.debug("Lyrics already cached, skipping fetch")
-            return
+        # on exception only, unless a newer track took over
+        if generation == self._generation:
+            self.reset()
 
-        # prevent re-entry from multiple update requests
-        if self._lock.locked():
-            _LOGGER.debug("Update already in progress, skipping")
-            return
+    @callback
+    def _async_start_fetch(self) -> None:
+        """Start fetching lyrics of the current track, replacing an outdated fetch."""
+        self._async_cancel_fetch()
+        self._fetch_task = self._entry.async_create_background_task(
+            self.hass,
+            self._async_update_lyrics(self._generation),
+            f"{DOMAIN} fetch for {self._media_player_id}",
+        )
+
+    @callback
+    def _async_cancel_fetch(self) -> None:
+        """Cancel an in-flight fetch, e.g. when its track is no longer relevant."""
+        task = self._fetch_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            _LOGGER.debug(f"Cancelling outdated fetch for {self._media_player_id}")
+            task.cancel()
+            self._metrics.increment(CANCELLED)
+            # its track was never resolved, looked up again if it comes back
+            self._last_query = None
+        self._fetch_task = None
+        self._generation += 1
+
+    @callback
+    def _async_settled(self, _now) -> None:
+        """Start the lookup of a track that stayed long enough."""
+        self._cancel_settle = None
+
+        # all checks out..update artist and title to fetch
+        self._media_artist, self._media_title = self._pending_track
+        self._attr_extra_state_attributes[ATTR_MEDIA_LYRICS] = None
+        self._attr_extra_state_attributes[ATTR_SONG_ID] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_HASH] = None
+        self._attr_extra_state_attributes[ATTR_LYRICS_STATUS] = None
+        self._attr_entity_picture = None
+        self._state = STATE_ON
+        self._line_tracker.async_set_lyrics(None, None)
+
+        self._async_start_fetch()
+
+    @callback
+    def _async_cancel_settle(self) -> None:
+        """Drop a pending lookup, e.g. when its track was skipped."""
+        if self._cancel_settle is not None:
+            self._cancel_settle()
+            self._cancel_settle = None
+
+    async def async_added_to_hass(self) -> None:
+        """Track the media player, and its position for line subscriptions."""
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, self._media_player_id, self.handle_state_change
+            )
+        )
+        self.hass.data[DOMAIN][self._entry.entry_id][DATA_LINE_TRACKERS][
+            self.entity_id
+        ] = self._line_tracker
+
+        state = self.hass.states.get(self._media_player_id)
+        self._line_tracker.async_update_player(state)
+        if (extra_data := await self.async_get_last_extra_data()) is not None:
+            if (restored := RestoredSong.from_dict(extra_data.as_dict())) is not None:
+                self._async_restore(restored, state)
+
+        # catch up with the track the player is on now, unless restored
+        if self._warm_up is not None and self._last_query is None:
+            self.async_on_remove(self._warm_up.async_add(state, self._async_warm_up))
+        else:
+            self._async_handle_player_state(None, state)
+        # only the first addition is queued
+        self._warm_up = None
+
+    @callback
+    def _async_warm_up(self) -> None:
+        """Look up the track of the player, in its turn after startup."""
+        self._async_handle_player_state(
+            None, self.hass.states.get(self._media_player_id), settle_delay=0
+        )
 
-        # ensure only one fetch at a time
-        if not self._lock.acquire(blocking=False):
-            # should not happen due to previous check, but be paranoid
-            _LOGGER.debug("Lock busy despite inspection, skipping")
+    @callback
+    def _async_restore(self, restored: RestoredSong, state: State | None) -> None:
+        """Take back the song resolved before a restart, if still playing."""
+        if state is None:
+            return
+        artist = state.attributes.get(ATTR_MEDIA_ARTIST)
+        title = state.attributes.get(ATTR_MEDIA_TITLE)
+        if artist is None or title is None:
+            return
+        if normalize_query(artist, title) != restored.query:
+            _LOGGER.debug(f"{self._media_player_id} moved on to another track")
             return
-        try:
-            try:
-                self._fetch_lyrics()
-            except Timeout:
-                _LOGGER.error(
-                    f"Timeout fetching lyrics ({self._genius.retries} retries)"
-                )
-            except (HTTPError, RequestsConnectionError) as e:
-                _LOGGER.error(
-                    f"Error fetching lyrics ({self._genius.retries} retries), err: {e.strerror}"
-                )
-            else:
-                return
 
-            # on exception only
-            self.reset()
-        finally:
-            self._lock.release()
+        cached = None
+        if restored.song_id is not None:
+            # only if its lyrics are still cached, otherwise looked up again
+            cached = self._fetcher.async_get_cached(artist, title)
+            if cached is None or cached.song_id != restored.song_id:
+                return
 
-    async def handle_state_change(self, event: EventStateChangedData):
+        _LOGGER.debug(f"Restored lyrics of '{artist} - {title}'")
+        self._last_query = (artist.lower(), title.lower())
+        self._media_artist = artist
+        self._media_title = title
+        self._attr_extra_state_attributes[ATTR_MEDIA_ARTIST] = artist
+        self._attr_extra_state_attributes[ATTR_MEDIA_TITLE] = title
+        if cached is not None:
+            self._apply_result(cached)
+        else:
+            self._apply_not_found()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending work when removed."""
+        self._async_cancel_settle()
+        self._async_cancel_fetch()
+        self._line_tracker.async_stop()
+        if (entry_data := self.hass.data[DOMAIN].get(self._entry.entry_id)) is not None:
+            entry_data[DATA_LINE_TRACKERS].pop(self.entity_id, None)
+
+    @callback
+    def handle_state_change(self, event: EventStateChangedData):
         """Handle media player state changes to trigger new search."""
 
         entity_id: str = event.data["entity_id"]
         old_state: State = event.data["old_state"]
         new_state: State = event.data["new_state"]
 
-        _LOGGER.debug(f"old_state: {old_state}")
-        _LOGGER.debug(f"new_state: {new_state}")
+        # position updates only move the active line of synced lyrics
+        self._line_tracker.async_update_player(new_state)
+
+        # ignore position, volume, artwork, etc. updates
+        if old_state is not None and _relevant_state(old_state) == _relevant_state(
+            new_state
+        ):
+            return
 
         # ensure tracking correct entity_id
         if entity_id != self._media_player_id:
@@ -257,6 +463,20 @@ class GeniusLyricsSensor(SensorEntity):
             )
             return
 
+        self._async_handle_player_state(old_state, new_state)
+
+    @callback
+    def _async_handle_player_state(
+        self,
+        old_state: State | None,
+        new_state: State | None,
+        settle_delay: float = TRACK_SETTLE_DELAY,
+    ) -> None:
+        """Look up the lyrics of the player's track when it changed."""
+        entity_id = self._media_player_id
+        _LOGGER.debug(f"old_state: {old_state}")
+        _LOGGER.debug(f"new_state: {new_state}")
+
         if new_state is None:
             _LOGGER.debug(
                 f"Detected removed or disabled entity: {entity_id}, new_state is None"
@@ -306,22 +526,156 @@ class GeniusLyricsSensor(SensorEntity):
             _LOGGER.debug("Media title has not changed")
             return
 
-        # check normalized query, bail if unchanged
         new_artist = new_state.attributes.get(ATTR_MEDIA_ARTIST)
+        if new_artist is None:
+            _LOGGER.debug("Media artist is None, skipping")
+            self.reset()
+            return
+
+        # a newer track replaces one that is still settling
+        self._async_cancel_settle()
+
+        # check normalized query, bail if unchanged
         new_query: tuple[str, str] = (new_artist.lower(), new_title.lower())
         if new_query == self._last_query:
             _LOGGER.debug("Media artist/title has not changed (normalized)")
             return
 
-        # all checks out..update artist and title to fetch
-        self._media_artist = new_artist
-        self._media_title = new_title
-        self._attr_extra_state_attributes[ATTR_MEDIA_LYRICS] = None
-        self._attr_entity_picture = None
-        self._state = STATE_ON
+        # the fetch of the previous track is outdated, stop spending time on it
+        self._async_cancel_fetch()
 
-        # trigger search via update
-        self.async_schedule_update_ha_state(True)
+        # serve repeat tracks straight from the lyrics cache
+        cached = self._fetcher.async_get_cached(new_artist, new_title)
+        if cached is not None:
+            self._last_query = new_query
+            self._media_artist = new_artist
+            self._apply_result(cached)
+            self.async_write_ha_state()
+            return
+
+        # trigger search once the track settles, so skipped tracks are never fetched
+        self._pending_track = (new_artist, new_title)
+        self._cancel_settle = async_call_later(
+            self.hass, settle_delay, self._async_settled
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class GeniusMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reading the entry's lookup metrics."""
+
+    value_fn: Callable[[LyricsMetrics], Any]
+    attributes_fn: Callable[[LyricsMetrics], dict[str, Any]] | None = None
+
+
+def _latency_sensor(key: str) -> GeniusMetricSensorEntityDescription:
+    """Describe a sensor with the mean of a latency histogram."""
+    return GeniusMetricSensorEntityDescription(
+        key=f"{key}_latency",
+        translation_key=f"{key}_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda metrics: metrics.histogram(key).mean,
+        attributes_fn=lambda metrics: {
+            "count": metrics.histogram(key).count,
+            "p50": metrics.histogram(key).percentile(50),
+            "p95": metrics.histogram(key).percentile(95),
+            "max": metrics.histogram(key).max,
+        },
+    )
+
+
+METRIC_SENSORS: tuple[GeniusMetricSensorEntityDescription, ...] = (
+    GeniusMetricSensorEntityDescription(
+        key="lookups",
+        translation_key="lookups",
+        icon="mdi:magnify",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.histogram(LOOKUP).count,
+    ),
+    GeniusMetricSensorEntityDescription(
+        key="cache_hit_ratio",
+        translation_key="cache_hit_ratio",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.cache_hit_ratio,
+        attributes_fn=lambda metrics: dict(metrics.counters),
+    ),
+    GeniusMetricSensorEntityDescription(
+        key="failed_lookups",
+        translation_key="failed_lookups",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counters[ERRORS],
+        attributes_fn=lambda metrics: dict(metrics.errors),
+    ),
+    GeniusMetricSensorEntityDescription(
+        key="retries",
+        translation_key="retries",
+        icon="mdi:refresh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counters[RETRIES],
+        attributes_fn=lambda metrics: {THROTTLED: metrics.counters[THROTTLED]},
+    ),
+    GeniusMetricSensorEntityDescription(
+        key=QUEUE_DEPTH,
+        translation_key=QUEUE_DEPTH,
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.gauges.get(QUEUE_DEPTH),
+        attributes_fn=lambda metrics: {
+            FETCH_RUNNING: metrics.gauges.get(FETCH_RUNNING)
+        },
+    ),
+    _latency_sensor(LOOKUP),
+    _latency_sensor(QUEUE_WAIT),
+    _latency_sensor(SEARCH),
+    _latency_sensor(PAGE_FETCH),
+    _latency_sensor(CLEANUP),
+    _latency_sensor(STATE_WRITE),
+)
+
+
+class GeniusMetricSensor(SensorEntity):
+    """Diagnostic sensor exposing a lookup metric of the integration."""
+
+    entity_description: GeniusMetricSensorEntityDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        metrics: LyricsMetrics,
+        description: GeniusMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._metrics = metrics
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            configuration_url="https://www.genius.com/",
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer=INTEGRATION_NAME,
+            name=INTEGRATION_NAME,
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self._metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return details of the metric."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._metrics)
 
 
 async def async_setup_entry(
@@ -347,6 +701,10 @@ async def async_setup_entry(
     # SETUP ENTRY START
 
     monitor_all = entry.options[CONF_MONITOR_ALL]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    fetcher: LyricsFetcher = entry_data[DATA_FETCHER]
+    metrics: LyricsMetrics = entry_data[DATA_METRICS]
+    prefetcher: LyricsPrefetcher = entry_data[DATA_PREFETCHER]
 
     if monitor_all is True:
         # get list of all media_player entities
@@ -355,18 +713,75 @@ async def async_setup_entry(
         # get list of user-selected media_player entities
         monitored_entities = entry.options[CONF_ENTITIES]
 
-    # create sensors, one for each monitored entity
-    sensors = []
-    for media_player in monitored_entities:
+    lyrics_sensors: dict[str, GeniusLyricsSensor] = entry_data[DATA_LYRICS_SENSORS]
+
+    # initial lookups of the sensors created now, drained at a steady rate
+    warm_up = WarmUpQueue(hass)
+    entry.async_on_unload(warm_up.async_stop)
+
+    @callback
+    def async_create_sensor(
+        media_player: str, warm_up: WarmUpQueue | None = None
+    ) -> GeniusLyricsSensor:
+        """Create the lyrics sensor of a media player."""
         _LOGGER.debug(f"Creating sensor to monitor {media_player}")
+        genius_sensor = GeniusLyricsSensor(
+            entry, media_player, fetcher, metrics, LineTracker(hass), warm_up
+        )
+        lyrics_sensors[media_player] = genius_sensor
+        genius_sensor.async_on_remove(partial(lyrics_sensors.pop, media_player, None))
 
-        # create new sensor & hook up to media_player
-        genius_sensor = GeniusLyricsSensor(entry, media_player)
-        async_track_state_change_event(
-            hass, media_player, genius_sensor.handle_state_change
+        # warm the cache with upcoming tracks on the same track changes
+        genius_sensor.async_on_remove(
+            async_track_state_change_event(
+                hass, media_player, prefetcher.async_handle_state_change
+            )
         )
+        genius_sensor.async_on_remove(partial(prefetcher.async_forget, media_player))
+        return genius_sensor
+
+    @callback
+    def async_add_sensor(media_player: str) -> None:
+        """Add the sensor of a media player, leaving the other sensors as they are."""
+        if media_player not in lyrics_sensors:
+            async_add_entities([async_create_sensor(media_player)])
+
+    @callback
+    def async_remove_sensor(media_player: str) -> None:
+        """Remove the sensor of a media player that is no longer monitored."""
+        registry = er.async_get(hass)
+        if sensor_entity_id := registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, get_lyrics_sensor_unique_id(media_player)
+        ):
+            _LOGGER.info(f"Removing sensor for {media_player}")
+            # the sensor entity removes itself with its registry entry
+            registry.async_remove(sensor_entity_id)
+        elif (genius_sensor := lyrics_sensors.get(media_player)) is not None:
+            _LOGGER.info(f"Removing sensor for {media_player}")
+            hass.async_create_task(genius_sensor.async_remove())
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ADD_SENSOR.format(entry.entry_id), async_add_sensor
+        )
+    )
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_REMOVE_SENSOR.format(entry.entry_id), async_remove_sensor
+        )
+    )
 
-        sensors.append(genius_sensor)
+    # create sensors, one for each monitored entity
+    sensors: list[SensorEntity] = [
+        async_create_sensor(media_player, warm_up)
+        for media_player in monitored_entities
+    ]
+
+    # diagnostics of the lookup path, on the service device
+    sensors.extend(
+        GeniusMetricSensor(entry, metrics, description)
+        for description in METRIC_SENSORS
+    )
 
     # add new sensors
     async_add_entities(sensors)
@@ -1,13 +1,21 @@
 """Services for the Genius Lyrics integration."""
 
+import asyncio
 from functools import partial
 import logging
-from typing import Optional
+from typing import Any, Optional
 
+from aiohttp import ClientError
 import voluptuous as vol
 
 from homeassistant.components.media_player import ATTR_MEDIA_ARTIST, ATTR_MEDIA_TITLE
-from homeassistant.const import CONF_ENTITY_ID, STATE_OFF, STATE_ON
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    ATTR_ENTITY_PICTURE,
+    CONF_ENTITY_ID,
+    STATE_OFF,
+    STATE_ON,
+)
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
@@ -19,15 +27,27 @@ import homeassistant.helpers.config_validation as cv
 
 from .const import (
     ATTR_MEDIA_IMAGE,
+    ATTR_LYRICS_HASH,
+    ATTR_LYRICS_STATUS,
     ATTR_MEDIA_LYRICS,
     ATTR_MEDIA_PYONG_COUNT,
     ATTR_MEDIA_STATS_HOT,
+    ATTR_SONG_ID,
+    CONF_MAX_PARALLEL,
+    CONF_TRACKS,
+    DATA_FETCHER,
+    DATA_METRICS,
+    DEFAULT_MAX_PARALLEL,
     DOMAIN,
-    FETCH_RETRIES,
+    LYRICS_NOT_FOUND,
     SERVICE_SEARCH_LYRICS,
+    SERVICE_SEARCH_LYRICS_BATCH,
 )
-from .genius import GeniusPatched
-from .helpers import cleanup_lyrics
+from .fetcher import LyricsFetcher
+from .helpers import normalize_query
+from .metrics import SERVICE_CALLS, LyricsMetrics
+from .models import LyricsResult
+from .scheduler import PRIORITY_BACKGROUND
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,11 +64,54 @@ SERVICE_SEARCH_LYRICS_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+SERVICE_SEARCH_LYRICS_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TRACKS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_MEDIA_ARTIST): cv.string,
+                        vol.Required(ATTR_MEDIA_TITLE): cv.string,
+                    }
+                )
+            ],
+        ),
+        vol.Optional(CONF_MAX_PARALLEL, default=DEFAULT_MAX_PARALLEL): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=16)
+        ),
+    }
+)
+
+
+def _response_attributes(
+    artist: str, title: str, result: LyricsResult | None
+) -> dict[str, Any]:
+    """Return the media attributes of a lookup, including the full lyrics."""
+    attrs = {
+        ATTR_MEDIA_ARTIST: artist,
+        ATTR_MEDIA_TITLE: title,
+        ATTR_MEDIA_LYRICS: LYRICS_NOT_FOUND,
+        ATTR_MEDIA_IMAGE: None,
+        ATTR_MEDIA_PYONG_COUNT: None,
+        ATTR_MEDIA_STATS_HOT: None,
+    }
+    if result:
+        attrs.update(result.as_attributes())
+        # responses are not recorded, include the full lyrics
+        attrs[ATTR_MEDIA_LYRICS] = result.lyrics
+    return attrs
+
 
 async def search_lyrics(
-    call: ServiceCall, *, hass: HomeAssistant, genius: GeniusPatched
+    call: ServiceCall,
+    *,
+    hass: HomeAssistant,
+    fetcher: LyricsFetcher,
+    metrics: LyricsMetrics,
 ) -> Optional[ServiceResponse]:
     """Service call to handle searching song lyrics."""
+    metrics.increment(SERVICE_CALLS)
     data = call.data
     artist = data.get(ATTR_MEDIA_ARTIST)
     title = data.get(ATTR_MEDIA_TITLE)
@@ -78,46 +141,100 @@ async def search_lyrics(
         if old_state:
             attrs = dict(old_state.attributes)
 
-    # perform fetch
-    def fetch_lyrics():
-        return genius.search_song(title, artist, get_full_info=False)
-
-    song = await hass.async_add_executor_job(fetch_lyrics)
-    if song:
-        lyrics = cleanup_lyrics(song)
-        attrs.update(
-            {
-                ATTR_MEDIA_ARTIST: song.artist,
-                ATTR_MEDIA_TITLE: song.title,
-                ATTR_MEDIA_LYRICS: lyrics,
-                ATTR_MEDIA_IMAGE: song.song_art_image_thumbnail_url,
-                ATTR_MEDIA_PYONG_COUNT: song.pyongs_count,
-                ATTR_MEDIA_STATS_HOT: song.stats.hot,
-            }
-        )
+    # perform fetch, shared with sensors looking up the same song
+    result = await fetcher.async_fetch(artist, title)
+    if result:
+        attrs.update(result.as_attributes())
     else:
         _LOGGER.debug(f"No lyrics found for '{artist} - {title}'")
-        attrs[ATTR_MEDIA_LYRICS] = "Lyrics not found"
-
-    # pass media attributes to entity if specified
-    # otherwise, return as response.
+        # drop the previous song, the card would load its lyrics by song id
+        attrs.update(_response_attributes(artist, title, None))
+        attrs[ATTR_SONG_ID] = None
+        attrs[ATTR_LYRICS_HASH] = None
+        attrs[ATTR_LYRICS_STATUS] = None
+        attrs.pop(ATTR_ENTITY_PICTURE, None)
+
+    # pass media attributes to entity if specified, lyrics are referenced by
+    # song id like on the sensors. otherwise, return as response.
     if entity_id:
-        hass.states.async_set(entity_id, STATE_ON if song else STATE_OFF, attrs)
+        hass.states.async_set(entity_id, STATE_ON if result else STATE_OFF, attrs)
     else:
-        return attrs
+        return _response_attributes(artist, title, result)
+
+
+async def search_lyrics_batch(
+    call: ServiceCall,
+    *,
+    fetcher: LyricsFetcher,
+    metrics: LyricsMetrics,
+) -> ServiceResponse:
+    """Service call to search lyrics of many songs at once."""
+    metrics.increment(SERVICE_CALLS)
+    tracks: list[dict[str, str]] = call.data[CONF_TRACKS]
+    semaphore = asyncio.Semaphore(call.data[CONF_MAX_PARALLEL])
+
+    async def _async_search(artist: str, title: str) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                # bulk work, behind the sensors and single searches
+                result = await fetcher.async_fetch(
+                    artist, title, priority=PRIORITY_BACKGROUND
+                )
+            except asyncio.TimeoutError:
+                error = "Timeout fetching lyrics"
+            except ClientError as e:
+                error = f"Error fetching lyrics: {e}"
+            else:
+                return _response_attributes(artist, title, result)
+
+        _LOGGER.debug(f"Batch search of '{artist} - {title}' failed: {error}")
+        return {ATTR_MEDIA_ARTIST: artist, ATTR_MEDIA_TITLE: title, "error": error}
+
+    # repeated tracks are searched once
+    searches: dict[str, asyncio.Task[dict[str, Any]]] = {}
+    keys = []
+    for track in tracks:
+        artist, title = track[ATTR_MEDIA_ARTIST], track[ATTR_MEDIA_TITLE]
+        key = normalize_query(artist, title)
+        if key not in searches:
+            searches[key] = asyncio.create_task(_async_search(artist, title))
+        keys.append(key)
+
+    # gathered so cancelling the call cancels the searches
+    await asyncio.gather(*searches.values())
+
+    _LOGGER.debug(f"Batch searched {len(searches)} unique of {len(tracks)} tracks")
+
+    # one result per input, in order
+    return {"results": [searches[key].result() for key in keys]}
 
 
 @callback
-def async_setup_services(hass: HomeAssistant) -> None:
+def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Set up services for the Genius Lyrics integration."""
-    # client is shared amongst services
-    client = GeniusPatched("public", skip_non_songs=True, retries=FETCH_RETRIES)
+    # fetcher is shared with the entry's sensors
+    fetcher = hass.data[DOMAIN][entry.entry_id][DATA_FETCHER]
+    metrics = hass.data[DOMAIN][entry.entry_id][DATA_METRICS]
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SEARCH_LYRICS,
-        partial(search_lyrics, hass=hass, genius=client),
+        partial(search_lyrics, hass=hass, fetcher=fetcher, metrics=metrics),
         schema=SERVICE_SEARCH_LYRICS_SCHEMA,
         supports_response=SupportsResponse.OPTIONAL,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_LYRICS_BATCH,
+        partial(search_lyrics_batch, fetcher=fetcher, metrics=metrics),
+        schema=SERVICE_SEARCH_LYRICS_BATCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     # TODO: add more services
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services, once no entry is left to serve them."""
+    for service in (SERVICE_SEARCH_LYRICS, SERVICE_SEARCH_LYRICS_BATCH):
+        hass.services.async_remove(DOMAIN, service)
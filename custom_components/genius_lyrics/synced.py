@@ -0,0 +1,161 @@
+"""Active line of time-synced lyrics for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable
+from datetime import datetime
+import logging
+
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_POSITION,
+    ATTR_MEDIA_POSITION_UPDATED_AT,
+    MediaPlayerState,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# no line is active, e.g. before the first one starts
+NO_LINE = -1
+
+
+def active_line(line_offsets: list[float], position: float) -> int:
+    """Return the index of the line playing at a position, or `NO_LINE`."""
+    return bisect_right(line_offsets, position) - 1
+
+
+class LineTracker:
+    """Follow the active line of a sensor's lyrics along its player's position.
+
+    The position is extrapolated from the player's last reported position, so
+    no state updates are needed while it plays. A timer fires when the next
+    line starts, and only while somebody is subscribed; subscribers receive
+    the song id and the index of the active line whenever it changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._song_id: int | None = None
+        self._line_offsets: list[float] = []
+        self._playing = False
+        self._position: float | None = None
+        self._position_updated_at: datetime | None = None
+        self._line = NO_LINE
+        self._subscribers: list[Callable[[int | None, int], None]] = []
+        self._cancel_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_set_lyrics(
+        self, song_id: int | None, line_offsets: list[float] | None
+    ) -> None:
+        """Track the lines of another song, untimed lyrics have no lines."""
+        if song_id == self._song_id and (line_offsets or []) == self._line_offsets:
+            return
+        self._song_id = song_id
+        self._line_offsets = line_offsets or []
+        self._line = NO_LINE
+        self._async_refresh(notify=True)
+
+    @callback
+    def async_update_player(self, state: State | None) -> None:
+        """Take the playback state and position of the media player."""
+        if state is None:
+            playing, position, updated_at = False, None, None
+        else:
+            playing = state.state == MediaPlayerState.PLAYING
+            position = state.attributes.get(ATTR_MEDIA_POSITION)
+            updated_at = state.attributes.get(ATTR_MEDIA_POSITION_UPDATED_AT)
+
+        if (playing, position, updated_at) == (
+            self._playing,
+            self._position,
+            self._position_updated_at,
+        ):
+            return
+        self._playing = playing
+        self._position = position
+        self._position_updated_at = updated_at
+        if self._line_offsets:
+            self._async_refresh()
+
+    @callback
+    def async_subscribe(
+        self, subscriber: Callable[[int | None, int], None]
+    ) -> CALLBACK_TYPE:
+        """Call a subscriber on every line change, starting with the active one."""
+        # bring the active line up to date before the subscriber is added, so
+        # it receives the line once
+        self._async_refresh()
+        self._subscribers.append(subscriber)
+        subscriber(self._song_id, self._line)
+        if self._cancel_timer is None:
+            # the next line is only timed for subscribers
+            self._async_refresh()
+
+        @callback
+        def unsubscribe() -> None:
+            # already dropped when the tracker stopped
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            if not self._subscribers:
+                self._async_cancel_timer()
+
+        return unsubscribe
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the player."""
+        self._subscribers.clear()
+        self._async_cancel_timer()
+
+    def _current_position(self) -> float | None:
+        """Return the playback position in seconds, extrapolated while playing."""
+        position = self._position
+        if position is None:
+            return None
+        if self._playing and self._position_updated_at is not None:
+            position += (dt_util.utcnow() - self._position_updated_at).total_seconds()
+        return position
+
+    @callback
+    def _async_refresh(self, notify: bool = False) -> None:
+        """Find the active line, notify its change and time the next one."""
+        self._async_cancel_timer()
+        position = self._current_position()
+        line = NO_LINE
+        if self._line_offsets and position is not None:
+            line = active_line(self._line_offsets, position)
+
+        if line != self._line or notify:
+            self._line = line
+            for subscriber in list(self._subscribers):
+                subscriber(self._song_id, line)
+
+        # the next line is only timed for subscribers of a playing song
+        next_line = line + 1
+        if (
+            self._subscribers
+            and self._playing
+            and position is not None
+            and next_line < len(self._line_offsets)
+        ):
+            self._cancel_timer = async_call_later(
+                self._hass,
+                max(self._line_offsets[next_line] - position, 0),
+                self._async_next_line,
+            )
+
+    @callback
+    def _async_next_line(self, _now: datetime) -> None:
+        self._cancel_timer = None
+        self._async_refresh()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
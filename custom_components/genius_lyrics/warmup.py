@@ -0,0 +1,94 @@
+"""Startup warm-up of the Genius Lyrics sensors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import heapq
+from itertools import count
+import logging
+
+from homeassistant.components.media_player import MediaPlayerState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import WARM_UP_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+# players someone is listening to go first
+_STATE_PRIORITY = {
+    MediaPlayerState.PLAYING: 0,
+    MediaPlayerState.BUFFERING: 0,
+    MediaPlayerState.PAUSED: 1,
+    MediaPlayerState.IDLE: 2,
+}
+_OTHER_PRIORITY = 3
+
+
+def warm_up_priority(state: State | None) -> int:
+    """Return the warm-up priority of a media player, lowest first."""
+    if state is None:
+        return _OTHER_PRIORITY
+    return _STATE_PRIORITY.get(state.state, _OTHER_PRIORITY)
+
+
+class WarmUpQueue:
+    """Initial lookups of the sensors added at startup.
+
+    Lookups are queued by the state of their player, playing before paused
+    before idle, and started one at a time every `interval` seconds, so the
+    sensors of a large install don't all search Genius in the same second.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval: float = WARM_UP_INTERVAL) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._interval = interval
+        # [priority, order, job], the job is None once cancelled
+        self._queue: list[list] = []
+        self._order = count()
+        self._cancel_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, state: State | None, job: Callable[[], None]) -> CALLBACK_TYPE:
+        """Queue the initial lookup of a player, returns a callback to cancel it."""
+        item = [warm_up_priority(state), next(self._order), job]
+        heapq.heappush(self._queue, item)
+        # the first lookup waits one interval too, so the whole batch of
+        # sensors is queued before the order is decided
+        if self._cancel_timer is None:
+            self._cancel_timer = async_call_later(
+                self._hass, self._interval, self._async_next
+            )
+
+        @callback
+        def cancel() -> None:
+            item[2] = None
+
+        return cancel
+
+    @callback
+    def async_stop(self) -> None:
+        """Drop the queued lookups."""
+        self._queue.clear()
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+    @callback
+    def _async_next(self, _now: datetime) -> None:
+        """Start the next queued lookup."""
+        self._cancel_timer = None
+        while self._queue:
+            *_, job = heapq.heappop(self._queue)
+            if job is not None:
+                job()
+                break
+
+        if self._queue:
+            self._cancel_timer = async_call_later(
+                self._hass, self._interval, self._async_next
+            )
+        else:
+            _LOGGER.debug("Startup warm-up done")
@@ -0,0 +1,136 @@
+"""Websocket API for the Genius Lyrics integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from aiohttp import ClientError
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_LINE_OFFSETS,
+    ATTR_LYRICS_HASH,
+    ATTR_SONG_ID,
+    DATA_FETCHER,
+    DATA_LINE_TRACKERS,
+    DOMAIN,
+    WS_TYPE_LYRICS,
+    WS_TYPE_SUBSCRIBE_LINE,
+)
+from .fetcher import LyricsFetcher
+from .synced import LineTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_lyrics)
+    websocket_api.async_register_command(hass, websocket_subscribe_line)
+
+
+def _get_entry_data(hass: HomeAssistant, key: str) -> Any:
+    """Return an item of the loaded config entry's data, or None."""
+    # single instance integration, see config_flow
+    return next(
+        (
+            entry_data[key]
+            for entry_data in hass.data.get(DOMAIN, {}).values()
+            if isinstance(entry_data, dict) and key in entry_data
+        ),
+        None,
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_LYRICS,
+        vol.Required(ATTR_SONG_ID): int,
+    }
+)
+@websocket_api.async_response
+async def websocket_get_lyrics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the lyrics of a song referenced by a sensor's state."""
+    song_id = msg[ATTR_SONG_ID]
+    fetcher: LyricsFetcher | None = _get_entry_data(hass, DATA_FETCHER)
+    if fetcher is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Genius Lyrics is not loaded"
+        )
+        return
+
+    try:
+        result = await fetcher.async_get_song(song_id)
+    except (asyncio.TimeoutError, ClientError) as e:
+        _LOGGER.debug(f"Error fetching lyrics of song {song_id}, err: {e}")
+        connection.send_error(
+            msg["id"], websocket_api.ERR_HOME_ASSISTANT_ERROR, "Genius is unreachable"
+        )
+        return
+
+    if result is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No lyrics for song {song_id}"
+        )
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            ATTR_SONG_ID: result.song_id,
+            "lyrics": result.lyrics,
+            ATTR_LYRICS_HASH: result.lyrics_hash,
+            ATTR_LINE_OFFSETS: result.line_offsets,
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE_LINE,
+        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+    }
+)
+@callback
+def websocket_subscribe_line(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the active line of a sensor's time-synced lyrics.
+
+    Events only carry the song id and the line index, lines are numbered as in
+    the lyrics text served by the lyrics command.
+    """
+    entity_id = msg[ATTR_ENTITY_ID]
+    line_trackers: dict[str, LineTracker] = (
+        _get_entry_data(hass, DATA_LINE_TRACKERS) or {}
+    )
+    if (tracker := line_trackers.get(entity_id)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Unknown sensor {entity_id}"
+        )
+        return
+
+    @callback
+    def forward_line(song_id: int | None, line: int) -> None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {ATTR_SONG_ID: song_id, "line": line}
+            )
+        )
+
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = tracker.async_subscribe(forward_line)
@@ -31,11 +31,11 @@ const ot=2;class rt{constructor(t){}get _$AU(){return this._$AM._$AU}_$AT(t,e,i)
  * @license
  * Copyright 2017 Google LLC
  * SPDX-License-Identifier: BSD-3-Clause
- */class at extends rt{constructor(t){if(super(t),this.et=R,t.type!==ot)throw Error(this.constructor.directiveName+"() can only be used in child bindings")}render(t){if(t===R||null==t)return this.ft=void 0,this.et=t;if(t===M)return t;if("string"!=typeof t)throw Error(this.constructor.directiveName+"() called with a non-string value");if(t===this.et)return this.ft;this.et=t;const e=[t];return e.raw=e,this.ft={_$litType$:this.constructor.resultType,strings:e,values:[]}}}at.directiveName="unsafeHTML",at.resultType=1;const ht=(t=>(...e)=>({_$litDirective$:t,values:e}))(at);console.info("%c GENIUS-LYRICS-CARD %c 1.0.0 ","color: white; background: #1db954; font-weight: 700;","color: #1db954; background: white; font-weight: 700;");customElements.define("genius-lyrics-card",class extends st{constructor(){super(...arguments),this.config={}}static get properties(){return{hass:{type:Object},config:{type:Object},_stateObj:{type:Object}}}_renderPyongIcon(){return L`<svg class="pyong-icon" viewBox="0 0 11.37 22" aria-hidden="true"><path d="M0 7l6.16-7 3.3 7H6.89S5.5 12.1 5.5 12.17h5.87L6.09 22l.66-7H.88l2.89-8z"></path></svg>`}_isPyongUiEnabled(){return false}static getConfigElement(){return document.createElement("genius-lyrics-card-editor")}static getStubConfig(){return{entity:"",show_image:!0,show_details:!0,show_stats:!0,stats_position:"header",show_font_controls:!0,font_size:14,max_height:400,show_pyong_button:!0,show_genius_button:!0}}setConfig(t){if(!t.entity)throw new Error("You must specify an entity (Genius Lyrics sensor)");this.config={show_image:!0,show_details:!0,show_stats:!0,stats_position:"header",show_font_controls:!0,font_size:14,max_height:400,show_pyong_button:!0,show_genius_button:!0,...t}}_getFontSize(){const t=parseInt(this.config.font_size,10);return Number.isNaN(t)?14:Math.min(30,Math.max(10,t))}_updateCardConfig(t){this.config=t,this.dispatchEvent(new CustomEvent("config-changed",{detail:{config:t},bubbles:!0,composed:!0})),this.requestUpdate()}_changeFontSize(t){const e=Math.min(30,Math.max(10,this._getFontSize()+t));e!==this._getFontSize()&&this._updateCardConfig({...this.config,font_size:e})}_decreaseFontSize(){this._changeFontSize(-1)}_increaseFontSize(){this._changeFontSize(1)}shouldUpdate(){return Boolean(this.config)}updated(t){if(t.has("hass")&&this.hass&&this.config){const e=t.get("hass"),i=e?.states?.[this.config.entity],s=this.hass.states[this.config.entity];i!==s&&(this._stateObj=s)}}getCardSize(){return this._hasLyrics()?4:1}_hasLyrics(){if(!this._stateObj)return!1;const t=this._getLyrics();return!(!t||!t.trim())}_getLyrics(){const t=this._stateObj?.attributes?.lyrics||this._stateObj?.attributes?.media_lyrics||this._stateObj?.state||"";return"string"==typeof t?t.trimStart().trimEnd():""}_getArtist(){return this._stateObj?.attributes?.artist||this._stateObj?.attributes?.media_artist||""}_getTitle(){return this._stateObj?.attributes?.title||this._stateObj?.attributes?.media_title||""}_getImage(){return this._stateObj?.attributes?.media_image||this._stateObj?.attributes?.entity_picture||this._stateObj?.attributes?.song_art||""}_getPyongs(){return this._stateObj?.attributes?.pyong_count??this._stateObj?.attributes?.media_pyong_count??null}_getHot(){return this._stateObj?.attributes?.stats_hot??this._stateObj?.attributes?.media_stats_hot??null}_getGeniusUrl(){return this._stateObj?.attributes?.song_url||this._stateObj?.attributes?.genius_url||null}_getAnnotations(){const t=this._stateObj?.attributes?.annotations||this._stateObj?.attributes?.media_annotations;if(t&&"object"==typeof t)return this._normalizeAnnotations(t);if(this.config.annotations&&"object"==typeof this.config.annotations)return this._normalizeAnnotations(this.config.annotations);if(this.config.annotations_entity&&this.hass){const t=this.hass.states[this.config.annotations_entity];if(t){let e=this.config.annotations_attribute?t.attributes?.[this.config.annotations_attribute]:t.state;if("string"==typeof e)try{e=JSON.parse(e)}catch{e=null}if(e&&"object"==typeof e)return this._normalizeAnnotations(e)}}return{}}_normalizeAnnotations(t){const e={};for(const[i,s]of Object.entries(t))Array.isArray(s)?e[i]=s.map(String):null!=s&&(e[i]=[String(s)]);return e}_handlePyong(){if(!this.hass)return;const t=this._getArtist(),e=this._getTitle(),i=`glc-pyong:${t}::${e}`,s=!("1"===localStorage.getItem(i));localStorage.setItem(i,s?"1":"0"),this.hass.connection.sendMessage({type:"fire_event",event_type:"genius_lyrics_pyong",event_data:{artist:t,title:e,pyonged:s}}),this.requestUpdate()}_isPyonged(){const t=`glc-pyong:${this._getArtist()}::${this._getTitle()}`;return"1"===localStorage.getItem(t)}_handleOpenGenius(){const t=this._getGeniusUrl();if(t)return void window.open(t,"_blank","noopener,noreferrer");const e=this._getArtist(),i=this._getTitle();if(!e&&!i)return;const s=encodeURIComponent(`${e} ${i}`.trim());window.open(`https://genius.com/search?q=${s}`,"_blank","noopener,noreferrer")}_applyAnnotations(t){const e=this._getAnnotations();if(!t||!e||0===Object.keys(e).length)return this._escapeHtml(t);let i=t;const s=new Set,n=Object.keys(e).sort((t,e)=>e.length-t.length);for(const t of n){if(s.has(t)||!t.trim())continue;const n=new RegExp(this._escapeRegExp(t),"m");if(!i.match(n))continue;const o=e[t]||[],r=o.join("\n\n"),a=JSON.stringify(o).replace(/</g,"\\u003c").replace(/>/g,"\\u003e"),h=`<span class="annotated" data-line="${this._escapeHtml(t)}" data-anno="${this._escapeHtml(r)}" data-anno-raw='${a}'>${this._escapeHtml(t)}</span>`;i=i.replace(n,h),s.add(t)}return i.replace(/\n/g,"<br>")}_escapeRegExp(t){return t.replace(/[.*+?^${}()|[\]\\]/g,"\\$&")}_escapeHtml(t){return String(t||"").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/\"/g,"&quot;").replace(/'/g,"&#039;")}_handleAnnotationClick(t){const e=t.target,i=e?.closest(".annotated");if(!i)return;const s=i.getAttribute("data-line")||"",n=i.getAttribute("data-anno-raw")||"[]";let o=[];try{o=JSON.parse(n)}catch{o=[]}this._openAnnotationModal(s,o)}_openAnnotationModal(t,e){const i=new CustomEvent("show-dialog",{detail:{dialogTag:"genius-lyrics-annotation-dialog",dialogImport:()=>Promise.resolve(),dialogParams:{line:t,annotations:e}},bubbles:!0,composed:!0});this.dispatchEvent(i);const s=e.join("\n\n");s&&setTimeout(()=>alert(`"${t}"\n\n${s}`),100)}render(){if(!this.hass||!this.config)return L``;const t=this.hass.states[this.config.entity];if(!t)return L`
+ */class at extends rt{constructor(t){if(super(t),this.et=R,t.type!==ot)throw Error(this.constructor.directiveName+"() can only be used in child bindings")}render(t){if(t===R||null==t)return this.ft=void 0,this.et=t;if(t===M)return t;if("string"!=typeof t)throw Error(this.constructor.directiveName+"() called with a non-string value");if(t===this.et)return this.ft;this.et=t;const e=[t];return e.raw=e,this.ft={_$litType$:this.constructor.resultType,strings:e,values:[]}}}at.directiveName="unsafeHTML",at.resultType=1;const ht=(t=>(...e)=>({_$litDirective$:t,values:e}))(at);console.info("%c GENIUS-LYRICS-CARD %c 1.0.0 ","color: white; background: #1db954; font-weight: 700;","color: #1db954; background: white; font-weight: 700;");customElements.define("genius-lyrics-card",class extends st{constructor(){super(...arguments),this.config={},this._activeLine=-1}static get properties(){return{hass:{type:Object},config:{type:Object},_stateObj:{type:Object},_lyrics:{type:String},_activeLine:{type:Number}}}_renderPyongIcon(){return L`<svg class="pyong-icon" viewBox="0 0 11.37 22" aria-hidden="true"><path d="M0 7l6.16-7 3.3 7H6.89S5.5 12.1 5.5 12.17h5.87L6.09 22l.66-7H.88l2.89-8z"></path></svg>`}_isPyongUiEnabled(){return false}static getConfigElement(){return document.createElement("genius-lyrics-card-editor")}static getStubConfig(){return{entity:"",show_image:!0,show_details:!0,show_stats:!0,stats_position:"header",show_font_controls:!0,font_size:14,max_height:400,show_pyong_button:!0,show_genius_button:!0}}setConfig(t){if(!t.entity)throw new Error("You must specify an entity (Genius Lyrics sensor)");this.config={show_image:!0,show_details:!0,show_stats:!0,stats_position:"header",show_font_controls:!0,font_size:14,max_height:400,show_pyong_button:!0,show_genius_button:!0,...t}}_getFontSize(){const t=parseInt(this.config.font_size,10);return Number.isNaN(t)?14:Math.min(30,Math.max(10,t))}_updateCardConfig(t){this.config=t,this.dispatchEvent(new CustomEvent("config-changed",{detail:{config:t},bubbles:!0,composed:!0})),this.requestUpdate()}_changeFontSize(t){const e=Math.min(30,Math.max(10,this._getFontSize()+t));e!==this._getFontSize()&&this._updateCardConfig({...this.config,font_size:e})}_decreaseFontSize(){this._changeFontSize(-1)}_increaseFontSize(){this._changeFontSize(1)}shouldUpdate(){return Boolean(this.config)}updated(t){if(t.has("hass")&&this.hass&&this.config){const e=t.get("hass"),i=e?.states?.[this.config.entity],s=this.hass.states[this.config.entity];i!==s&&(this._stateObj=s,this._loadLyrics())}t.has("_activeLine")&&this._scrollToActiveLine()}connectedCallback(){super.connectedCallback(),this._syncLines()}disconnectedCallback(){super.disconnectedCallback(),this._unsubscribeLines()}_syncLines(){this._lineOffsets?this._unsubLine||!this.hass||!this.isConnected||(this._unsubLine=this.hass.connection.subscribeMessage(t=>{t.song_id===this._stateObj?.attributes?.song_id&&(this._activeLine=t.line)},{type:"genius_lyrics/subscribe_line",entity_id:this.config.entity})):this._unsubscribeLines()}_unsubscribeLines(){const t=this._unsubLine;this._unsubLine=void 0,t?.then(t=>t()).catch(()=>{})}_scrollToActiveLine(){const t=this.shadowRoot?.querySelector(".lyrics"),e=t?.querySelector(".synced-line.active");t&&e&&(t.scrollTop=e.offsetTop-t.offsetTop-(t.clientHeight-e.clientHeight)/2)}async _loadLyrics(){const t=this._stateObj?.attributes?.song_id,i=this._stateObj?.attributes?.lyrics_hash,e=t&&i?`${t}:${i}`:void 0;if(e!==this._lyricsKey&&(this._lyricsKey=e,this._lyrics=void 0,this._lineOffsets=void 0,this._activeLine=-1,this._syncLines(),e&&this.hass))try{const i=await this.hass.callWS({type:"genius_lyrics/lyrics",song_id:t});this._lyricsKey===e&&(this._lyrics=i.lyrics,this._lineOffsets=i.line_offsets||void 0,this._syncLines())}catch(i){console.warn(`Unable to load lyrics of song ${t}`,i),this._lyricsKey===e&&(this._lyrics="")}}getCardSize(){return this._hasLyrics()?4:1}_hasLyrics(){if(!this._stateObj)return!1;const t=this._getLyrics();return!(!t||!t.trim())}_isLoadingLyrics(){const t=this._stateObj?.attributes;return"loading"===t?.lyrics_status||!!t?.song_id&&void 0===this._lyrics}_getLyrics(){const t=this._stateObj?.attributes,e=t?.song_id?this._lyrics||"":t?.lyrics||t?.media_lyrics||this._stateObj?.state||"";return"string"==typeof e?e.trimStart().trimEnd():""}_getArtist(){return this._stateObj?.attributes?.artist||this._stateObj?.attributes?.media_artist||""}_getTitle(){return this._stateObj?.attributes?.title||this._stateObj?.attributes?.media_title||""}_getImage(){return this._stateObj?.attributes?.media_image||this._stateObj?.attributes?.entity_picture||this._stateObj?.attributes?.song_art||""}_getPyongs(){return this._stateObj?.attributes?.pyong_count??this._stateObj?.attributes?.media_pyong_count??null}_getHot(){return this._stateObj?.attributes?.stats_hot??this._stateObj?.attributes?.media_stats_hot??null}_getGeniusUrl(){return this._stateObj?.attributes?.song_url||this._stateObj?.attributes?.genius_url||null}_getAnnotations(){const t=this._stateObj?.attributes?.annotations||this._stateObj?.attributes?.media_annotations;if(t&&"object"==typeof t)return this._normalizeAnnotations(t);if(this.config.annotations&&"object"==typeof this.config.annotations)return this._normalizeAnnotations(this.config.annotations);if(this.config.annotations_entity&&this.hass){const t=this.hass.states[this.config.annotations_entity];if(t){let e=this.config.annotations_attribute?t.attributes?.[this.config.annotations_attribute]:t.state;if("string"==typeof e)try{e=JSON.parse(e)}catch{e=null}if(e&&"object"==typeof e)return this._normalizeAnnotations(e)}}return{}}_normalizeAnnotations(t){const e={};for(const[i,s]of Object.entries(t))Array.isArray(s)?e[i]=s.map(String):null!=s&&(e[i]=[String(s)]);return e}_handlePyong(){if(!this.hass)return;const t=this._getArtist(),e=this._getTitle(),i=`glc-pyong:${t}::${e}`,s=!("1"===localStorage.getItem(i));localStorage.setItem(i,s?"1":"0"),this.hass.connection.sendMessage({type:"fire_event",event_type:"genius_lyrics_pyong",event_data:{artist:t,title:e,pyonged:s}}),this.requestUpdate()}_isPyonged(){const t=`glc-pyong:${this._getArtist()}::${this._getTitle()}`;return"1"===localStorage.getItem(t)}_handleOpenGenius(){const t=this._getGeniusUrl();if(t)return void window.open(t,"_blank","noopener,noreferrer");const e=this._getArtist(),i=this._getTitle();if(!e&&!i)return;const s=encodeURIComponent(`${e} ${i}`.trim());window.open(`https://genius.com/search?q=${s}`,"_blank","noopener,noreferrer")}_applyAnnotations(t){const e=this._getAnnotations();if(!t||!e||0===Object.keys(e).length)return this._escapeHtml(t);let i=t;const s=new Set,n=Object.keys(e).sort((t,e)=>e.length-t.length);for(const t of n){if(s.has(t)||!t.trim())continue;const n=new RegExp(this._escapeRegExp(t),"m");if(!i.match(n))continue;const o=e[t]||[],r=o.join("\n\n"),a=JSON.stringify(o).replace(/</g,"\\u003c").replace(/>/g,"\\u003e"),h=`<span class="annotated" data-line="${this._escapeHtml(t)}" data-anno="${this._escapeHtml(r)}" data-anno-raw='${a}'>${this._escapeHtml(t)}</span>`;i=i.replace(n,h),s.add(t)}return i.replace(/\n/g,"<br>")}_escapeRegExp(t){return t.replace(/[.*+?^${}()|[\]\\]/g,"\\$&")}_escapeHtml(t){return String(t||"").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/\"/g,"&quot;").replace(/'/g,"&#039;")}_handleAnnotationClick(t){const e=t.target,i=e?.closest(".annotated");if(!i)return;const s=i.getAttribute("data-line")||"",n=i.getAttribute("data-anno-raw")||"[]";let o=[];try{o=JSON.parse(n)}catch{o=[]}this._openAnnotationModal(s,o)}_openAnnotationModal(t,e){const i=new CustomEvent("show-dialog",{detail:{dialogTag:"genius-lyrics-annotation-dialog",dialogImport:()=>Promise.resolve(),dialogParams:{line:t,annotations:e}},bubbles:!0,composed:!0});this.dispatchEvent(i);const s=e.join("\n\n");s&&setTimeout(()=>alert(`"${t}"\n\n${s}`),100)}render(){if(!this.hass||!this.config)return L``;const t=this.hass.states[this.config.entity];if(!t)return L`
         <ha-card>
           <div class="warning">Entity ${this.config.entity} not found</div>
         </ha-card>
-      `;this._stateObj=t;const e=t.state?.toLowerCase(),i=t.attributes?.media_lyrics,s="string"==typeof i&&"lyrics not found"===i.trim().toLowerCase();return"off"===e&&s?this._renderLyricsNotFound():"off"===e||"unavailable"===e||"unknown"===e?this._renderOffState():this._hasLyrics()?this._renderWithLyrics():this._renderNoLyrics()}_renderOffState(){return L`
+      `;this._stateObj=t;const e=t.state?.toLowerCase(),i=t.attributes?.media_lyrics,s="string"==typeof i&&"lyrics not found"===i.trim().toLowerCase();return"off"===e&&s?this._renderLyricsNotFound():"off"===e||"unavailable"===e||"unknown"===e?this._renderOffState():this._hasLyrics()||this._isLoadingLyrics()?this._renderWithLyrics():this._renderNoLyrics()}_renderOffState(){return L`
       <ha-card>
         <div class="no-lyrics">
           <ha-icon icon="mdi:power-off"></ha-icon>
@@ -56,7 +56,7 @@ const ot=2;class rt{constructor(t){}get _$AU(){return this._$AM._$AU}_$AT(t,e,i)
           <div class="no-lyrics-text">No lyrics found</div>
         </div>
       </ha-card>
-    `}_renderWithLyrics(){const t=this._getArtist(),e=this._getTitle(),i=this._getImage(),s=this._getLyrics(),n=this._getPyongs(),o=this._getHot(),r=this.config.show_image&&i,a=this.config.show_details,h=!1!==this.config.show_stats,l=h&&"bottom_left"===this.config.stats_position,c=h&&!l,d=!1!==this.config.show_font_controls,u=this._isPyonged(),p=this._getFontSize(),g=this._applyAnnotations(s),_=parseInt(this.config.max_height,10),f=_>0?`max-height: ${_}px; overflow-y: auto; font-size: ${p}px;`:`font-size: ${p}px;`;return L`
+    `}_renderSyncedLines(){return(this._lyrics||"").split("\n").map((t,e)=>L`<div class="synced-line ${e===this._activeLine?"active":""}">${t||"\xa0"}</div>`)}_renderWithLyrics(){const t=this._getArtist(),e=this._getTitle(),i=this._getImage(),s=this._getLyrics(),n=this._getPyongs(),o=this._getHot(),r=this.config.show_image&&i,a=this.config.show_details,h=!1!==this.config.show_stats,l=h&&"bottom_left"===this.config.stats_position,c=h&&!l,d=!1!==this.config.show_font_controls,u=this._isPyonged(),p=this._getFontSize(),g=this._applyAnnotations(s),_=parseInt(this.config.max_height,10),f=_>0?`max-height: ${_}px; overflow-y: auto; font-size: ${p}px;`:`font-size: ${p}px;`;return L`
       <ha-card>
         <div class="card-content">
           <div class="header">
@@ -77,7 +77,7 @@ const ot=2;class rt{constructor(t){}get _$AU(){return this._$AM._$AU}_$AT(t,e,i)
                 `:""}
           </div>
 
-          <div class="lyrics" style="${f}" @click="${this._handleAnnotationClick}">${g?ht(g):""}</div>
+          <div class="lyrics" style="${f}" @click="${this._handleAnnotationClick}">${g&&this._lineOffsets?this._renderSyncedLines():g?ht(g):this._isLoadingLyrics()?L`<span class="loading-lyrics">Loading lyrics…</span>`:""}</div>
 
           ${l||d||this._isPyongUiEnabled()&&this.config.show_pyong_button||this.config.show_genius_button?L`
                 <div class="actions">
@@ -158,6 +158,21 @@ const ot=2;class rt{constructor(t){}get _$AU(){return this._$AM._$AU}_$AT(t,e,i)
         color: var(--secondary-text-color);
       }
 
+      .loading-lyrics {
+        color: var(--secondary-text-color);
+        font-style: italic;
+      }
+
+      .synced-line {
+        opacity: 0.6;
+        transition: opacity 200ms ease;
+      }
+
+      .synced-line.active {
+        opacity: 1;
+        font-weight: 600;
+      }
+
       .header {
         display: grid;
         grid-template-columns: auto 1fr;
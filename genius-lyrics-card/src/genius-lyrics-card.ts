@@ -6,7 +6,11 @@ const ENABLE_PYONG_UI = false;
 
 type Hass = {
   states: Record<string, any>;
-  connection: { sendMessage: (message: any) => void };
+  connection: {
+    sendMessage: (message: any) => void;
+    subscribeMessage: <T>(callback: (message: T) => void, message: any) => Promise<() => void>;
+  };
+  callWS: <T>(message: any) => Promise<T>;
 };
 
 declare global {
@@ -25,12 +29,20 @@ class GeniusLyricsCard extends LitElement {
   public hass?: Hass;
   private config: Record<string, any> = {};
   private _stateObj?: any;
+  private _lyrics?: string;
+  private _lyricsKey?: string;
+  // start of every line of time-synced lyrics, in seconds
+  private _lineOffsets?: number[];
+  private _activeLine = -1;
+  private _unsubLine?: Promise<() => void>;
 
   static get properties() {
     return {
       hass: { type: Object },
       config: { type: Object },
       _stateObj: { type: Object },
+      _lyrics: { type: String },
+      _activeLine: { type: Number },
     };
   }
 
@@ -127,6 +139,88 @@ class GeniusLyricsCard extends LitElement {
 
       if (oldState !== newState) {
         this._stateObj = newState;
+        this._loadLyrics();
+      }
+    }
+
+    if (changedProps.has("_activeLine")) {
+      this._scrollToActiveLine();
+    }
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    this._syncLines();
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    this._unsubscribeLines();
+  }
+
+  private _syncLines() {
+    // only the index of the active line is pushed, the text is loaded once
+    if (!this._lineOffsets) {
+      this._unsubscribeLines();
+      return;
+    }
+    if (this._unsubLine || !this.hass || !this.isConnected) return;
+
+    this._unsubLine = this.hass.connection.subscribeMessage<{ song_id: number | null; line: number }>(
+      (event) => {
+        if (event.song_id === this._stateObj?.attributes?.song_id) {
+          this._activeLine = event.line;
+        }
+      },
+      { type: "genius_lyrics/subscribe_line", entity_id: this.config.entity }
+    );
+  }
+
+  private _unsubscribeLines() {
+    const unsub = this._unsubLine;
+    this._unsubLine = undefined;
+    unsub?.then((unsubscribe) => unsubscribe()).catch(() => undefined);
+  }
+
+  private _scrollToActiveLine() {
+    const container = this.shadowRoot?.querySelector(".lyrics") as HTMLElement | null;
+    const active = container?.querySelector(".synced-line.active") as HTMLElement | null;
+    if (!container || !active) return;
+
+    container.scrollTop =
+      active.offsetTop - container.offsetTop - (container.clientHeight - active.clientHeight) / 2;
+  }
+
+  private async _loadLyrics() {
+    // sensors reference their lyrics by song id, the text is not kept in the state
+    const songId = this._stateObj?.attributes?.song_id;
+    const hash = this._stateObj?.attributes?.lyrics_hash;
+    // no hash yet while the sensor is still fetching the lyrics
+    const key = songId && hash ? `${songId}:${hash}` : undefined;
+    if (key === this._lyricsKey) return;
+
+    this._lyricsKey = key;
+    this._lyrics = undefined;
+    this._lineOffsets = undefined;
+    this._activeLine = -1;
+    this._syncLines();
+    if (!key || !this.hass) return;
+
+    try {
+      const result = await this.hass.callWS<{ lyrics: string; line_offsets?: number[] | null }>({
+        type: "genius_lyrics/lyrics",
+        song_id: songId,
+      });
+      // ignore a response for a song that is no longer shown
+      if (this._lyricsKey === key) {
+        this._lyrics = result.lyrics;
+        this._lineOffsets = result.line_offsets || undefined;
+        this._syncLines();
+      }
+    } catch (err) {
+      console.warn(`Unable to load lyrics of song ${songId}`, err);
+      if (this._lyricsKey === key) {
+        this._lyrics = "";
       }
     }
   }
@@ -141,12 +235,16 @@ class GeniusLyricsCard extends LitElement {
     return !!(lyrics && lyrics.trim());
   }
 
+  private _isLoadingLyrics() {
+    const attributes = this._stateObj?.attributes;
+    return attributes?.lyrics_status === "loading" || (!!attributes?.song_id && this._lyrics === undefined);
+  }
+
   private _getLyrics() {
-    const lyrics =
-      this._stateObj?.attributes?.lyrics ||
-      this._stateObj?.attributes?.media_lyrics ||
-      this._stateObj?.state ||
-      "";
+    const attributes = this._stateObj?.attributes;
+    const lyrics = attributes?.song_id
+      ? this._lyrics || ""
+      : attributes?.lyrics || attributes?.media_lyrics || this._stateObj?.state || "";
     return typeof lyrics === "string" ? lyrics.trimStart().trimEnd() : "";
   }
 
@@ -268,6 +366,14 @@ class GeniusLyricsCard extends LitElement {
     window.open(`https://genius.com/search?q=${q}`, "_blank", "noopener,noreferrer");
   }
 
+  private _renderSyncedLines() {
+    // lines are numbered as in the lyrics text, blank ones included
+    return (this._lyrics || "").split("\n").map(
+      (line, index) =>
+        html`<div class="synced-line ${index === this._activeLine ? "active" : ""}">${line || "\u00a0"}</div>`
+    );
+  }
+
   private _applyAnnotations(lyrics: string) {
     const annotations = this._getAnnotations();
     if (!lyrics || !annotations || Object.keys(annotations).length === 0) {
@@ -381,7 +487,7 @@ class GeniusLyricsCard extends LitElement {
       return this._renderOffState();
     }
 
-    if (!this._hasLyrics()) {
+    if (!this._hasLyrics() && !this._isLoadingLyrics()) {
       return this._renderNoLyrics();
     }
 
@@ -473,7 +579,13 @@ class GeniusLyricsCard extends LitElement {
               : ""}
           </div>
 
-          <div class="lyrics" style="${lyricsStyle}" @click="${this._handleAnnotationClick}">${processedLyrics ? unsafeHTML(processedLyrics) : ""}</div>
+          <div class="lyrics" style="${lyricsStyle}" @click="${this._handleAnnotationClick}">${processedLyrics && this._lineOffsets
+            ? this._renderSyncedLines()
+            : processedLyrics
+            ? unsafeHTML(processedLyrics)
+            : this._isLoadingLyrics()
+              ? html`<span class="loading-lyrics">Loading lyrics…</span>`
+              : ""}</div>
 
           ${statsInBottomLeft ||
           showFontControls ||
@@ -575,6 +687,21 @@ class GeniusLyricsCard extends LitElement {
         color: var(--secondary-text-color);
       }
 
+      .loading-lyrics {
+        color: var(--secondary-text-color);
+        font-style: italic;
+      }
+
+      .synced-line {
+        opacity: 0.6;
+        transition: opacity 200ms ease;
+      }
+
+      .synced-line.active {
+        opacity: 1;
+        font-weight: 600;
+      }
+
       .header {
         display: grid;
         grid-template-columns: auto 1fr;
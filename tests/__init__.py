@@ -0,0 +1 @@
+"""Tests for the Genius Lyrics integration."""
@@ -0,0 +1,42 @@
+"""Common helpers for the Genius Lyrics tests."""
+
+import asyncio
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+MEDIA_PLAYER = "media_player.test"
+SENSOR = "sensor.genius_lyrics_test_lyrics"
+
+# resolves to song 2001 on the fake Genius API
+TRACK_A = {
+    "media_content_type": "music",
+    "media_artist": "Aurora Vale",
+    "media_title": "Glass Harbor - 2019 Remaster",
+}
+# resolves to song 2004 on the fake Genius API
+TRACK_B = {
+    "media_content_type": "music",
+    "media_artist": "Kestrel Lane",
+    "media_title": "Paper Satellites",
+}
+
+
+async def async_settle(hass: HomeAssistant) -> None:
+    """Let lookups against the fake API finish."""
+    for _ in range(50):
+        await asyncio.sleep(0.02)
+        await hass.async_block_till_done()
+
+
+async def async_play(
+    hass: HomeAssistant, track: dict[str, str], entity_id: str = MEDIA_PLAYER
+) -> None:
+    """Play a track on a media player and wait for its sensor's lookup."""
+    hass.states.async_set(entity_id, "playing", track)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await async_settle(hass)
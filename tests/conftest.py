@@ -0,0 +1,49 @@
+"""Fixtures for the Genius Lyrics tests.
+
+Requires `pytest-homeassistant-custom-component` and `lyricsgenius`.
+"""
+
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_genius import FakeGenius
+from custom_components.genius_lyrics.client import GeniusClient
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the integration in every test."""
+    yield
+
+
+@pytest.fixture
+async def fake_genius(socket_enabled):
+    """Serve a stand-in of the Genius API on localhost."""
+    server = FakeGenius()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def setup_entry(hass, fake_genius):
+    """Set up an entry monitoring `media_player.test`, talking to the fake API."""
+    hass.states.async_set("media_player.test", "idle", {})
+    entry = MockConfigEntry(
+        domain="genius_lyrics",
+        data={"monitor_all": False, "entities": ["media_player.test"]},
+        options={"prefetch_count": 0},
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.genius_lyrics.GeniusClient",
+        partial(GeniusClient, api_root=fake_genius.api_root),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
@@ -0,0 +1,106 @@
+"""Tests for the lyrics caches."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.genius_lyrics.cache import LyricsCache, MissCache
+from custom_components.genius_lyrics.const import (
+    MISS_RECHECK_INTERVAL,
+    MISS_RECHECK_MAX_INTERVAL,
+)
+from custom_components.genius_lyrics.models import LyricsResult
+
+
+def _result(song_id: int) -> LyricsResult:
+    return LyricsResult(
+        song_id=song_id,
+        url=f"https://genius.com/{song_id}",
+        artist="Aurora Vale",
+        title=f"Song {song_id}",
+        lyrics=f"Lyrics of {song_id}",
+    )
+
+
+async def test_lyrics_cache_ttl(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Cached lyrics expire once their time to live has passed."""
+    cache = LyricsCache(hass, max_entries=10, ttl=60)
+    cache.async_set("a", _result(1))
+
+    freezer.tick(timedelta(seconds=59))
+    assert cache.async_get("a") == _result(1)
+    assert cache.async_get_song(1) == _result(1)
+
+    freezer.tick(timedelta(seconds=2))
+    assert cache.async_get_song(1) is None
+    assert cache.async_get("a") is None
+    assert len(cache) == 0
+
+
+async def test_lyrics_cache_lru(hass: HomeAssistant) -> None:
+    """The least recently used lyrics are evicted above the size bound."""
+    cache = LyricsCache(hass, max_entries=2, ttl=60)
+    cache.async_set("a", _result(1))
+    cache.async_set("b", _result(2))
+    # "a" becomes the most recently used
+    assert cache.async_get("a") is not None
+
+    cache.async_set("c", _result(3))
+    assert cache.async_get("b") is None
+    assert cache.async_get("a") == _result(1)
+    assert cache.async_get("c") == _result(3)
+
+
+async def test_lyrics_cache_persisted(
+    hass: HomeAssistant, hass_storage, freezer: FrozenDateTimeFactory
+) -> None:
+    """Lyrics are restored from storage, without the expired ones."""
+    cache = LyricsCache(hass, max_entries=10, ttl=60)
+    cache.async_set("old", _result(1))
+    freezer.tick(timedelta(seconds=30))
+    cache.async_set("new", _result(2))
+    await cache.async_save()
+
+    freezer.tick(timedelta(seconds=45))
+    restored = LyricsCache(hass, max_entries=10, ttl=60)
+    await restored.async_load()
+    assert len(restored) == 1
+    assert restored.async_get("new") == _result(2)
+
+
+async def test_miss_recheck_backoff(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Every repeated miss doubles the time until a query is searched again."""
+    cache = MissCache(hass, max_entries=10)
+    assert not cache.async_is_suppressed("a")
+
+    interval = MISS_RECHECK_INTERVAL
+    for _ in range(3):
+        cache.async_record_miss("a")
+        freezer.tick(timedelta(seconds=interval - 1))
+        assert cache.async_is_suppressed("a")
+        freezer.tick(timedelta(seconds=2))
+        assert not cache.async_is_suppressed("a")
+        interval *= 2
+
+    cache.async_clear("a")
+    cache.async_record_miss("a")
+    freezer.tick(timedelta(seconds=MISS_RECHECK_INTERVAL + 1))
+    assert not cache.async_is_suppressed("a")
+
+
+async def test_miss_recheck_capped(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """The re-check interval stops growing at its maximum."""
+    cache = MissCache(hass, max_entries=10)
+    for _ in range(20):
+        cache.async_record_miss("a")
+
+    freezer.tick(timedelta(seconds=MISS_RECHECK_MAX_INTERVAL + 1))
+    assert not cache.async_is_suppressed("a")
@@ -0,0 +1,91 @@
+"""Tests for the Genius client and its rate limiting."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.genius_lyrics.client import GeniusClient
+from custom_components.genius_lyrics.const import RETRY_AFTER_DEFAULT, RETRY_AFTER_MAX
+from custom_components.genius_lyrics.metrics import THROTTLED, LyricsMetrics
+from custom_components.genius_lyrics.ratelimit import TokenBucket, parse_retry_after
+
+API_ROOT = "http://genius.test/api/"
+
+
+def test_parse_retry_after() -> None:
+    """Test Retry-After in seconds and as an HTTP date."""
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert 85 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 90
+    retry_at = datetime.now(timezone.utc) - timedelta(seconds=90)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0
+
+
+async def test_token_bucket_burst_then_rate() -> None:
+    """A burst of requests passes at once, then they follow the rate."""
+    bucket = TokenBucket(rate=20, burst=3)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(3):
+        await bucket.async_acquire()
+    assert loop.time() - start < 0.02
+
+    for _ in range(2):
+        await bucket.async_acquire()
+    # two more tokens at 20 per second
+    assert loop.time() - start >= 0.09
+
+
+async def test_token_bucket_blocked() -> None:
+    """A blocked bucket holds back requests, then lets a single one through."""
+    bucket = TokenBucket(rate=10, burst=5)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    bucket.block(0.1)
+    await bucket.async_acquire()
+    assert loop.time() - start >= 0.1
+    await bucket.async_acquire()
+    assert loop.time() - start >= 0.19
+
+
+async def test_throttled_request_retried(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 429 holds back requests for its Retry-After, capped, then retries."""
+    responses = [
+        AiohttpClientMockResponse(
+            "get", API_ROOT, status=429, headers={"Retry-After": "600"}
+        ),
+        AiohttpClientMockResponse("get", API_ROOT, status=429),
+        AiohttpClientMockResponse("get", API_ROOT, json={"response": {"song": 1}}),
+    ]
+
+    async def respond(method, url, data):
+        return responses.pop(0)
+
+    aioclient_mock.get(f"{API_ROOT}songs/1", side_effect=respond)
+    metrics = LyricsMetrics()
+    client = GeniusClient(hass, api_root=API_ROOT, metrics=metrics)
+
+    with patch.object(TokenBucket, "block") as block:
+        assert await client._async_request(f"{API_ROOT}songs/1") == {"song": 1}
+
+    assert [call.args for call in block.call_args_list] == [
+        (RETRY_AFTER_MAX,),
+        (RETRY_AFTER_DEFAULT,),
+    ]
+    assert metrics.counters[THROTTLED] == 2
+    assert aioclient_mock.call_count == 3
@@ -0,0 +1,146 @@
+"""Tests for the Genius Lyrics lookup pipeline."""
+
+import asyncio
+from datetime import timedelta
+
+from aiohttp import ClientResponseError
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_genius import song_path
+from custom_components.genius_lyrics.const import (
+    DATA_FETCHER,
+    DATA_LYRICS_CACHE,
+    DATA_RESOLUTION_INDEX,
+    DEFAULT_CACHE_TTL,
+    DOMAIN,
+)
+from custom_components.genius_lyrics.helpers import normalize_query
+
+
+async def test_get_song_fetched_once(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """An uncached song is fetched once for concurrent callers, then cached."""
+    fetcher = hass.data[DOMAIN][setup_entry.entry_id][DATA_FETCHER]
+
+    first, second = await asyncio.gather(
+        fetcher.async_get_song(2003), fetcher.async_get_song(2003)
+    )
+    assert first is second
+    assert first.song_id == 2003
+    assert first.lyrics
+    # the song on the API and its lyrics page
+    assert fake_genius.requests == 2
+
+    assert await fetcher.async_get_song(2003) is first
+    assert fake_genius.requests == 2
+
+
+async def test_truncated_title_indexed(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """A title resolved once is looked up through the index for other suffixes."""
+    fetcher = hass.data[DOMAIN][setup_entry.entry_id][DATA_FETCHER]
+    song = await fetcher.async_fetch("Delphine Moss", "Harbour Lights")
+    assert song.song_id == 2007
+    requests = fake_genius.requests
+
+    result = await fetcher.async_fetch("Delphine Moss", "Harbour Lights - Demo Take")
+    assert result.song_id == 2007
+    # its lyrics page only, no search
+    assert fake_genius.requests == requests + 1
+
+
+async def test_concurrent_lookups_coalesced(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """Concurrent lookups of one track share a single search and page fetch."""
+    fetcher = hass.data[DOMAIN][setup_entry.entry_id][DATA_FETCHER]
+    fake_genius._latency = 0.05
+
+    results = await asyncio.gather(
+        *(
+            fetcher.async_fetch("Aurora Vale", "Glass Harbor - 2019 Remaster")
+            for _ in range(5)
+        )
+    )
+    assert results[0].song_id == 2001
+    assert all(result is results[0] for result in results)
+    # one search and one lyrics page
+    assert fake_genius.requests == 2
+
+
+async def test_cancelled_caller_leaves_lookup(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """A cancelled caller does not abort the lookup the others wait for."""
+    fetcher = hass.data[DOMAIN][setup_entry.entry_id][DATA_FETCHER]
+    fake_genius._latency = 0.05
+
+    first = asyncio.create_task(fetcher.async_fetch("Kestrel Lane", "Paper Satellites"))
+    second = asyncio.create_task(
+        fetcher.async_fetch("Kestrel Lane", "Paper Satellites")
+    )
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert (await second).song_id == 2004
+    assert first.cancelled()
+    assert fake_genius.requests == 2
+
+
+async def test_miss_not_searched_again(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """A query that found nothing is not searched again right away."""
+    fetcher = hass.data[DOMAIN][setup_entry.entry_id][DATA_FETCHER]
+
+    assert await fetcher.async_fetch("Nobody Known", "Unwritten Song") is None
+    requests = fake_genius.requests
+    assert requests
+
+    assert await fetcher.async_fetch("nobody known", "Unwritten  Song") is None
+    assert fake_genius.requests == requests
+
+
+async def test_expired_lyrics_resolved_through_index(
+    hass: HomeAssistant,
+    setup_entry,
+    fake_genius,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Once its lyrics expired, a track goes straight to its lyrics page."""
+    fetcher = hass.data[DOMAIN][setup_entry.entry_id][DATA_FETCHER]
+    await fetcher.async_fetch("Aurora Vale", "Glass Harbor - 2019 Remaster")
+    assert fake_genius.requests == 2
+
+    freezer.tick(timedelta(days=DEFAULT_CACHE_TTL + 1))
+    result = await fetcher.async_fetch("Aurora Vale", "Glass Harbor - 2019 Remaster")
+    assert result.song_id == 2001
+    assert result.lyrics
+    # its lyrics page only, no search
+    assert fake_genius.requests == 3
+
+
+async def test_gone_page_dropped_from_index(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """A song whose page is gone leaves the index, the track is searched again."""
+    entry_data = hass.data[DOMAIN][setup_entry.entry_id]
+    fetcher, index = entry_data[DATA_FETCHER], entry_data[DATA_RESOLUTION_INDEX]
+    await fetcher.async_fetch("Kestrel Lane", "Paper Satellites")
+    entry_data[DATA_LYRICS_CACHE]._entries.clear()
+    key = normalize_query("Kestrel Lane", "Paper Satellites")
+    assert index.async_get(key).song_id == 2004
+
+    # the lyrics page is gone
+    fake_genius._by_path.pop(song_path(fake_genius._by_id[2004]))
+    requests = fake_genius.requests
+    with pytest.raises(ClientResponseError):
+        await fetcher.async_fetch("Kestrel Lane", "Paper Satellites")
+    assert index.async_get(key) is None
+    # the indexed page, then a search and the page of its hit, gone as well
+    assert fake_genius.requests == requests + 3
@@ -0,0 +1,68 @@
+"""Tests for matching Genius search hits."""
+
+import pytest
+
+from benchmarks.fake_genius import load_songs, search_response
+from custom_components.genius_lyrics.genius import GeniusPatched, normalize_match_text
+
+BASE_URL = "http://genius.test"
+
+
+@pytest.fixture(name="genius")
+def genius_fixture() -> GeniusPatched:
+    """Return the matcher, it never touches the network."""
+    return GeniusPatched("public", verbose=False, skip_non_songs=True)
+
+
+def _match(genius: GeniusPatched, title: str, artist: str) -> dict | None:
+    response = search_response(load_songs(), f"{title} {artist}", BASE_URL)
+    return genius._get_item_from_search_response(
+        response, title, type_="song", result_type="title", artist=artist
+    )
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Beyoncé (feat. JAY-Z)", "beyonce"),
+        ("Don’t Stop", "dont stop"),
+        ("Salt & Signal", "salt and signal"),
+        ("  Glass   Harbor!! ", "glass harbor"),
+    ],
+)
+def test_normalize_match_text(value: str, expected: str) -> None:
+    """Test titles and artists are normalized for comparison."""
+    assert normalize_match_text(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("title", "artist", "song_id"),
+    [
+        ("Glass Harbor", "Aurora Vale", 2001),
+        # case, accents and punctuation
+        ("glass harbor", "AURORA VALE", 2001),
+        ("Salt and Signal", "Mira Okafor", 2003),
+        # metadata after a hyphen the title cleanup left
+        ("Harbour Lights - Demo Take", "Delphine Moss", 2007),
+        # featured artist in the player's artist
+        ("Copper Wire", "Northbound Static feat. Ada Brooks", 2006),
+    ],
+)
+def test_best_hit_matched(
+    genius: GeniusPatched, title: str, artist: str, song_id: int
+) -> None:
+    """The searched song wins over the decoys and track lists ranked above it."""
+    assert _match(genius, title, artist)["id"] == song_id
+
+
+@pytest.mark.parametrize(
+    ("title", "artist"),
+    [
+        ("Unwritten Song", "Nobody Known"),
+        # right title, another artist
+        ("Glass Harbor", "Completely Different Band"),
+    ],
+)
+def test_no_hit_matched(genius: GeniusPatched, title: str, artist: str) -> None:
+    """Hits scoring below the threshold are not taken."""
+    assert _match(genius, title, artist) is None
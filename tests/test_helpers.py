@@ -0,0 +1,91 @@
+"""Golden tests for the title and lyrics cleaning helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.genius_lyrics.helpers import cleanup_lyrics, clean_song_title
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Glass Harbor - 2019 Remaster", "Glass Harbor"),
+        ("Glass Harbor - Remastered 2009", "Glass Harbor"),
+        ("Night Ferry (Live at the Roundhouse)", "Night Ferry"),
+        ("Salt & Signal [Radio Edit]", "Salt & Signal"),
+        ("Slow Weather - Single Version", "Slow Weather"),
+        ("Copper Wire (feat. Ada Brooks)", "Copper Wire"),
+        ("Copper Wire [feat. Ada Brooks] - 2020 Remaster", "Copper Wire"),
+        ("Winter Index (2021 Stereo Mix)", "Winter Index"),
+        ("Long Way Round (Anniversary Edition)", "Long Way Round"),
+        ("Harbour Lights - Acoustic Session", "Harbour Lights - Acoustic Session"),
+        ("Paper Satellites", "Paper Satellites"),
+        ("Song 2", "Song 2"),
+    ],
+)
+def test_clean_song_title(title: str, expected: str) -> None:
+    """Test metadata is removed from song titles."""
+    assert clean_song_title(title) == expected
+
+
+@pytest.mark.parametrize(
+    ("lyrics", "pyongs_count", "expected"),
+    [
+        # header
+        (
+            "12 Contributors Glass Harbor Lyrics[Verse 1]\nLanterns low",
+            None,
+            "[Verse 1]\nLanterns low",
+        ),
+        # "Embed" trailer, with and without the pyong count before it
+        ("[Chorus]\nHold the line3Embed", 3, "[Chorus]\nHold the line"),
+        ("[Chorus]\nHold the line2024Embed", None, "[Chorus]\nHold the line2024"),
+        ("[Chorus]\nHold the lineEmbed", 7, "[Chorus]\nHold the line"),
+        # description blurb, along with everything before it
+        (
+            "3 Contributors Glass Harbor LyricsWritten over a single night in "
+            "the studio… Read More [Verse 1]\nLanterns low",
+            None,
+            "[Verse 1]\nLanterns low",
+        ),
+        (
+            "Recorded live\nin one take… Read More\n[Intro]\nOh",
+            None,
+            "[Intro]\nOh",
+        ),
+        # only the last marker counts
+        (
+            "First… Read More Second… Read More [Outro]\nFade",
+            None,
+            "[Outro]\nFade",
+        ),
+        # without the ellipsis it is part of the lyrics
+        ("[Verse]\nRead More books", None, "[Verse]\nRead More books"),
+        # ticket ads and recommendations
+        (
+            "[Verse]\nOne lineSee Aurora Vale LiveGet tickets as low as $45\n"
+            "You might also like[Chorus]\nTwo",
+            None,
+            "[Verse]\nOne line\n[Chorus]\nTwo",
+        ),
+        (
+            "[Verse]\nYou might also like it here",
+            None,
+            "[Verse]\nYou might also like it here",
+        ),
+        # everything at once
+        (
+            "5 Contributors Glass Harbor LyricsA song about leaving… Read More "
+            "[Verse 1]\nLanterns lowYou might also like[Chorus]\nHarbor12Embed",
+            12,
+            "[Verse 1]\nLanterns low[Chorus]\nHarbor",
+        ),
+    ],
+)
+def test_cleanup_lyrics(lyrics: str, pyongs_count: int | None, expected: str) -> None:
+    """Test scraping noise is removed from lyrics."""
+    song = SimpleNamespace(
+        lyrics=lyrics, artist="Aurora Vale", pyongs_count=pyongs_count
+    )
+    assert cleanup_lyrics(song) == expected
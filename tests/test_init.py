@@ -0,0 +1,51 @@
+"""Tests for the Genius Lyrics integration setup."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+import homeassistant.helpers.entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.genius_lyrics.sensor import GeniusLyricsSensor
+
+from .common import MEDIA_PLAYER, SENSOR
+
+
+async def test_media_player_removed(hass: HomeAssistant, setup_entry) -> None:
+    """Removing a selected media player removes its sensor once."""
+    # adding the player to the registry notifies of a new player
+    assert await async_setup_component(hass, "persistent_notification", {})
+    registry = er.async_get(hass)
+    hass.states.async_remove(MEDIA_PLAYER)
+    registry.async_get_or_create(
+        "media_player", "demo", "test", suggested_object_id="test"
+    )
+    await hass.async_block_till_done()
+    assert registry.async_get(SENSOR) is not None
+
+    with patch.object(
+        GeniusLyricsSensor,
+        "async_remove",
+        autospec=True,
+        side_effect=GeniusLyricsSensor.async_remove,
+    ) as sensor_remove:
+        registry.async_remove(MEDIA_PLAYER)
+        await hass.async_block_till_done()
+
+    assert sensor_remove.call_count == 1
+    assert registry.async_get(SENSOR) is None
+    assert hass.states.get(SENSOR) is None
+    assert setup_entry.options["entities"] == []
+
+
+async def test_media_player_deselected(hass: HomeAssistant, setup_entry) -> None:
+    """Deselecting a media player removes its sensor without a reload."""
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        hass.config_entries.async_update_entry(
+            setup_entry, options={**setup_entry.options, "entities": []}
+        )
+        await hass.async_block_till_done()
+
+    assert not reload.called
+    assert er.async_get(hass).async_get(SENSOR) is None
+    assert hass.states.get(SENSOR) is None
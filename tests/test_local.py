@@ -0,0 +1,71 @@
+"""Tests for the local lyrics library."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from custom_components.genius_lyrics import local
+from custom_components.genius_lyrics.local import LRC, TXT, _scan, parse_lrc
+
+
+def _library(root: Path) -> None:
+    """Write a small library of lyrics and audio files."""
+    album = root / "Kestrel Lane" / "Album"
+    album.mkdir(parents=True)
+    (root / "Aurora Vale - Glass Harbor.txt").write_text("Line one\nLine two\n")
+    (album / "03 Night Ferry.lrc").write_text(
+        "[ar:Kestrel Lane]\n[ti:Night Ferry]\n[00:12.50]Second\n[00:01.00]First\n"
+    )
+    # audio without lyrics tags
+    (album / "04 Salt & Signal.mp3").write_bytes(b"")
+
+
+def test_parse_lrc() -> None:
+    """Test LRC tags and timed lines, repeated lines included, in order."""
+    tags, lines = parse_lrc(
+        "[ar:Kestrel Lane]\n[ti:Night Ferry]\n[00:12.50]Second\n"
+        "[00:01.00][00:20.00]First and third\n"
+    )
+    assert tags == {"ar": "Kestrel Lane", "ti": "Night Ferry"}
+    assert lines == [
+        (1.0, "First and third"),
+        (12.5, "Second"),
+        (20.0, "First and third"),
+    ]
+
+
+def test_scan_indexes_files_with_lyrics(tmp_path: Path) -> None:
+    """Only files with lyrics are indexed, the others are remembered apart."""
+    _library(tmp_path)
+    files, skipped, read = _scan(str(tmp_path), {}, {})
+
+    assert read == 3
+    assert {path: file[2:] for path, file in files.items()} == {
+        "Aurora Vale - Glass Harbor.txt": [TXT, "Aurora Vale", "Glass Harbor"],
+        os.path.join("Kestrel Lane", "Album", "03 Night Ferry.lrc"): [
+            LRC,
+            "Kestrel Lane",
+            "Night Ferry",
+        ],
+    }
+    assert list(skipped) == [
+        os.path.join("Kestrel Lane", "Album", "04 Salt & Signal.mp3")
+    ]
+
+
+def test_rescan_reads_changed_files_only(tmp_path: Path) -> None:
+    """A rescan reads new and modified files, not the ones it already knows."""
+    _library(tmp_path)
+    files, skipped, _ = _scan(str(tmp_path), {}, {})
+
+    with patch.object(local, "_index_file", wraps=local._index_file) as index_file:
+        assert _scan(str(tmp_path), files, skipped) == (files, skipped, 0)
+        assert not index_file.called
+
+        (tmp_path / "Aurora Vale - Glass Harbor.txt").write_text("Line one\n")
+        (tmp_path / "Juniper Reyes - Slow Weather.txt").write_text("Rain\n")
+        new_files, new_skipped, read = _scan(str(tmp_path), files, skipped)
+
+    assert read == 2
+    assert len(new_files) == 3
+    assert new_skipped == skipped
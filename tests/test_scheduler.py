@@ -0,0 +1,110 @@
+"""Tests for the prioritized scheduling of lookups."""
+
+import asyncio
+
+from homeassistant.core import State
+
+from custom_components.genius_lyrics.metrics import (
+    QUEUE_DEPTH,
+    QUEUE_WAIT,
+    LyricsMetrics,
+)
+from custom_components.genius_lyrics.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_IDLE,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PLAYING,
+    FetchScheduler,
+    sensor_priority,
+)
+
+
+def test_sensor_priority() -> None:
+    """Sensors of playing players go before the others."""
+    assert sensor_priority(State("media_player.a", "playing")) == PRIORITY_PLAYING
+    assert sensor_priority(State("media_player.a", "buffering")) == PRIORITY_PLAYING
+    assert sensor_priority(State("media_player.a", "paused")) == PRIORITY_IDLE
+    assert sensor_priority(None) == PRIORITY_IDLE
+
+
+async def test_priority_order() -> None:
+    """Waiting lookups run by priority class, then by arrival."""
+    metrics = LyricsMetrics()
+    scheduler = FetchScheduler(metrics, workers=1)
+    started = []
+    release = asyncio.Event()
+
+    async def job(name: str) -> str:
+        started.append(name)
+        if name == "first":
+            await release.wait()
+        return name
+
+    def run(name: str, priority: int) -> asyncio.Task[str]:
+        ticket = scheduler.async_ticket(priority)
+        return asyncio.create_task(scheduler.async_run(ticket, lambda: job(name)))
+
+    first = run("first", PRIORITY_BACKGROUND)
+    await asyncio.sleep(0)
+    tasks = [
+        run("background", PRIORITY_BACKGROUND),
+        run("idle", PRIORITY_IDLE),
+        run("playing", PRIORITY_PLAYING),
+        run("service", PRIORITY_INTERACTIVE),
+        run("playing too", PRIORITY_PLAYING),
+    ]
+    await asyncio.sleep(0)
+    assert len(scheduler) == 5
+    assert metrics.gauges[QUEUE_DEPTH] == 5
+
+    release.set()
+    await asyncio.gather(first, *tasks)
+    assert started == [
+        "first",
+        "service",
+        "playing",
+        "playing too",
+        "idle",
+        "background",
+    ]
+    assert len(scheduler) == 0
+    assert scheduler.running == 0
+    assert metrics.gauges[QUEUE_DEPTH] == 0
+    assert metrics.histogram(QUEUE_WAIT).count == 6
+
+
+async def test_promote_and_cancel() -> None:
+    """A promoted lookup moves up the queue, a cancelled one leaves it."""
+    scheduler = FetchScheduler(LyricsMetrics(), workers=1)
+    started = []
+    release = asyncio.Event()
+
+    async def job(name: str) -> None:
+        started.append(name)
+        if name == "first":
+            await release.wait()
+
+    tickets = {}
+    tasks = {}
+    for name in ("first", "idle", "background", "gone"):
+        tickets[name] = scheduler.async_ticket(
+            PRIORITY_IDLE if name == "idle" else PRIORITY_BACKGROUND
+        )
+        tasks[name] = asyncio.create_task(
+            scheduler.async_run(tickets[name], lambda name=name: job(name))
+        )
+        await asyncio.sleep(0)
+
+    # a player started playing the track of a background lookup
+    scheduler.async_promote(tickets["background"], PRIORITY_PLAYING)
+    # never lowered again
+    scheduler.async_promote(tickets["background"], PRIORITY_BACKGROUND)
+    tasks["gone"].cancel()
+    await asyncio.sleep(0)
+    assert len(scheduler) == 2
+
+    release.set()
+    await asyncio.gather(tasks["first"], tasks["idle"], tasks["background"])
+    assert started == ["first", "background", "idle"]
+    assert tasks["gone"].cancelled()
+    assert scheduler.running == 0
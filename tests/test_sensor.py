@@ -0,0 +1,140 @@
+"""Tests for the Genius Lyrics sensor."""
+
+import asyncio
+from datetime import timedelta
+from functools import partial
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
+
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from benchmarks.fake_genius import FakeGenius
+from custom_components.genius_lyrics.client import GeniusClient
+from custom_components.genius_lyrics.const import DATA_LYRICS_SENSORS, DOMAIN
+
+from .common import (
+    MEDIA_PLAYER,
+    SENSOR,
+    TRACK_A,
+    TRACK_B,
+    async_play,
+    async_settle,
+)
+
+
+async def _async_restart(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    fake_genius: FakeGenius,
+    extra_data: dict[str, Any],
+) -> None:
+    """Set the entry up again, restoring its sensor with extra data."""
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await async_settle(hass)
+    hass.states.async_remove(SENSOR)
+    mock_restore_cache_with_extra_data(hass, [(State(SENSOR, "on"), extra_data)])
+    with patch(
+        "custom_components.genius_lyrics.GeniusClient",
+        partial(GeniusClient, api_root=fake_genius.api_root),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await async_settle(hass)
+
+
+async def test_track_flip_back_while_fetching(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """A track that comes back after its fetch was cancelled is fetched again."""
+    fake_genius._latency = 0.3
+    hass.states.async_set(MEDIA_PLAYER, "playing", TRACK_A)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await asyncio.sleep(0.1)
+
+    # A -> B -> A within the settle delay, while A is being fetched
+    hass.states.async_set(MEDIA_PLAYER, "playing", TRACK_B)
+    await hass.async_block_till_done()
+    hass.states.async_set(MEDIA_PLAYER, "playing", TRACK_A)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await async_settle(hass)
+
+    state = hass.states.get(SENSOR)
+    assert state.state == "on"
+    assert state.attributes["song_id"] == 2001
+    assert state.attributes["lyrics_hash"]
+
+
+async def test_newer_track_replaces_fetch(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """The lyrics of an outdated fetch are never published."""
+    fake_genius._latency = 0.3
+    song_ids = []
+    hass.bus.async_listen(
+        "state_changed",
+        lambda event: event.data["entity_id"] == SENSOR
+        and song_ids.append(event.data["new_state"].attributes.get("song_id")),
+    )
+    hass.states.async_set(MEDIA_PLAYER, "playing", TRACK_A)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await asyncio.sleep(0.1)
+
+    hass.states.async_set(MEDIA_PLAYER, "playing", TRACK_B)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await async_settle(hass)
+
+    assert hass.states.get(SENSOR).attributes["song_id"] == 2004
+    assert 2001 not in song_ids
+
+
+async def test_metric_sensor_names(hass: HomeAssistant, setup_entry) -> None:
+    """The metric sensors are named from the translations."""
+    state = hass.states.get("sensor.genius_lyrics_lookup_latency")
+    assert state.attributes["friendly_name"] == "Genius Lyrics Lookup latency"
+    state = hass.states.get("sensor.genius_lyrics_lookup_queue")
+    assert state.attributes["friendly_name"] == "Genius Lyrics Lookup queue"
+
+
+async def test_restore_same_track(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """After a restart the song of a track still playing is taken from the cache."""
+    await async_play(hass, TRACK_A)
+    sensor = hass.data[DOMAIN][setup_entry.entry_id][DATA_LYRICS_SENSORS][MEDIA_PLAYER]
+    extra_data = sensor.extra_restore_state_data.as_dict()
+    assert extra_data["song_id"] == 2001
+    requests = fake_genius.requests
+
+    await _async_restart(hass, setup_entry, fake_genius, extra_data)
+
+    state = hass.states.get(SENSOR)
+    assert state.attributes["song_id"] == 2001
+    assert state.attributes["lyrics_hash"]
+    assert state.attributes["lyrics_status"] == "loaded"
+    assert fake_genius.requests == requests
+
+
+async def test_restore_other_track(
+    hass: HomeAssistant, setup_entry, fake_genius
+) -> None:
+    """After a restart a track changed meanwhile is looked up."""
+    await async_play(hass, TRACK_A)
+    sensor = hass.data[DOMAIN][setup_entry.entry_id][DATA_LYRICS_SENSORS][MEDIA_PLAYER]
+    extra_data = sensor.extra_restore_state_data.as_dict()
+    hass.states.async_set(MEDIA_PLAYER, "playing", TRACK_B)
+
+    await _async_restart(hass, setup_entry, fake_genius, extra_data)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await async_settle(hass)
+
+    assert hass.states.get(SENSOR).attributes["song_id"] == 2004
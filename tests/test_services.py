@@ -0,0 +1,57 @@
+"""Tests for the Genius Lyrics services."""
+
+from homeassistant.core import HomeAssistant
+
+from .common import SENSOR, TRACK_A, async_play
+
+
+async def test_search_lyrics_not_found_clears_song(
+    hass: HomeAssistant, setup_entry
+) -> None:
+    """A search without lyrics leaves nothing of the previous song on the entity."""
+    await async_play(hass, TRACK_A)
+    assert hass.states.get(SENSOR).attributes["song_id"] == 2001
+
+    await hass.services.async_call(
+        "genius_lyrics",
+        "search_lyrics",
+        {
+            "entity_id": SENSOR,
+            "media_artist": "Nobody Known",
+            "media_title": "Unwritten Song",
+        },
+        blocking=True,
+    )
+
+    state = hass.states.get(SENSOR)
+    assert state.state == "off"
+    assert state.attributes["media_artist"] == "Nobody Known"
+    assert state.attributes["media_title"] == "Unwritten Song"
+    assert state.attributes["media_lyrics"] == "Lyrics not found"
+    for attribute in (
+        "song_id",
+        "lyrics_hash",
+        "media_image",
+        "media_pyong_count",
+        "media_stats_hot",
+    ):
+        assert state.attributes[attribute] is None
+    assert "entity_picture" not in state.attributes
+
+
+async def test_services_removed_with_last_entry(
+    hass: HomeAssistant, setup_entry
+) -> None:
+    """The services go away with the last entry and come back with it."""
+    for service in ("search_lyrics", "search_lyrics_batch"):
+        assert hass.services.has_service("genius_lyrics", service)
+
+    assert await hass.config_entries.async_unload(setup_entry.entry_id)
+    await hass.async_block_till_done()
+    for service in ("search_lyrics", "search_lyrics_batch"):
+        assert not hass.services.has_service("genius_lyrics", service)
+
+    assert await hass.config_entries.async_setup(setup_entry.entry_id)
+    await hass.async_block_till_done()
+    for service in ("search_lyrics", "search_lyrics_batch"):
+        assert hass.services.has_service("genius_lyrics", service)
@@ -0,0 +1,51 @@
+"""Tests for the active line of time-synced lyrics."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from custom_components.genius_lyrics.synced import NO_LINE, LineTracker, active_line
+
+
+def test_active_line() -> None:
+    """Test the line playing at a position."""
+    offsets = [1.0, 10.0, 20.0]
+    assert active_line(offsets, 0.5) == NO_LINE
+    assert active_line(offsets, 1.0) == 0
+    assert active_line(offsets, 19.9) == 1
+    assert active_line(offsets, 300.0) == 2
+
+
+async def test_subscribe_receives_line_once(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A new subscriber receives the active line once, then every change."""
+    tracker = LineTracker(hass)
+    tracker.async_set_lyrics(2001, [0.0, 10.0, 20.0])
+    tracker.async_update_player(
+        State(
+            "media_player.test",
+            "playing",
+            {"media_position": 5, "media_position_updated_at": dt_util.utcnow()},
+        )
+    )
+    # nobody follows the lines, the tracker falls behind
+    freezer.tick(timedelta(seconds=10))
+
+    lines = []
+    unsubscribe = tracker.async_subscribe(
+        lambda song_id, line: lines.append((song_id, line))
+    )
+    assert lines == [(2001, 1)]
+
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert lines == [(2001, 1), (2001, 2)]
+
+    unsubscribe()
+    tracker.async_stop()
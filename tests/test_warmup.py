@@ -0,0 +1,65 @@
+"""Tests for the startup warm-up of the sensors."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.genius_lyrics.warmup import WarmUpQueue
+
+
+async def test_warm_up_order(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Lookups start one per interval, playing before paused before idle."""
+    queue = WarmUpQueue(hass, interval=1)
+    started = []
+    for name, state in (
+        ("idle", "idle"),
+        ("off", "off"),
+        ("paused", "paused"),
+        ("playing", "playing"),
+        ("gone", "playing"),
+        ("unknown", None),
+    ):
+        cancel = queue.async_add(
+            State(f"media_player.{name}", state) if state else None,
+            lambda name=name: started.append(name),
+        )
+    # the last one queued is cancelled before its turn
+    cancel()
+    queue.async_add(
+        State("media_player.buffering", "buffering"),
+        lambda: started.append("buffering"),
+    )
+
+    await hass.async_block_till_done()
+    assert started == []
+    for count in range(1, 7):
+        freezer.tick(timedelta(seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert len(started) == count
+    # the cancelled lookup is skipped, which empties the queue
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert started == ["playing", "gone", "buffering", "paused", "idle", "off"]
+
+
+async def test_warm_up_stopped(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Stopping drops the lookups still queued."""
+    queue = WarmUpQueue(hass, interval=1)
+    started = []
+    queue.async_add(State("media_player.a", "playing"), lambda: started.append("a"))
+    queue.async_stop()
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert started == []